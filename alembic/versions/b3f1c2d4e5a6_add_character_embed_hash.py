@@ -0,0 +1,30 @@
+"""add_character_embed_hash
+
+Revision ID: b3f1c2d4e5a6
+Revises: a225a52069c3
+Create Date: 2026-10-19 09:12:41.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f1c2d4e5a6"
+down_revision: Union[str, Sequence[str], None] = "a225a52069c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "characters", sa.Column("embed_hash", sa.String(length=64), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("characters", "embed_hash")
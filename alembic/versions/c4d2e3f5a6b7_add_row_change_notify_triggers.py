@@ -0,0 +1,63 @@
+"""add_row_change_notify_triggers
+
+Revision ID: c4d2e3f5a6b7
+Revises: b3f1c2d4e5a6
+Create Date: 2026-10-19 14:03:27.552910
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d2e3f5a6b7"
+down_revision: Union[str, Sequence[str], None] = "b3f1c2d4e5a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match services.change_listener.CHANGE_CHANNEL
+CHANNEL = "azeroth_changes"
+TABLES = ("characters", "guild_bank_items", "talents")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Payload stays tiny (table, op, id) to respect NOTIFY's 8000-byte limit
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION notify_row_change() RETURNS trigger AS $$
+        DECLARE
+            row_id text;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                row_id := OLD.id::text;
+            ELSE
+                row_id := NEW.id::text;
+            END IF;
+            PERFORM pg_notify(
+                '{CHANNEL}',
+                json_build_object(
+                    'table', TG_TABLE_NAME, 'op', TG_OP, 'id', row_id
+                )::text
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    for table in TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_notify_change
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION notify_row_change();
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_notify_change ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS notify_row_change();")
@@ -0,0 +1,50 @@
+"""add_registration_drafts
+
+Revision ID: d5e6f7a8b9c1
+Revises: c4d2e3f5a6b7
+Create Date: 2026-10-19 15:41:09.207316
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e6f7a8b9c1"
+down_revision: Union[str, Sequence[str], None] = "c4d2e3f5a6b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "registration_drafts",
+        sa.Column("discord_user_id", sa.BigInteger(), nullable=False),
+        sa.Column("step", sa.String(length=32), nullable=False),
+        sa.Column("data", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("discord_user_id"),
+    )
+    op.create_index(
+        op.f("ix_registration_drafts_updated_at"),
+        "registration_drafts",
+        ["updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_registration_drafts_updated_at"), table_name="registration_drafts"
+    )
+    op.drop_table("registration_drafts")
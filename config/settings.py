@@ -18,6 +18,8 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = Field(..., description="PostgreSQL Connection String")
+    # LISTEN for row-change NOTIFYs to keep in-process caches coherent
+    DB_CHANGE_LISTENER_ENABLED: bool = True
 
     # Supabase (Optional for now, but good to have)
     SUPABASE_URL: Optional[str] = None
@@ -32,6 +34,7 @@ class Settings(BaseSettings):
 
     # Forum Tag IDs (required for forum channels that mandate tags)
     RECRUITMENT_DEFAULT_TAG_ID: Optional[int] = None
+    RECRUITMENT_APPROVED_TAG_ID: Optional[int] = None
     CEMETERY_DEFAULT_TAG_ID: Optional[int] = None
 
     # Guild Member Role IDs
@@ -50,6 +53,7 @@ class Settings(BaseSettings):
 
     # Bot Behavior
     INTERACTIVE_TIMEOUT_SECONDS: int = 1800
+    REGISTRATION_DRAFT_TTL_HOURS: int = 72  # Unfinished registrations kept this long
     POLL_INTERVAL_SECONDS: int = 60
 
     # Visuals
@@ -63,11 +67,13 @@ class Settings(BaseSettings):
     R2_SECRET_ACCESS_KEY: Optional[str] = None
     R2_BUCKET_NAME: str = "azeroth-bound-images"
     R2_PUBLIC_URL: Optional[str] = None
+    IMAGE_PROCESSING_WORKERS: int = 2  # Processes for portrait WebP variants
 
     # MCP Server Integration (Optional)
     MCP_SERVER_URL: Optional[str] = None
     MCP_API_KEY: Optional[str] = None
     MCP_PORT: int = 8081
+    MCP_BATCH_WINDOW_MS: int = 0  # >0 coalesces workflow POSTs into /webhooks/batch
 
     # Computed properties
     GUILD_MEMBER_ROLE_IDS: List[int] = []
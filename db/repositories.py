@@ -1,13 +1,22 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import func, select, delete, insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import RowMapping
 from schemas import db_schemas
 from models import pydantic_models
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 
 class CharacterRepository:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, autocommit: bool = True):
         self.db = db
+        # When False, writes join the caller's transaction (see UnitOfWork)
+        self.autocommit = autocommit
+
+    async def _commit(self):
+        if self.autocommit:
+            await self.db.commit()
 
     async def create_character(
         self, character: pydantic_models.CharacterCreate
@@ -17,10 +26,17 @@ class CharacterRepository:
             data["roles"] = [
                 r.value if hasattr(r, "value") else str(r) for r in data["roles"]
             ]
-        db_character = db_schemas.Character(**data)
-        self.db.add(db_character)
-        await self.db.commit()
-        await self.db.refresh(db_character)
+        # Precomputed payloads are optional; let column defaults apply when absent
+        for key in ("embed_json", "embed_hash", "talents_json"):
+            if data.get(key) is None:
+                data.pop(key, None)
+        # INSERT ... RETURNING hands back server defaults (id, timestamps) in the
+        # same round trip; sessions use expire_on_commit=False, so no refresh
+        result = await self.db.scalars(
+            insert(db_schemas.Character).returning(db_schemas.Character), [data]
+        )
+        db_character = result.one()
+        await self._commit()
         return db_character
 
     async def get_character_by_id(
@@ -57,6 +73,22 @@ class CharacterRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_pending_recruitment_refs(
+        self,
+    ) -> List[Tuple[int, int, Optional[int]]]:
+        """(id, recruitment_msg_id, forum_post_id) for every pending application."""
+        result = await self.db.execute(
+            select(
+                db_schemas.Character.id,
+                db_schemas.Character.recruitment_msg_id,
+                db_schemas.Character.forum_post_id,
+            ).filter(
+                db_schemas.Character.status == db_schemas.CharacterStatusEnum.PENDING,
+                db_schemas.Character.recruitment_msg_id.isnot(None),
+            )
+        )
+        return [tuple(row) for row in result.all()]
+
     async def get_all_characters(
         self, skip: int = 0, limit: int = 100
     ) -> List[db_schemas.Character]:
@@ -65,45 +97,85 @@ class CharacterRepository:
         )
         return result.scalars().all()
 
+    async def get_all_character_rows(
+        self, skip: int = 0, limit: int = 100
+    ) -> Sequence[RowMapping]:
+        """Plain column mappings, skipping ORM instance construction."""
+        result = await self.db.execute(
+            select(db_schemas.Character.__table__).offset(skip).limit(limit)
+        )
+        return result.mappings().all()
+
     async def update_character(
         self, character_id: int, character: pydantic_models.CharacterUpdate
     ) -> Optional[db_schemas.Character]:
-        db_character = await self.get_character_by_id(character_id)
-        if not db_character:
-            return None
-
         update_data = character.model_dump(exclude_unset=True, by_alias=False)
+        if not update_data:
+            return await self.get_character_by_id(character_id)
         if "roles" in update_data and update_data["roles"]:
             update_data["roles"] = [
                 r.value if hasattr(r, "value") else str(r) for r in update_data["roles"]
             ]
 
-        for key, value in update_data.items():
-            setattr(db_character, key, value)
+        # UPDATE ... RETURNING: no SELECT beforehand, no refresh afterwards
+        result = await self.db.execute(
+            update(db_schemas.Character)
+            .where(db_schemas.Character.id == character_id)
+            .values(**update_data)
+            .returning(db_schemas.Character)
+            .execution_options(populate_existing=True)
+        )
+        db_character = result.scalar_one_or_none()
+        await self._commit()
+        return db_character
 
-        await self.db.commit()
-        await self.db.refresh(db_character)
+    async def approve_character(
+        self, character_id: int, reviewer_id: int
+    ) -> Optional[db_schemas.Character]:
+        """Mark a pending character REGISTERED in a single UPDATE ... RETURNING."""
+        result = await self.db.execute(
+            update(db_schemas.Character)
+            .where(
+                db_schemas.Character.id == character_id,
+                db_schemas.Character.status == db_schemas.CharacterStatusEnum.PENDING,
+            )
+            .values(
+                status=db_schemas.CharacterStatusEnum.REGISTERED,
+                reviewed_by_user_id=reviewer_id,
+            )
+            .returning(db_schemas.Character)
+            .execution_options(populate_existing=True)
+        )
+        db_character = result.scalar_one_or_none()
+        await self._commit()
         return db_character
 
     async def delete_character(self, character_id: int) -> bool:
         result = await self.db.execute(
             delete(db_schemas.Character).where(db_schemas.Character.id == character_id)
         )
-        await self.db.commit()
+        await self._commit()
         return result.rowcount > 0
 
 
 class GraveyardRepository:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, autocommit: bool = True):
         self.db = db
+        self.autocommit = autocommit
+
+    async def _commit(self):
+        if self.autocommit:
+            await self.db.commit()
 
     async def create_graveyard_entry(
         self, entry: pydantic_models.GraveyardCreate
     ) -> db_schemas.Graveyard:
-        db_entry = db_schemas.Graveyard(**entry.model_dump())
-        self.db.add(db_entry)
-        await self.db.commit()
-        await self.db.refresh(db_entry)
+        result = await self.db.scalars(
+            insert(db_schemas.Graveyard).returning(db_schemas.Graveyard),
+            [entry.model_dump(exclude_none=True)],
+        )
+        db_entry = result.one()
+        await self._commit()
         return db_entry
 
     async def get_graveyard_entry_by_id(
@@ -136,5 +208,158 @@ class GraveyardRepository:
         result = await self.db.execute(
             delete(db_schemas.Graveyard).where(db_schemas.Graveyard.id == entry_id)
         )
+        await self._commit()
+        return result.rowcount > 0
+
+
+class RegistrationDraftRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def upsert_draft(
+        self, discord_user_id: int, step: str, data: Dict[str, Any]
+    ) -> None:
+        """One INSERT ... ON CONFLICT DO UPDATE; nothing is read back."""
+        stmt = pg_insert(db_schemas.RegistrationDraft).values(
+            discord_user_id=discord_user_id, step=step, data=data
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[db_schemas.RegistrationDraft.discord_user_id],
+            # onupdate defaults don't apply to ON CONFLICT, so bump updated_at here
+            set_={
+                "step": stmt.excluded.step,
+                "data": stmt.excluded.data,
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
+
+    async def get_draft(
+        self, discord_user_id: int
+    ) -> Optional[db_schemas.RegistrationDraft]:
+        return await self.db.get(db_schemas.RegistrationDraft, discord_user_id)
+
+    async def delete_draft(self, discord_user_id: int) -> bool:
+        result = await self.db.execute(
+            delete(db_schemas.RegistrationDraft).where(
+                db_schemas.RegistrationDraft.discord_user_id == discord_user_id
+            )
+        )
         await self.db.commit()
         return result.rowcount > 0
+
+    async def delete_drafts_older_than(self, cutoff: datetime) -> int:
+        result = await self.db.execute(
+            delete(db_schemas.RegistrationDraft).where(
+                db_schemas.RegistrationDraft.updated_at < cutoff
+            )
+        )
+        await self.db.commit()
+        return result.rowcount
+
+
+class ImageRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_image_by_hash(self, hash_md5: str) -> Optional[db_schemas.Image]:
+        result = await self.db.execute(
+            select(db_schemas.Image).where(db_schemas.Image.hash_md5 == hash_md5)
+        )
+        return result.scalar_one_or_none()
+
+    async def create_image(
+        self, image: pydantic_models.ImageCreate
+    ) -> Optional[db_schemas.Image]:
+        """Insert an image; returns None if its hash is already recorded."""
+        stmt = (
+            pg_insert(db_schemas.Image)
+            .values(**image.model_dump(exclude_none=True))
+            .on_conflict_do_nothing(index_elements=[db_schemas.Image.hash_md5])
+            .returning(db_schemas.Image)
+        )
+        result = await self.db.scalars(stmt)
+        db_image = result.one_or_none()
+        await self.db.commit()
+        return db_image
+
+
+class MCPOutboxRepository:
+    def __init__(self, db: AsyncSession, autocommit: bool = True):
+        self.db = db
+        # When False, the entry commits with the caller's change (see UnitOfWork)
+        self.autocommit = autocommit
+
+    async def _commit(self):
+        if self.autocommit:
+            await self.db.commit()
+
+    async def enqueue(
+        self, endpoint: str, payload: Dict[str, Any]
+    ) -> db_schemas.MCPOutboxEntry:
+        result = await self.db.scalars(
+            insert(db_schemas.MCPOutboxEntry).returning(db_schemas.MCPOutboxEntry),
+            [{"endpoint": endpoint, "payload": payload}],
+        )
+        entry = result.one()
+        await self._commit()
+        return entry
+
+    async def claim_batch(
+        self, limit: int, lease_seconds: float
+    ) -> List[db_schemas.MCPOutboxEntry]:
+        """
+        Lease up to `limit` due entries in one UPDATE ... RETURNING.
+
+        SKIP LOCKED lets several dispatchers run side by side; a claimed entry
+        becomes due again when its lease expires, so a crashed dispatcher's
+        work is retried (at-least-once).
+        """
+        due = (
+            select(db_schemas.MCPOutboxEntry.id)
+            .where(db_schemas.MCPOutboxEntry.available_at <= func.now())
+            .order_by(db_schemas.MCPOutboxEntry.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(
+            update(db_schemas.MCPOutboxEntry)
+            .where(db_schemas.MCPOutboxEntry.id.in_(due))
+            .values(
+                attempts=db_schemas.MCPOutboxEntry.attempts + 1,
+                available_at=func.now() + timedelta(seconds=lease_seconds),
+            )
+            .returning(db_schemas.MCPOutboxEntry)
+            .execution_options(populate_existing=True)
+        )
+        entries = sorted(result.scalars().all(), key=lambda entry: entry.id)
+        await self._commit()
+        return entries
+
+    async def delete_entries(self, entry_ids: Sequence[int]) -> int:
+        if not entry_ids:
+            return 0
+        result = await self.db.execute(
+            delete(db_schemas.MCPOutboxEntry).where(
+                db_schemas.MCPOutboxEntry.id.in_(entry_ids)
+            )
+        )
+        await self._commit()
+        return result.rowcount
+
+    async def reschedule(self, entry_id: int, delay_seconds: float, error: str) -> None:
+        await self.db.execute(
+            update(db_schemas.MCPOutboxEntry)
+            .where(db_schemas.MCPOutboxEntry.id == entry_id)
+            .values(
+                available_at=func.now() + timedelta(seconds=delay_seconds),
+                last_error=error[:2000],
+            )
+        )
+        await self._commit()
+
+    async def count_pending(self) -> int:
+        return await self.db.scalar(
+            select(func.count()).select_from(db_schemas.MCPOutboxEntry)
+        )
@@ -0,0 +1,81 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Domain Events
+Minimal in-process publish/subscribe for things that happened to characters
+and for row changes relayed from Postgres.
+Handlers may be plain functions or coroutines; a failing handler is logged
+and never breaks the write that published the event.
+"""
+
+import inspect
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Type
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CharacterApproved:
+    """An officer approved a pending character application."""
+
+    character_id: int
+    reviewer_id: int
+    name: str
+    discord_user_id: int
+
+
+@dataclass(frozen=True)
+class RowChanged:
+    """A row changed in the database, possibly in another process (LISTEN/NOTIFY)."""
+
+    table: str
+    op: str  # INSERT / UPDATE / DELETE
+    row_id: str
+
+
+EventHandler = Callable[[Any], Any]
+
+_subscribers: Dict[Type, List[EventHandler]] = {}
+
+
+def subscribe(event_type: Type, handler: EventHandler) -> None:
+    """Register a handler for an event type."""
+    _subscribers.setdefault(event_type, []).append(handler)
+
+
+def unsubscribe(event_type: Type, handler: EventHandler) -> None:
+    """Remove a previously registered handler (no-op if unknown)."""
+    handlers = _subscribers.get(event_type, [])
+    if handler in handlers:
+        handlers.remove(handler)
+
+
+async def publish(event: Any) -> None:
+    """Deliver an event to every subscriber of its type, in registration order."""
+    for handler in list(_subscribers.get(type(event), [])):
+        try:
+            result = handler(event)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(
+                f"Event handler {getattr(handler, '__name__', handler)} failed "
+                f"for {type(event).__name__}: {e}",
+                exc_info=True,
+            )
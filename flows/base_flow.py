@@ -21,6 +21,7 @@ Common logic for multi-step interactive commands.
 
 import discord
 from config.settings import get_settings
+from services.message_dispatcher import MessageDispatcher
 
 
 class InteractiveFlow:
@@ -55,18 +56,29 @@ class InteractiveFlow:
             self.message = await self.interaction.followup.send(**kwargs, wait=True)
         return self.message
 
-    async def wait_for_message(self, timeout=None):
-        """Wait for a text message from the user."""
+    async def wait_for_message(self, timeout=None, check=None, channel_id=None):
+        """
+        Wait for a text message from the user.
+        Routed through the bot's MessageDispatcher when installed, falling
+        back to a bot.wait_for predicate otherwise.
+        """
+        channel_id = channel_id or self.interaction.channel_id
+        timeout = timeout or self.timeout
 
-        def check(m):
+        dispatcher = getattr(self.bot, "message_dispatcher", None)
+        if isinstance(dispatcher, MessageDispatcher):
+            return await dispatcher.wait_for_message(
+                channel_id, self.user.id, timeout=timeout, check=check
+            )
+
+        def predicate(m):
             return (
                 m.author.id == self.user.id
-                and m.channel.id == self.interaction.channel_id
+                and m.channel.id == channel_id
+                and (check is None or check(m))
             )
 
-        return await self.bot.wait_for(
-            "message", check=check, timeout=timeout or self.timeout
-        )
+        return await self.bot.wait_for("message", check=predicate, timeout=timeout)
 
     async def wait_for_component(self, component_type=None, timeout=None):
         """Wait for a component interaction (button/select)."""
@@ -5,10 +5,11 @@ import discord
 from discord.ui import View, Button, Modal, TextInput
 from flows.base_flow import InteractiveFlow
 from services.character_service import CharacterService
+from services.unit_of_work import UnitOfWork
 from services.webhook_handler import handle_initiate_burial
 from schemas.db_schemas import CharacterStatusEnum
 from db.database import get_engine_and_session_maker
-from models.pydantic_models import CharacterUpdate
+from models.pydantic_models import CharacterUpdate, GraveyardCreate
 
 logger = logging.getLogger(__name__)
 
@@ -243,51 +244,52 @@ class BurialFlow(InteractiveFlow):
             char_model = self.data["character_model"]
 
             _, session_maker = get_engine_and_session_maker()
-            async with session_maker() as session:
-                service = CharacterService(session)
-
-                # 1. Create Graveyard Entry
-                # Note: bury_character method in service handles creating graveyard entry
-                await service.bury_character(
-                    character_id=char_model.id,
-                    cause_of_death=self.data["death_cause"],
-                    eulogy=self.data["death_story"],
-                )
-
-                # 2. Update Character Status
+            # Status change and graveyard entry land in one transaction
+            async with UnitOfWork(session_maker) as uow:
+                # 1. Update Character Status (also confirms the row still exists)
                 update_data = CharacterUpdate(
                     status=CharacterStatusEnum.DECEASED,
                     death_cause=self.data["death_cause"],
                     death_story=self.data["death_story"],
                 )
-                updated_char = await service.update_character(
+                updated_char = await uow.characters.update_character(
                     char_model.id, update_data
                 )
 
+                # 2. Create Graveyard Entry
                 if updated_char:
-                    # 3. Trigger Discord Notification via Handler
-                    # We pass a dict representation
-                    char_dict = updated_char.model_dump()
-                    # Add extra fields needed by handler
-                    char_dict["char_name"] = updated_char.name
+                    await uow.graveyard.create_graveyard_entry(
+                        GraveyardCreate(
+                            character_id=char_model.id,
+                            cause_of_death=self.data["death_cause"],
+                            eulogy=self.data["death_story"],
+                        )
+                    )
 
-                    # Handler expects forum_post_url to extract thread_id
-                    # Handler logic: `thread_id = int(url.split("/")[-1])`. So passing "dummy/123" works.
-                    char_dict["forum_post_url"] = f"dummy/{updated_char.forum_post_id}"
+            if updated_char:
+                # 3. Trigger Discord Notification via Handler
+                # We pass a dict representation
+                char_dict = updated_char.model_dump()
+                # Add extra fields needed by handler
+                char_dict["char_name"] = updated_char.name
 
-                    # Ensure discord_user_id is included for DM notification
-                    char_dict["discord_user_id"] = updated_char.discord_user_id
+                # Handler expects forum_post_url to extract thread_id
+                # Handler logic: `thread_id = int(url.split("/")[-1])`. So passing "dummy/123" works.
+                char_dict["forum_post_url"] = f"dummy/{updated_char.forum_post_id}"
 
-                    logger.info(
-                        f"Initiating burial for {updated_char.name}, forum_post_id={updated_char.forum_post_id}, embed_json present: {bool(updated_char.embed_json)}"
-                    )
+                # Ensure discord_user_id is included for DM notification
+                char_dict["discord_user_id"] = updated_char.discord_user_id
+
+                logger.info(
+                    f"Initiating burial for {updated_char.name}, forum_post_id={updated_char.forum_post_id}, embed_json present: {bool(updated_char.embed_json)}"
+                )
 
-                    # Pass the bot instance from the interaction client
-                    await handle_initiate_burial(char_dict, self.interaction.client)
+                # Pass the bot instance from the interaction client
+                await handle_initiate_burial(char_dict, self.interaction.client)
 
-                    await self.interaction.followup.send("⚰️ **THE RITE IS COMPLETE.**")
-                else:
-                    await self.interaction.followup.send("❌ Database update failed.")
+                await self.interaction.followup.send("⚰️ **THE RITE IS COMPLETE.**")
+            else:
+                await self.interaction.followup.send("❌ Database update failed.")
 
         except Exception as e:
             logger.error(f"Burial execution error: {e}")
@@ -2,13 +2,21 @@
 import logging
 import asyncio
 import discord
+from typing import List, Optional
 from discord.ui import View, Button, Select, Modal, TextInput
 from flows.base_flow import InteractiveFlow
 from models.pydantic_models import CharacterCreate
 from schemas.db_schemas import CharacterRaceEnum, CharacterClassEnum, CharacterRoleEnum
-from services.character_service import CharacterService
+from services.image_storage import get_image_storage
+from services.mcp_outbox import get_outbox_dispatcher
+from services.unit_of_work import UnitOfWork
+from services.registration_drafts import get_draft_store
 from services.webhook_handler import handle_post_to_recruitment
-from utils.embed_parser import build_character_embeds
+from utils.embed_parser import (
+    build_character_embeds,
+    compute_embed_hash,
+    render_character_embed_dicts,
+)
 from config.settings import get_settings
 from db.database import get_engine_and_session_maker
 from domain.validators import VALID_RACES, VALID_ROLES, VALID_PROFESSIONS
@@ -17,6 +25,24 @@ from domain.game_data import CLASS_DATA
 logger = logging.getLogger(__name__)
 
 
+# Answers persisted in registration drafts (all plain JSON values)
+DRAFT_FIELDS = (
+    "char_name",
+    "race",
+    "class",
+    "roles",
+    "professions",
+    "trait_1",
+    "trait_2",
+    "trait_3",
+    "backstory",
+    "personality",
+    "quotes",
+    "portrait_url",
+    "request_sdxl",
+)
+
+
 class FlowCancelled(Exception):
     """Exception raised when user cancels the flow."""
 
@@ -45,6 +71,11 @@ class RegistrationFlow(InteractiveFlow):
     Handles the interactive character registration process.
     """
 
+    def __init__(self, interaction: discord.Interaction):
+        super().__init__(interaction)
+        # Background R2 upload of an attached portrait (see step_portrait)
+        self._portrait_upload: Optional[asyncio.Task] = None
+
     def _create_cancel_callback(self, view: View):
         """Helper to create a cancel callback that raises FlowCancelled."""
 
@@ -67,47 +98,30 @@ class RegistrationFlow(InteractiveFlow):
             if not self.data.get("consent"):
                 return  # User cancelled
 
-            # Step 2: Name
-            await self.step_name()
-
-            # Step 3: Race
-            await self.step_race()
-
-            # Step 4: Class
-            await self.step_class()
-
-            # Step 5: Roles
-            await self.step_roles()
-
-            # Step 6: Professions
-            await self.step_professions()
-
-            # Step 7: Traits
-            await self.step_traits()
-
-            # Step 8: Backstory
-            await self.step_backstory()
-
-            # Step 9: Personality
-            await self.step_personality()
-
-            # Step 10: Quotes
-            await self.step_quotes()
+            # Offer to continue an unfinished registration
+            completed = await self.step_resume()
 
-            # Step 11: Portrait
-            await self.step_portrait()
+            # Steps 2-11, each saved to the user's draft once answered
+            for draft_step, step in self._draft_steps():
+                if draft_step in completed:
+                    continue
+                await step()
+                completed.append(draft_step)
+                self._save_draft(draft_step, completed)
 
             # Step 12: Preview & Confirmation
             await self.step_preview()
 
             # Finalize if confirmed
             if self.data.get("confirmed"):
+                await self.resolve_portrait_upload()
                 await self.finalize()
 
         except FlowCancelled:
             logger.info(
                 f"Registration flow cancelled by user {self.interaction.user.name}"
             )
+            await get_draft_store().discard(self.user.id)
             # User already received cancellation message, no need to send another
             return
         except asyncio.TimeoutError:
@@ -118,6 +132,106 @@ class RegistrationFlow(InteractiveFlow):
                 "⚠️ An error occurred during registration. The Chroniclers are confused.",
                 ephemeral=True,
             )
+        finally:
+            # Abandoned registrations don't need their portrait anymore
+            if self._portrait_upload is not None:
+                self._portrait_upload.cancel()
+
+    def start_portrait_upload(self, attachment: discord.Attachment) -> None:
+        """Copy the attachment to R2 while the user carries on with the wizard."""
+        metadata = {
+            "context": "portraits",
+            "user_id": self.user.id,
+            "entity_type": "character",
+        }
+        self._portrait_upload = asyncio.create_task(
+            get_image_storage().upload_attachment_with_fallback(attachment, metadata)
+        )
+
+    async def resolve_portrait_upload(self):
+        """Wait for the background upload and swap in its permanent URL."""
+        task, self._portrait_upload = self._portrait_upload, None
+        if task is None:
+            return
+        portrait_url = await task
+        self.data["portrait_url"] = portrait_url
+        char_create = self.data.get("valid_model")
+        if char_create is not None and char_create.portrait_url != portrait_url:
+            self.data["valid_model"] = char_create.model_copy(
+                update={"portrait_url": portrait_url}
+            )
+            # The previewed hash covered the temporary CDN link
+            self.data["embed_hash"] = None
+
+    def _draft_steps(self):
+        """Steps 2-11 in order, keyed by the name recorded in the draft."""
+        return [
+            ("name", self.step_name),  # Step 2
+            ("race", self.step_race),  # Step 3
+            ("class", self.step_class),  # Step 4
+            ("roles", self.step_roles),  # Step 5
+            ("professions", self.step_professions),  # Step 6
+            ("traits", self.step_traits),  # Step 7
+            ("backstory", self.step_backstory),  # Step 8
+            ("personality", self.step_personality),  # Step 9
+            ("quotes", self.step_quotes),  # Step 10
+            ("portrait", self.step_portrait),  # Step 11
+        ]
+
+    def _save_draft(self, step: str, completed: List[str]):
+        """Queue a (debounced) upsert of every answer collected so far."""
+        answers = {k: self.data[k] for k in DRAFT_FIELDS if k in self.data}
+        if self._portrait_upload is not None:
+            # portrait_url is still the expiring CDN link and the upload task
+            # does not survive a restart, so a resumed draft asks again
+            answers.pop("portrait_url", None)
+            completed = [s for s in completed if s != "portrait"]
+        get_draft_store().save(
+            self.user.id, step, {"completed": list(completed), "answers": answers}
+        )
+
+    async def step_resume(self) -> List[str]:
+        """Restore a saved draft if the user wants to; returns completed steps."""
+        draft = await get_draft_store().load(self.user.id)
+        if draft is None:
+            return []
+
+        completed = list(draft.data.get("completed", []))
+        choice = {"resume": False}
+        view = View()
+        resume_btn = Button(
+            label="Continue where I left off",
+            style=discord.ButtonStyle.green,
+            emoji="📖",
+        )
+        restart_btn = Button(label="Start over", style=discord.ButtonStyle.secondary)
+
+        async def resume_callback(interaction):
+            choice["resume"] = True
+            await interaction.response.defer()
+            view.stop()
+
+        async def restart_callback(interaction):
+            await interaction.response.defer()
+            view.stop()
+
+        resume_btn.callback = resume_callback
+        restart_btn.callback = restart_callback
+        view.add_item(resume_btn)
+        view.add_item(restart_btn)
+        await self.interaction.followup.send(
+            f"📜 I found your unfinished chronicle ({len(completed)} of "
+            f"{len(self._draft_steps())} chapters written). Shall we continue?",
+            view=view,
+            ephemeral=True,
+        )
+        await view.wait()
+
+        if not choice["resume"]:
+            await get_draft_store().discard(self.user.id)
+            return []
+        self.data.update(draft.data.get("answers", {}))
+        return completed
 
     # ... [Steps 1-11 remain largely the same, but we ensure data format matches Enums] ...
 
@@ -482,16 +596,9 @@ class RegistrationFlow(InteractiveFlow):
             )
 
             try:
-
-                def check(m):
-                    return (
-                        m.author.id == self.user.id
-                        and m.channel.id == interaction.channel_id
-                        and m.attachments
-                    )
-
-                msg = await self.bot.wait_for(
-                    "message", check=check, timeout=self.timeout
+                msg = await self.wait_for_message(
+                    channel_id=interaction.channel_id,
+                    check=lambda m: bool(m.attachments),
                 )
 
                 if msg.attachments:
@@ -499,11 +606,14 @@ class RegistrationFlow(InteractiveFlow):
                     if attachment.content_type and attachment.content_type.startswith(
                         "image/"
                     ):
-                        # TODO: Replace with a call to the external MCP server client
+                        # The CDN link expires; it is swapped for the R2 URL
+                        # before finalize, while the preview uses it meanwhile
                         self.data["portrait_url"] = attachment.url
                         self.data["request_sdxl"] = False
+                        self.start_portrait_upload(attachment)
                         await interaction.followup.send(
-                            "✅ Image URL captured! It will be processed later.",
+                            "✅ Portrait received! It will be stored while you "
+                            "review your chronicle.",
                             ephemeral=True,
                         )
                     else:
@@ -610,7 +720,7 @@ class RegistrationFlow(InteractiveFlow):
                 trait_1=self.data["trait_1"],
                 trait_2=self.data["trait_2"],
                 trait_3=self.data["trait_3"],
-                request_sdxl=False,
+                request_sdxl=self.data.get("request_sdxl", False),
             )
             self.data["valid_model"] = char_create
 
@@ -618,6 +728,7 @@ class RegistrationFlow(InteractiveFlow):
             # For now, we can rely on attributes matching
             embeds = build_character_embeds(char_create)
             self.data["preview_embeds"] = embeds
+            self.data["embed_hash"] = compute_embed_hash(char_create)
 
             view = View()
             confirm = Button(label="Submit", style=discord.ButtonStyle.green)
@@ -654,12 +765,14 @@ class RegistrationFlow(InteractiveFlow):
         """Finalize registration using SQL Service."""
         try:
             char_create = self.data["valid_model"]
-            embed_json = [e.to_dict() for e in self.data["preview_embeds"]]
+            embed_hash = self.data.get("embed_hash") or compute_embed_hash(char_create)
+            # Served from the render cache populated by the preview step
+            embed_json = render_character_embed_dicts(char_create, embed_hash)
             settings = get_settings()
 
             _, session_maker = get_engine_and_session_maker()
-            async with session_maker() as session:
-                service = CharacterService(session)
+            async with UnitOfWork(session_maker) as uow:
+                service = uow.characters
 
                 # Check if character with this name already exists
                 existing_char = await service.get_character_by_name(char_create.name)
@@ -690,13 +803,19 @@ class RegistrationFlow(InteractiveFlow):
                             trait_1=char_create.trait_1,
                             trait_2=char_create.trait_2,
                             trait_3=char_create.trait_3,
-                            embed_json=embed_json,
+                            request_sdxl=char_create.request_sdxl,
                         )
+                        # Only rewrite the stored sheet if its content actually changed
+                        if existing_char.embed_hash != embed_hash:
+                            update_data.embed_json = embed_json
+                            update_data.embed_hash = embed_hash
 
                         created_char = await service.update_character(
                             existing_char.id, update_data
                         )
-                        await session.commit()
+                        await self._queue_mcp_workflows(uow, created_char)
+                        await uow.commit()
+                        get_outbox_dispatcher().wake()
 
                         # Update or create the recruitment message
                         if (
@@ -797,18 +916,16 @@ class RegistrationFlow(InteractiveFlow):
                         return
                 else:
                     # Create new character
-                    created_char = await service.create_character(char_create)
-
-                    # Update the embed_json
-                    from schemas.db_schemas import Character
-                    from sqlalchemy import update
-
-                    await session.execute(
-                        update(Character)
-                        .where(Character.id == created_char.id)
-                        .values(embed_json=embed_json)
+                    # Rendered sheet goes in with the row: one INSERT
+                    created_char = await service.create_character(
+                        char_create.model_copy(
+                            update={"embed_json": embed_json, "embed_hash": embed_hash}
+                        )
                     )
-                    await session.commit()
+                    await self._queue_mcp_workflows(uow, created_char)
+                    # Commit before posting: the recruitment handler reads the row
+                    await uow.commit()
+                    get_outbox_dispatcher().wake()
 
                     await self.interaction.followup.send(
                         "✨ **SUBMITTED!** Your character is being posted to recruitment.",
@@ -829,12 +946,22 @@ class RegistrationFlow(InteractiveFlow):
                         f"Returned from handle_post_to_recruitment for character: {created_char.name}"
                     )
 
+            # Submitted: the draft has served its purpose
+            await get_draft_store().discard(self.user.id)
+
         except Exception as e:
             logger.error(f"Finalization error: {e}", exc_info=True)
             await self.interaction.followup.send(
                 "❌ Critical error during submission.", ephemeral=True
             )
 
+    async def _queue_mcp_workflows(self, uow: UnitOfWork, character):
+        """Stage MCP requests in the character's transaction (sent by the outbox)."""
+        if character is None:  # update_character found no row
+            return
+        if character.request_sdxl and get_settings().MCP_API_KEY:
+            await uow.outbox.enqueue_portrait_generation(character)
+
     async def handle_timeout(self):
         if self.message:
             await self.message.reply("⏳ Timed out.")
@@ -24,13 +24,24 @@ MCP Server Repository: https://github.com/pkochanowicz/discord-guildmaster-mcp
 """
 
 import aiohttp
+import asyncio
 import logging
+import random
+import time
+from collections import deque
 from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool shared by every MCPWorkflowTrigger (one local server)
+CONNECTOR_LIMIT = 20
+CONNECTOR_KEEPALIVE_SECONDS = 30
+
+# Accepts several workflow requests in one POST (see MCPBatcher)
+BATCH_ENDPOINT = "/webhooks/batch"
+
 
 @dataclass
 class WorkflowResponse:
@@ -48,6 +59,12 @@ class MCPConnectionError(Exception):
     pass
 
 
+class MCPCircuitOpenError(MCPConnectionError):
+    """MCP server marked unhealthy; request rejected without being sent."""
+
+    pass
+
+
 class MCPAuthenticationError(Exception):
     """API key authentication failed."""
 
@@ -60,6 +77,238 @@ class MCPWorkflowError(Exception):
     pass
 
 
+class MCPServerError(MCPWorkflowError):
+    """MCP server answered with a 5xx status (retryable, trips the breaker)."""
+
+    pass
+
+
+class CircuitBreaker:
+    """
+    Fails fast after repeated MCP failures instead of waiting out timeouts.
+
+    closed -> open after `failure_threshold` consecutive failures; open ->
+    half_open once `reset_timeout` has passed, letting a single probe through;
+    the probe's outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_count = 0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def release_probe(self) -> None:
+        """Free the half-open probe slot when a probe ended without a verdict."""
+        self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        if self._state != self.CLOSED:
+            logger.info("MCP circuit closed: server is responding again")
+        self._state = self.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self._state != self.OPEN:
+                self.opened_count += 1
+                logger.warning(
+                    f"MCP circuit opened after {self.failures} failures; "
+                    f"failing fast for {self.reset_timeout:.0f}s"
+                )
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+
+@dataclass
+class MCPMetrics:
+    """Request counters and a rolling window of latencies (seconds)."""
+
+    requests: int = 0
+    failures: int = 0
+    retries: int = 0
+    short_circuited: int = 0
+    latencies: deque = field(default_factory=lambda: deque(maxlen=512))
+
+    def observe(self, seconds: float, ok: bool) -> None:
+        self.requests += 1
+        if not ok:
+            self.failures += 1
+        self.latencies.append(seconds)
+
+    def snapshot(self, breaker: CircuitBreaker) -> Dict[str, Any]:
+        ordered = sorted(self.latencies)
+
+        def percentile(q: float) -> Optional[float]:
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 4)
+
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "retries": self.retries,
+            "short_circuited": self.short_circuited,
+            "latency_p50": percentile(0.50),
+            "latency_p95": percentile(0.95),
+            "latency_max": round(ordered[-1], 4) if ordered else None,
+            "breaker_state": breaker.state,
+            "breaker_opened": breaker.opened_count,
+        }
+
+
+_shared_connector: Optional[aiohttp.TCPConnector] = None
+
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """Long-lived keep-alive pool reused by every client session."""
+    global _shared_connector
+    if _shared_connector is None or _shared_connector.closed:
+        _shared_connector = aiohttp.TCPConnector(
+            limit=CONNECTOR_LIMIT,
+            limit_per_host=CONNECTOR_LIMIT,
+            keepalive_timeout=CONNECTOR_KEEPALIVE_SECONDS,
+        )
+    return _shared_connector
+
+
+class MCPBatcher:
+    """
+    Coalesces workflow requests made within a short window into one POST.
+
+    Request body sent to BATCH_ENDPOINT:
+        {"requests": [{"id": 0, "endpoint": "/webhooks/...", "payload": {...}}]}
+    Expected response:
+        {"results": [{"id": 0, "status": 200, "body": {...}}]}
+
+    Each caller awaits its own item: a 2xx item resolves to its body, any
+    other status raises MCPWorkflowError (MCPServerError for 5xx) for that
+    caller only. A failure of the batch request itself fails every item.
+
+    Args:
+        client: Client used to send the combined request
+        window: Seconds to wait for more requests after the first one
+        max_batch: Flush immediately once this many requests are queued
+    """
+
+    def __init__(
+        self, client: "MCPWorkflowTrigger", window: float = 0.05, max_batch: int = 50
+    ):
+        self.client = client
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: list = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight: set = set()
+
+    async def submit(
+        self, endpoint: str, payload: Dict[str, Any], idempotent: bool = False
+    ) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((endpoint, payload, idempotent, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._send(batch))
+            # Keep a reference until done so the task isn't garbage collected
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, batch: list) -> None:
+        requests = [
+            {"id": i, "endpoint": endpoint, "payload": payload}
+            for i, (endpoint, payload, _, _) in enumerate(batch)
+        ]
+        try:
+            response = await self.client._make_request(
+                endpoint=BATCH_ENDPOINT,
+                payload={"requests": requests},
+                # Replaying is only safe if every item is
+                idempotent=all(item[2] for item in batch),
+            )
+        except asyncio.CancelledError:
+            self._fail(batch, MCPConnectionError("MCP batch request was cancelled"))
+            raise
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        try:
+            self._resolve(batch, response)
+        except Exception as e:
+            # Whatever was left unresolved would otherwise wait forever
+            logger.error(f"Malformed MCP batch response: {e!r}")
+            self._fail(batch, MCPWorkflowError(f"Malformed MCP batch response: {e}"))
+
+    @staticmethod
+    def _fail(batch: list, error: BaseException) -> None:
+        for *_, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    @staticmethod
+    def _resolve(batch: list, response: Dict[str, Any]) -> None:
+        results = {item.get("id"): item for item in response.get("results", [])}
+        for i, (endpoint, _, _, future) in enumerate(batch):
+            if future.done():  # Caller gave up (cancelled)
+                continue
+            item = results.get(i)
+            if item is None:
+                future.set_exception(
+                    MCPWorkflowError(f"MCP batch response has no result for {endpoint}")
+                )
+                continue
+            status = int(item.get("status", 200))
+            if status >= 400:
+                error_class = MCPServerError if status >= 500 else MCPWorkflowError
+                future.set_exception(
+                    error_class(
+                        f"MCP workflow failed (status {status}): {item.get('body')}"
+                    )
+                )
+            else:
+                future.set_result(item.get("body") or {})
+
+
 class MCPWorkflowTrigger:
     """
     Client for triggering workflows on the external MCP server.
@@ -76,6 +325,11 @@ class MCPWorkflowTrigger:
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
         timeout: int = 30,
+        connect_timeout: float = 5.0,
+        max_retries: int = 2,
+        retry_backoff: float = 0.25,
+        breaker: Optional[CircuitBreaker] = None,
+        batch_window: Optional[float] = None,
     ):
         """
         Initialize MCP client.
@@ -84,45 +338,127 @@ class MCPWorkflowTrigger:
             base_url: MCP server URL (default: from settings)
             api_key: API key for authentication (default: from settings)
             timeout: Request timeout in seconds
+            connect_timeout: Seconds to wait for a connection (down server)
+            max_retries: Extra attempts for idempotent requests
+            retry_backoff: Base delay for jittered exponential backoff
+            breaker: Circuit breaker (default: 5 failures, 30s cool-down)
+            batch_window: If set, POSTs made within this many seconds of each
+                other are sent together to BATCH_ENDPOINT
         """
         self.base_url = (base_url or f"http://localhost:{settings.MCP_PORT}").rstrip(
             "/"
         )
         self.api_key = api_key or settings.MCP_API_KEY
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.timeout = aiohttp.ClientTimeout(
+            total=timeout, connect=min(connect_timeout, timeout)
+        )
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.breaker = breaker or CircuitBreaker()
+        self.metrics = MCPMetrics()
         self.session: Optional[aiohttp.ClientSession] = None
+        self.batcher = (
+            MCPBatcher(self, window=batch_window) if batch_window is not None else None
+        )
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        # Sessions borrow the shared pool; closing one keeps the connections
+        return aiohttp.ClientSession(
+            timeout=self.timeout,
+            connector=get_shared_connector(),
+            connector_owner=False,
+        )
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(timeout=self.timeout)
+        self.session = self._create_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         if self.session:
             await self.session.close()
+            self.session = None
 
     async def _make_request(
-        self, endpoint: str, payload: Dict[str, Any], method: str = "POST"
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        method: str = "POST",
+        idempotent: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         Make authenticated request to MCP server.
 
+        Connection failures and 5xx answers count against the circuit
+        breaker; idempotent requests (GETs by default) are retried with
+        jittered exponential backoff while the circuit stays closed.
+
         Args:
             endpoint: API endpoint (e.g., "/webhooks/character-welcome")
             payload: Request payload
             method: HTTP method
+            idempotent: Whether retrying is safe (default: method == "GET")
 
         Returns:
             Response JSON
 
         Raises:
             MCPConnectionError: If connection fails
+            MCPCircuitOpenError: If the circuit is open (nothing was sent)
             MCPAuthenticationError: If API key is invalid
             MCPWorkflowError: If workflow execution fails
         """
+        if idempotent is None:
+            idempotent = method == "GET"
+        if self.batcher is not None and method == "POST" and endpoint != BATCH_ENDPOINT:
+            return await self.batcher.submit(endpoint, payload, idempotent)
+        attempts = 1 + (self.max_retries if idempotent else 0)
+
+        for attempt in range(attempts):
+            if not self.breaker.allow_request():
+                self.metrics.short_circuited += 1
+                raise MCPCircuitOpenError(
+                    f"MCP server circuit is open; skipping {endpoint}"
+                )
+
+            started = time.perf_counter()
+            try:
+                result = await self._send(endpoint, payload, method)
+            except (MCPConnectionError, MCPServerError):
+                self.metrics.observe(time.perf_counter() - started, ok=False)
+                self.breaker.record_failure()
+                if attempt + 1 >= attempts:
+                    raise
+                self.metrics.retries += 1
+                cap = self.retry_backoff * (2**attempt)
+                await asyncio.sleep(random.uniform(0, cap))  # nosec B311
+            except (MCPAuthenticationError, MCPWorkflowError):
+                # The server answered; the request itself was rejected
+                self.metrics.observe(time.perf_counter() - started, ok=False)
+                self.breaker.record_success()
+                raise
+            except Exception:
+                # e.g. an unparseable body: the round trip failed all the same
+                self.metrics.observe(time.perf_counter() - started, ok=False)
+                self.breaker.record_failure()
+                raise
+            except BaseException:
+                # Cancelled by the caller (or shutdown): says nothing about the
+                # server, but a half-open probe must not hold its slot forever
+                self.breaker.release_probe()
+                raise
+            else:
+                self.metrics.observe(time.perf_counter() - started, ok=True)
+                self.breaker.record_success()
+                return result
+
+    async def _send(
+        self, endpoint: str, payload: Dict[str, Any], method: str
+    ) -> Dict[str, Any]:
+        """Single HTTP round trip, mapping failures to MCP exceptions."""
         if not self.session:
-            self.session = aiohttp.ClientSession(timeout=self.timeout)
+            self.session = self._create_session()
 
         url = f"{self.base_url}{endpoint}"
         headers = {"Content-Type": "application/json", "X-API-Key": self.api_key}
@@ -141,15 +477,29 @@ class MCPWorkflowTrigger:
                 # Handle workflow errors
                 if resp.status >= 400:
                     error_text = await resp.text()
-                    raise MCPWorkflowError(
+                    error_class = (
+                        MCPServerError if resp.status >= 500 else MCPWorkflowError
+                    )
+                    raise error_class(
                         f"MCP workflow failed (status {resp.status}): {error_text}"
                     )
 
                 return await resp.json()
 
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise MCPConnectionError(f"Failed to connect to MCP server at {url}: {e}")
 
+    async def send_workflow(
+        self, endpoint: str, payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        POST a prepared workflow payload (used by the outbox dispatcher).
+
+        Unlike the trigger_* helpers this raises on failure, so the caller
+        can decide whether to retry.
+        """
+        return await self._make_request(endpoint=endpoint, payload=payload)
+
     async def trigger_character_welcome(
         self, member_id: str, guild_id: str, character_data: Dict[str, Any]
     ) -> WorkflowResponse:
@@ -293,6 +643,7 @@ class MCPWorkflowTrigger:
             result = await self._make_request(
                 endpoint="/webhooks/channel-summary",
                 payload={"channel_id": channel_id, "hours": hours, "format": format},
+                idempotent=True,  # Read-only: safe to retry
             )
 
             logger.info(
@@ -374,14 +725,19 @@ class MCPWorkflowTrigger:
             True if server responds, False otherwise
         """
         try:
+            # Report current health; retrying would only mask an outage
             result = await self._make_request(
-                endpoint="/health", payload={}, method="GET"
+                endpoint="/health", payload={}, method="GET", idempotent=False
             )
             return result.get("status") == "ok"
 
         except (MCPConnectionError, MCPAuthenticationError, MCPWorkflowError):
             return False
 
+    def get_metrics(self) -> Dict[str, Any]:
+        """Latency percentiles, failure counters and circuit breaker state."""
+        return self.metrics.snapshot(self.breaker)
+
 
 # Singleton instance for convenience
 _mcp_client: Optional[MCPWorkflowTrigger] = None
@@ -391,5 +747,19 @@ def get_mcp_client() -> MCPWorkflowTrigger:
     """Get or create global MCP client instance."""
     global _mcp_client
     if _mcp_client is None:
-        _mcp_client = MCPWorkflowTrigger()
+        window_ms = settings.MCP_BATCH_WINDOW_MS
+        _mcp_client = MCPWorkflowTrigger(
+            batch_window=window_ms / 1000 if window_ms > 0 else None
+        )
     return _mcp_client
+
+
+async def close_mcp_client() -> None:
+    """Close the global client's session and the shared connection pool."""
+    global _mcp_client, _shared_connector
+    if _mcp_client is not None and _mcp_client.session is not None:
+        await _mcp_client.session.close()
+        _mcp_client.session = None
+    if _shared_connector is not None:
+        await _shared_connector.close()
+        _shared_connector = None
@@ -37,6 +37,12 @@ try:
     from services.discord_client import bot
     from config.settings import get_settings
     from routers import characters, webhooks, health
+    from services.change_listener import get_change_listener
+    from services.registration_drafts import get_draft_store, run_draft_cleanup
+    from services.image_storage import close_image_storage
+    from services.image_processing import shutdown_image_processor
+    from integrations.mcp_client import close_mcp_client
+    from services.mcp_outbox import get_outbox_dispatcher
 except Exception as e:
     logger.critical(f"Failed to import dependencies: {e}", exc_info=True)
     raise
@@ -78,6 +84,17 @@ async def lifespan(app: FastAPI):
         logger.info("Initializing database...")
         await init_db()
 
+        # Cross-process cache invalidation (Postgres LISTEN/NOTIFY)
+        if get_settings().DB_CHANGE_LISTENER_ENABLED:
+            get_change_listener().start()
+
+        # Deliver queued MCP workflow requests in the background
+        if get_settings().MCP_API_KEY:
+            get_outbox_dispatcher().start()
+
+        # Purge abandoned registration drafts hourly
+        draft_cleanup = asyncio.create_task(run_draft_cleanup())
+
         # Start Discord bot task (fire-and-forget)
         logger.info("Initializing Discord bot task...")
         asyncio.create_task(start_discord_bot())
@@ -86,6 +103,14 @@ async def lifespan(app: FastAPI):
 
         # Shutdown event
         logger.info("Shutting down...")
+        await get_change_listener().stop()
+        draft_cleanup.cancel()
+        # Persist debounced draft writes before the process goes away
+        await get_draft_store().flush()
+        await get_outbox_dispatcher().stop()
+        await close_image_storage()
+        shutdown_image_processor()
+        await close_mcp_client()
     except Exception as e:
         logger.critical(f"Lifespan error: {e}", exc_info=True)
 
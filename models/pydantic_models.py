@@ -32,6 +32,10 @@ class CharacterBase(BaseModel):
 class CharacterCreate(CharacterBase):
     discord_user_id: int
     discord_username: str = Field(..., max_length=64)
+    # Precomputed payloads persisted in the initial INSERT (column defaults if None)
+    embed_json: Optional[List[Dict[str, Any]]] = None
+    embed_hash: Optional[str] = Field(None, max_length=64)
+    talents_json: Optional[Dict[str, Any]] = None
 
 
 class CharacterUpdate(BaseModel):
@@ -54,6 +58,8 @@ class CharacterUpdate(BaseModel):
     forum_post_id: Optional[int] = None
     death_cause: Optional[str] = None
     death_story: Optional[str] = None
+    embed_json: Optional[List[Dict[str, Any]]] = None
+    embed_hash: Optional[str] = Field(None, max_length=64)
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -73,6 +79,7 @@ class CharacterInDB(CharacterCreate):
     embed_json: Union[Dict[str, Any], List[Dict[str, Any]]] = Field(
         default_factory=list
     )
+    embed_hash: Optional[str] = None
     death_cause: Optional[str] = None
     death_story: Optional[str] = None
     talents_json: Dict[str, Any] = Field(default_factory=dict)
@@ -120,3 +127,39 @@ class GraveyardCreate(GraveyardBase):
 class GraveyardInDB(GraveyardBase):
     id: int
     created_at: datetime
+
+
+# --- Registration Draft Models ---
+
+
+class RegistrationDraftInDB(BaseModel):
+    discord_user_id: int
+    step: str
+    data: Dict[str, Any] = Field(default_factory=dict)
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# --- Image Models ---
+
+
+class ImageCreate(BaseModel):
+    img_origin_link: str
+    img_graphics_vault_link: str
+    original_filename: str = Field(..., max_length=256)
+    uploaded_by_user_id: Optional[int] = None
+    source_system: str = Field(..., max_length=64)
+    ownership_context: str = Field(..., max_length=64)
+    usage_context: str = Field(..., max_length=64)
+    entity_type: Optional[str] = Field(None, max_length=64)
+    entity_id: Optional[int] = None
+    is_animated: bool = False
+    hash_md5: Optional[str] = Field(None, max_length=32)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ImageInDB(ImageCreate):
+    id: int
+    created_at: datetime
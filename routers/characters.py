@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
 from db.database import get_db
 from models import pydantic_models
-from services.character_service import CharacterService
+from services.character_service import (
+    CharacterService,
+    get_cached_etag,
+    remember_etag,
+)
 
 router = APIRouter()
 
@@ -13,6 +17,24 @@ async def get_character_service(db: AsyncSession = Depends(get_db)) -> Character
     return CharacterService(db)
 
 
+def _etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """Weak comparison against an If-None-Match header (RFC 9110 13.1.2)."""
+    if not if_none_match or not etag:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == opaque for tag in candidates)
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
 @router.post(
     "/",
     response_model=pydantic_models.CharacterInDB,
@@ -31,32 +53,59 @@ async def get_all_characters(
     limit: int = 100,
     service: CharacterService = Depends(get_character_service),
 ):
-    return await service.get_all_characters(skip, limit)
+    # Serialized in the service; returning a Response skips a second validation pass
+    return Response(
+        content=await service.get_all_characters_json(skip, limit),
+        media_type="application/json",
+    )
 
 
 @router.get("/{character_id}", response_model=pydantic_models.CharacterInDB)
 async def get_character_by_id(
     character_id: int,  # Changed UUID to int
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     service: CharacterService = Depends(get_character_service),
 ):
+    # A known, unchanged character costs no query and no serialization
+    cached_etag = get_cached_etag(character_id=character_id)
+    if _etag_matches(if_none_match, cached_etag):
+        return _not_modified(cached_etag)
+
     character = await service.get_character_by_id(character_id)
     if character is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Character not found"
         )
+    etag = remember_etag(character)
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
     return character
 
 
 @router.get("/by-discord/{discord_id}", response_model=pydantic_models.CharacterInDB)
 async def get_character_by_discord_id(
     discord_id: int,  # Changed str to int
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     service: CharacterService = Depends(get_character_service),
 ):
+    cached_etag = get_cached_etag(discord_user_id=discord_id)
+    if _etag_matches(if_none_match, cached_etag):
+        return _not_modified(cached_etag)
+
     character = await service.get_character_by_discord_id(discord_id)
     if character is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Character not found"
         )
+    etag = remember_etag(character)
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
     return character
 
 
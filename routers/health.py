@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from integrations.mcp_client import CircuitBreaker, get_mcp_client
 
 router = APIRouter()
 
@@ -6,3 +7,13 @@ router = APIRouter()
 @router.get("/")
 async def health_check():
     return {"status": "ok", "message": "Chronicler API is running"}
+
+
+@router.get("/mcp")
+async def mcp_health():
+    """
+    Coarse MCP status: "degraded" while the circuit breaker is not closed.
+    Counters and latencies (get_metrics) stay internal; this route is public.
+    """
+    breaker = get_mcp_client().breaker
+    return {"status": "ok" if breaker.state == CircuitBreaker.CLOSED else "degraded"}
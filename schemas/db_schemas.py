@@ -154,6 +154,7 @@ class Character(Base):
     forum_post_id = Column(BigInteger, unique=True, nullable=True)
     reviewed_by_user_id = Column(BigInteger, nullable=True)
     embed_json = Column(JSONB, default={}, nullable=False)
+    embed_hash = Column(String(64), nullable=True)  # Hash of fields rendered into embed_json
     death_cause = Column(String(256), nullable=True)
     death_story = Column(Text, nullable=True)
     talents_json = Column(JSONB, default={}, nullable=True)
@@ -490,3 +491,46 @@ class GuildBankTransaction(Base):
     __table_args__ = (
         CheckConstraint("quantity > 0", name="transaction_quantity_positive"),
     )
+
+
+# --- Registration Drafts ---
+
+
+class RegistrationDraft(Base):
+    """In-progress /register_character answers, one row per user."""
+
+    __tablename__ = "registration_drafts"
+
+    discord_user_id = Column(BigInteger, primary_key=True)
+    step = Column(String(32), nullable=False)  # Last completed step
+    data = Column(JSONB, default={}, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        onupdate=func.now(),
+        server_default=func.now(),
+        nullable=False,
+        index=True,  # Expiry sweep
+    )
+
+
+# --- MCP Outbox ---
+
+
+class MCPOutboxEntry(Base):
+    """MCP workflow request awaiting delivery (transactional outbox)."""
+
+    __tablename__ = "mcp_outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    endpoint = Column(String(128), nullable=False)
+    payload = Column(JSONB, default={}, nullable=False)
+    attempts = Column(Integer, default=0, server_default="0", nullable=False)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Next delivery attempt; pushed forward while leased or backing off
+    available_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
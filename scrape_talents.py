@@ -1,15 +1,31 @@
+import argparse
 import asyncio
 import json
 import csv
+import os
 import re
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright.async_api import async_playwright
 from bs4 import BeautifulSoup
 
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # pragma: no cover - BeautifulSoup backend only
+    etree = None
+    lxml_html = None
+
 OUTPUT_DIR = "data"
 TALENTS_JSON_PATH = f"{OUTPUT_DIR}/talents_turtle_wow.json"
 TALENTS_CSV_PATH = f"{OUTPUT_DIR}/talents_turtle_wow.csv"
 TALENT_TREES_JSON_PATH = f"{OUTPUT_DIR}/talent_trees_turtle_wow.json"
 TALENT_TREES_CSV_PATH = f"{OUTPUT_DIR}/talent_trees_turtle_wow.csv"
+CHECKPOINT_DIR = f"{OUTPUT_DIR}/checkpoints"
+
+# Present once the talent grid has rendered (see extract_raw_talents)
+TALENT_SELECTOR = "button.group"
+# A talent's tooltip heading; only there once the button's tooltip is in the DOM
+TALENT_TOOLTIP_SELECTOR = "button.group + div.tw-surface h4.tw-color"
 
 BASE_URL = "https://talent-builder.haaxor1689.dev/c/1.18.1"
 ICONS_BASE_URL = "https://talent-builder.haaxor1689.dev/icons/"
@@ -418,7 +434,253 @@ def normalize_talent_name(name: str) -> str:
     return re.sub(r"[^\w]", "", name).lower()
 
 
-async def scrape_talents():
+def talent_tree_metadata(class_name_key: str, class_data: dict) -> list[dict]:
+    """Talent tree rows (id, class, tree name, background) for one class."""
+    class_name = class_name_key.lower()
+    talent_trees = []
+    for tree_name_key, tree_details in class_data.items():
+        if isinstance(tree_details, dict) and "background_image_url" in tree_details:
+            talent_trees.append(
+                {
+                    "id": f"{class_name}_{tree_name_key.lower()}",
+                    "class": class_name_key,
+                    "tree_name": tree_name_key,
+                    "background_image_url": tree_details["background_image_url"],
+                }
+            )
+    return talent_trees
+
+
+# Talent button layout on the builder's grid
+Y_OFFSET_START = 3
+X_OFFSET_START = 0
+GRID_STEP = 80
+TRANSLATE_RE = re.compile(r"translate3d\(([-\d\.]+)px,\s*([-\d\.]+)px,")
+RANK_RE = re.compile(r"\d+/\s*(\d+)")
+
+
+def _has_class(class_name: str) -> str:
+    """XPath predicate matching one token of the class attribute."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+if lxml_html is not None:
+    # Compiled once; the lxml backend reuses them for every page
+    _XP_TALENT_BUTTONS = etree.XPath(f"//button[{_has_class('group')}]")
+    _XP_ICON_SRC = etree.XPath("(.//img)[1]/@src")
+    _XP_TOOLTIP = etree.XPath(f"following-sibling::div[{_has_class('tw-surface')}][1]")
+    _XP_TALENT_NAME = etree.XPath(f"string((.//h4[{_has_class('tw-color')}])[1])")
+    _XP_RANK = etree.XPath(f"(.//p[{_has_class('font-bold')}])[1]")
+    _XP_DESCRIPTION = etree.XPath(f"(.//p[{_has_class('whitespace-pre-wrap')}])[1]")
+
+
+def _grid_position(style_attr: str | None) -> tuple[int | None, int | None]:
+    """(tier, column) of a talent button from its translate3d style."""
+    if not style_attr:
+        return None, None
+    match_transform = TRANSLATE_RE.search(style_attr)
+    if not match_transform:
+        return None, None
+    x_pos = float(match_transform.group(1))
+    y_pos = float(match_transform.group(2))
+    talent_tier = max(1, round((y_pos - Y_OFFSET_START) / GRID_STEP) + 1)
+    talent_column = max(1, round((x_pos - X_OFFSET_START) / GRID_STEP) + 1)
+    return talent_tier, talent_column
+
+
+def _raw_talent(
+    name: str,
+    icon_src: str,
+    rank_text: str | None,
+    description: str | None,
+    style_attr: str | None,
+) -> dict:
+    """Raw talent row shared by all parser backends."""
+    max_rank = 1
+    if rank_text:
+        match_rank = RANK_RE.search(rank_text)
+        if match_rank:
+            max_rank = int(match_rank.group(1))
+
+    talent_tier, talent_column = _grid_position(style_attr)
+    return {
+        "name": name,
+        "icon": icon_src,
+        "ranks": max_rank,
+        "description": description,
+        "talentTree": None,
+        "row": talent_tier,
+        "column": talent_column,
+        "prereqTalent": None,
+    }
+
+
+def extract_raw_talents_bs4(html_content: str) -> list[dict]:
+    """Reads talent buttons and their tooltips using BeautifulSoup."""
+    soup = BeautifulSoup(html_content, "html.parser")
+
+    talents_found_in_dom = []
+    for button in soup.find_all("button", class_="group"):
+        icon_img = button.find("img")
+        if not (icon_img and icon_img.get("src")):
+            continue
+        tooltip_div = button.find_next_sibling("div", class_="tw-surface")
+        if not tooltip_div:
+            continue
+
+        talent_name_tag = tooltip_div.find("h4", class_="tw-color")
+        talent_name = talent_name_tag.text.strip() if talent_name_tag else None
+        if not talent_name:
+            continue
+        rank_tag = tooltip_div.find("p", class_="font-bold")
+        description_tag = tooltip_div.find("p", class_="whitespace-pre-wrap")
+
+        talents_found_in_dom.append(
+            _raw_talent(
+                talent_name,
+                icon_img["src"],
+                rank_tag.text if rank_tag else None,
+                description_tag.text.strip() if description_tag else None,
+                button.get("style"),
+            )
+        )
+
+    return talents_found_in_dom
+
+
+def extract_raw_talents_lxml(html_content: str) -> list[dict]:
+    """Reads talent buttons and their tooltips using lxml and compiled XPath."""
+    if lxml_html is None:
+        raise RuntimeError("lxml is not installed")
+    if not html_content.strip():
+        return []
+    try:
+        document = lxml_html.document_fromstring(html_content)
+    except etree.ParserError:
+        return []
+
+    talents_found_in_dom = []
+    for button in _XP_TALENT_BUTTONS(document):
+        icon_src = _XP_ICON_SRC(button)
+        if not (icon_src and icon_src[0]):
+            continue
+        tooltip_div = _XP_TOOLTIP(button)
+        if not tooltip_div:
+            continue
+        tooltip_div = tooltip_div[0]
+
+        talent_name = _XP_TALENT_NAME(tooltip_div).strip()
+        if not talent_name:
+            continue
+        rank_tag = _XP_RANK(tooltip_div)
+        description_tag = _XP_DESCRIPTION(tooltip_div)
+
+        talents_found_in_dom.append(
+            _raw_talent(
+                talent_name,
+                str(icon_src[0]),
+                rank_tag[0].text_content() if rank_tag else None,
+                description_tag[0].text_content().strip() if description_tag else None,
+                button.get("style"),
+            )
+        )
+
+    return talents_found_in_dom
+
+
+PARSER_BACKENDS = {
+    "bs4": extract_raw_talents_bs4,
+    "lxml": extract_raw_talents_lxml,
+}
+DEFAULT_PARSER = "lxml" if lxml_html is not None else "bs4"
+
+
+def extract_raw_talents(html_content: str, parser: str | None = None) -> list[dict]:
+    """
+    Reads talent buttons and their tooltips out of a rendered class page.
+
+    `parser` picks a backend from PARSER_BACKENDS; by default the lxml one
+    is used when lxml is installed and BeautifulSoup otherwise. Both return
+    the same rows.
+    """
+    try:
+        backend = PARSER_BACKENDS[parser or DEFAULT_PARSER]
+    except KeyError:
+        raise ValueError(f"Unknown talent page parser: {parser}") from None
+    return backend(html_content)
+
+
+def assign_talent_trees(
+    talents_found_in_dom: list[dict], class_name_key: str, class_data: dict
+):
+    """Matches scraped talents against TALENT_NOTES to set their tree (and tier)."""
+    # After populating raw_talent["row"] from HTML, now match to TALENT_NOTES for tree verification
+    for raw_talent in talents_found_in_dom:
+        talent_name = raw_talent["name"]
+        normalized_extracted_name = normalize_talent_name(talent_name)
+
+        found_match_in_notes = False
+        for tree_name_key, tree_details in class_data.items():
+            if tree_name_key == "background_image_url":  # Skip metadata
+                continue
+
+            tier_lists_from_notes = tree_details.get("tiers", [])
+
+            for current_tier_idx, talents_in_current_tier in enumerate(
+                tier_lists_from_notes
+            ):
+                current_tier_from_notes = (
+                    current_tier_idx + 1
+                )  # Convert 0-indexed to 1-indexed tier
+                for noted_talent_name in talents_in_current_tier:
+                    normalized_noted_name = normalize_talent_name(noted_talent_name)
+                    if normalized_extracted_name == normalized_noted_name:
+                        raw_talent["talentTree"] = tree_name_key  # Actual tree name
+                        # Prefer HTML-derived tier, but if unavailable, use tier from notes
+                        if raw_talent["row"] is None:
+                            raw_talent["row"] = current_tier_from_notes
+                        found_match_in_notes = True
+                        break
+                if found_match_in_notes:
+                    break
+            if found_match_in_notes:
+                break
+
+        if not found_match_in_notes:
+            print(
+                f"WARNING: Talent '{talent_name}' (Normalized: '{normalized_extracted_name}') not found in TALENT_NOTES for {class_name_key}."
+            )
+            raw_talent[
+                "talentTree"
+            ] = class_name_key.capitalize()  # Default to class name
+
+
+def parse_class_page(
+    html_content: str, class_name_key: str, parser: str | None = None
+) -> list[dict]:
+    """Turns one rendered class page into processed talent rows (no browser)."""
+    class_name = class_name_key.lower()
+    talents_found_in_dom = extract_raw_talents(html_content, parser)
+    print(
+        f"Found {len(talents_found_in_dom)} potential talents in DOM for {class_name}."
+    )
+    if not talents_found_in_dom:
+        print(f"No talents data found in DOM for {class_name}.")
+        return []
+
+    assign_talent_trees(
+        talents_found_in_dom, class_name_key, TALENT_NOTES[class_name_key]
+    )
+
+    all_talents = []
+    for raw_talent in talents_found_in_dom:
+        processed_talent = process_raw_talent_data(raw_talent, class_name)
+        if processed_talent:
+            all_talents.append(processed_talent)
+    return all_talents
+
+
+async def scrape_talents(parser: str | None = None):
     all_talents = []
     all_talent_trees = []  # To store metadata for each talent tree
 
@@ -433,169 +695,180 @@ async def scrape_talents():
             class_name = class_name_key.lower()
 
             # Store background image URLs and create talent tree metadata
-            for tree_name_key, tree_details in class_data.items():
-                if (
-                    isinstance(tree_details, dict)
-                    and "background_image_url" in tree_details
-                ):
-                    talent_tree_id = f"{class_name}_{tree_name_key.lower()}"
-                    all_talent_trees.append(
-                        {
-                            "id": talent_tree_id,
-                            "class": class_name_key,
-                            "tree_name": tree_name_key,
-                            "background_image_url": tree_details[
-                                "background_image_url"
-                            ],
-                        }
-                    )
-
-            url = f"{BASE_URL}/{class_name}"
-            print(f"Navigating to {url}")
-            await page.goto(url, wait_until="networkidle", timeout=60000)
-
-            await page.wait_for_timeout(5000)
-
-            html_content = await page.content()
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            talent_elements = soup.find_all("button", class_="group")
-
-            talents_found_in_dom = []
-
-            Y_OFFSET_START = 3
-            X_OFFSET_START = 0
-            GRID_STEP = 80
-
-            for button in talent_elements:
-                style_attr = button.get("style")
-                x_pos, y_pos = None, None
-                if style_attr:
-                    match_transform = re.search(
-                        r"translate3d\(([-\d\.]+)px,\s*([-\d\.]+)px,", style_attr
-                    )
-                    if match_transform:
-                        x_pos = float(match_transform.group(1))
-                        y_pos = float(match_transform.group(2))
-
-                talent_tier = None
-                talent_column = None
-
-                if y_pos is not None:
-                    talent_tier = round((y_pos - Y_OFFSET_START) / GRID_STEP) + 1
-                    talent_tier = max(1, talent_tier)
-
-                if x_pos is not None:
-                    talent_column = round((x_pos - X_OFFSET_START) / GRID_STEP) + 1
-                    talent_column = max(1, talent_column)
-
-                icon_img = button.find("img")
-                if icon_img and icon_img.get("src"):
-                    icon_src = icon_img["src"]
-                    tooltip_div = button.find_next_sibling("div", class_="tw-surface")
-
-                    if tooltip_div:
-                        talent_name_tag = tooltip_div.find("h4", class_="tw-color")
-                        rank_tag = tooltip_div.find("p", class_="font-bold")
-                        description_tag = tooltip_div.find(
-                            "p", class_="whitespace-pre-wrap"
-                        )
-
-                        talent_name = (
-                            talent_name_tag.text.strip() if talent_name_tag else None
-                        )
-                        description = (
-                            description_tag.text.strip() if description_tag else None
-                        )
-
-                        max_rank = 1
-                        if rank_tag:
-                            match_rank = re.search(r"\d+/\s*(\d+)", rank_tag.text)
-                            if match_rank:
-                                max_rank = int(match_rank.group(1))
-
-                        if talent_name:
-                            raw_talent = {
-                                "name": talent_name,
-                                "icon": icon_src,
-                                "ranks": max_rank,
-                                "description": description,
-                                "talentTree": None,
-                                "row": talent_tier,
-                                "column": talent_column,
-                                "prereqTalent": None,
-                            }
-                            talents_found_in_dom.append(raw_talent)
+            all_talent_trees.extend(talent_tree_metadata(class_name_key, class_data))
 
-            print(
-                f"Found {len(talents_found_in_dom)} potential talents in DOM for {class_name}."
-            )
+            html_content = await fetch_class_page(page, class_name)
+            all_talents.extend(parse_class_page(html_content, class_name_key, parser))
 
-            # After populating raw_talent["row"] from HTML, now match to TALENT_NOTES for tree verification
-            for raw_talent in talents_found_in_dom:
-                talent_name = raw_talent["name"]
-                normalized_extracted_name = normalize_talent_name(talent_name)
-
-                found_match_in_notes = False
-                for tree_name_key, tree_details in class_data.items():
-                    if tree_name_key == "background_image_url":  # Skip metadata
-                        continue
-
-                    tier_lists_from_notes = tree_details.get("tiers", [])
-
-                    for current_tier_idx, talents_in_current_tier in enumerate(
-                        tier_lists_from_notes
-                    ):
-                        current_tier_from_notes = (
-                            current_tier_idx + 1
-                        )  # Convert 0-indexed to 1-indexed tier
-                        for noted_talent_name in talents_in_current_tier:
-                            normalized_noted_name = normalize_talent_name(
-                                noted_talent_name
-                            )
-                            if normalized_extracted_name == normalized_noted_name:
-                                raw_talent[
-                                    "talentTree"
-                                ] = tree_name_key  # Assign actual tree name
-                                # Prefer HTML-derived tier, but if unavailable, use tier from notes
-                                if raw_talent["row"] is None:
-                                    raw_talent["row"] = current_tier_from_notes
-                                found_match_in_notes = True
-                                break
-                        if found_match_in_notes:
-                            break
-                    if found_match_in_notes:
-                        break
+        await browser.close()
 
-                if not found_match_in_notes:
-                    normalized_notes_for_class_list = []
-                    for tree_name_debug, tree_data_debug in class_data.items():
-                        if tree_name_debug == "background_image_url":
-                            continue
-                        for tier_list_debug in tree_data_debug.get("tiers", []):
-                            for tn_debug in tier_list_debug:
-                                normalized_notes_for_class_list.append(
-                                    normalize_talent_name(tn_debug)
-                                )
-
-                    print(
-                        f"WARNING: Talent '{talent_name}' (Normalized: '{normalized_extracted_name}') not found in TALENT_NOTES for {class_name_key}."
-                    )
-                    # print(f"  Attempted matches for (normalized TALENT_NOTES): {sorted(list(set(normalized_notes_for_class_list)))}") # Temporarily disable to reduce verbosity
-                    raw_talent[
-                        "talentTree"
-                    ] = class_name_key.capitalize()  # Default to class name
-
-            for raw_talent in talents_found_in_dom:
-                processed_talent = process_raw_talent_data(raw_talent, class_name)
-                if processed_talent:
-                    all_talents.append(processed_talent)
-
-            if not talents_found_in_dom:
-                print(f"No talents data found in DOM for {class_name}.")
+    return all_talents, all_talent_trees
 
-        await browser.close()
 
+def expected_talent_count(class_name_key: str) -> int:
+    """Number of talents TALENT_NOTES lists for a class; a complete page has them all."""
+    return sum(
+        len(tier)
+        for tree_details in TALENT_NOTES[class_name_key].values()
+        if isinstance(tree_details, dict)
+        for tier in tree_details.get("tiers", [])
+    )
+
+
+async def fetch_class_page(page, class_name: str) -> str:
+    """Loads a class page and waits until its talent tooltips are rendered."""
+    url = f"{BASE_URL}/{class_name}"
+    print(f"Navigating to {url}")
+    await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+    # Wait for the talent grid itself rather than a fixed sleep after networkidle
+    await page.wait_for_selector(
+        TALENT_TOOLTIP_SELECTOR, state="attached", timeout=30000
+    )
+    # The first tooltip can appear before the rest of the grid has rendered
+    expected = expected_talent_count(class_name.upper())
+    try:
+        await page.wait_for_function(
+            "([selector, expected]) => "
+            "document.querySelectorAll(selector).length >= expected",
+            arg=[TALENT_TOOLTIP_SELECTOR, expected],
+            timeout=15000,
+        )
+    except PlaywrightTimeoutError:
+        print(f"WARNING: {class_name} rendered fewer than {expected} talents.")
+    return await page.content()
+
+
+def load_checkpoint(class_name_key: str, checkpoint_dir: str) -> list[dict] | None:
+    """Talents saved by an earlier run for this class, or None if incomplete."""
+    path = os.path.join(checkpoint_dir, f"{class_name_key.lower()}.json")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        talents, expected = checkpoint["talents"], checkpoint["expected"]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"WARNING: Ignoring unreadable checkpoint {path}: {e}")
+        return None
+    if len(talents) < expected:
+        print(f"WARNING: Ignoring incomplete checkpoint {path}.")
+        return None
+    return talents
+
+
+def save_checkpoint(
+    class_name_key: str,
+    talents: list[dict],
+    checkpoint_dir: str,
+    expected: int | None = None,
+):
+    """
+    Atomically records a scraped class so a rerun can skip it.
+
+    `expected` (default: expected_talent_count) is stored alongside, and a
+    checkpoint with fewer talents is treated as incomplete when loaded.
+    """
+    if expected is None:
+        expected = expected_talent_count(class_name_key)
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    path = os.path.join(checkpoint_dir, f"{class_name_key.lower()}.json")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"class": class_name_key, "expected": expected, "talents": talents},
+            f,
+            ensure_ascii=False,
+        )
+    os.replace(tmp_path, path)
+
+
+async def scrape_talents_concurrent(
+    concurrency: int = 4,
+    checkpoint_dir: str = CHECKPOINT_DIR,
+    resume: bool = True,
+    fetch_html=None,
+    parser: str | None = None,
+):
+    """
+    Scrapes classes in parallel with a bounded pool of browser contexts.
+
+    Every complete class (all talents TALENT_NOTES lists) is checkpointed;
+    with resume=True classes that already have a complete checkpoint are not
+    fetched again. `fetch_html` (an async
+    callable taking the lowercase class name) replaces the browser, e.g. to
+    parse saved HTML fixtures offline. `parser` selects the HTML backend
+    (see extract_raw_talents).
+    """
+    all_talent_trees = []
+    for class_name_key, class_data in TALENT_NOTES.items():
+        all_talent_trees.extend(talent_tree_metadata(class_name_key, class_data))
+
+    results: dict[str, list[dict]] = {}
+    pending = []
+    for class_name_key in TALENT_NOTES:
+        checkpoint = load_checkpoint(class_name_key, checkpoint_dir) if resume else None
+        if checkpoint is not None:
+            print(f"Resuming: {class_name_key.lower()} loaded from checkpoint.")
+            results[class_name_key] = checkpoint
+        else:
+            pending.append(class_name_key)
+
+    async def scrape_class(class_name_key: str, fetch):
+        html_content = await fetch(class_name_key.lower())
+        talents = parse_class_page(html_content, class_name_key, parser)
+        expected = expected_talent_count(class_name_key)
+        # A partly rendered (or empty) page is retried on the next run
+        if talents and len(talents) >= expected:
+            save_checkpoint(class_name_key, talents, checkpoint_dir, expected)
+        elif talents:
+            print(
+                f"WARNING: {class_name_key.lower()} has {len(talents)}/{expected} "
+                "talents; not checkpointed."
+            )
+        results[class_name_key] = talents
+
+    async def run_all(fetch):
+        outcomes = await asyncio.gather(
+            *(scrape_class(key, fetch) for key in pending), return_exceptions=True
+        )
+        for class_name_key, outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"ERROR: Failed to scrape {class_name_key.lower()}: {outcome}")
+
+    if pending and fetch_html is not None:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded_fetch(class_name: str) -> str:
+            async with semaphore:
+                return await fetch_html(class_name)
+
+        await run_all(bounded_fetch)
+    elif pending:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            # Each context is an isolated tab session; reuse keeps caches warm
+            contexts: asyncio.Queue = asyncio.Queue()
+            for _ in range(min(concurrency, len(pending))):
+                contexts.put_nowait(await browser.new_context())
+
+            async def pooled_fetch(class_name: str) -> str:
+                context = await contexts.get()
+                page = await context.new_page()
+                try:
+                    return await fetch_class_page(page, class_name)
+                finally:
+                    await page.close()
+                    contexts.put_nowait(context)
+
+            await run_all(pooled_fetch)
+            await browser.close()
+
+    # Keep TALENT_NOTES order regardless of completion order
+    all_talents = [
+        talent
+        for class_name_key in TALENT_NOTES
+        for talent in results.get(class_name_key, [])
+    ]
     return all_talents, all_talent_trees
 
 
@@ -682,12 +955,39 @@ def save_to_csv(data: list[dict], file_path: str):
 
 
 if __name__ == "__main__":
-    import os
+    parser = argparse.ArgumentParser(description="Scrape Turtle WoW talent trees.")
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Scrape classes in parallel, checkpointing each finished class",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Browser contexts (concurrent mode)"
+    )
+    parser.add_argument(
+        "--fresh", action="store_true", help="Ignore existing checkpoints"
+    )
+    parser.add_argument(
+        "--parser",
+        choices=sorted(PARSER_BACKENDS),
+        default=DEFAULT_PARSER,
+        help="HTML parser backend for rendered pages",
+    )
+    args = parser.parse_args()
 
     if not os.path.exists(OUTPUT_DIR):
         os.makedirs(OUTPUT_DIR)
 
-    talents, talent_trees = asyncio.run(scrape_talents())
+    if args.concurrent:
+        talents, talent_trees = asyncio.run(
+            scrape_talents_concurrent(
+                concurrency=args.workers,
+                resume=not args.fresh,
+                parser=args.parser,
+            )
+        )
+    else:
+        talents, talent_trees = asyncio.run(scrape_talents(parser=args.parser))
     if talents:
         save_to_json(talents, TALENTS_JSON_PATH)
         save_to_csv(talents, TALENTS_CSV_PATH)
@@ -0,0 +1,129 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Change Listener
+LISTENs on the Postgres channel fed by the notify_row_change() triggers and
+turns row changes from any process (API, bot, workers, MCP server) into local
+cache invalidation plus RowChanged domain events.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Optional, Set
+
+import asyncpg
+
+from config.settings import get_settings
+from domain import events
+from services.character_service import clear_character_caches, invalidate_character
+
+logger = logging.getLogger(__name__)
+
+# Must match the channel used by the add_row_change_notify_triggers migration
+CHANGE_CHANNEL = "azeroth_changes"
+
+
+def apply_row_change(table: str, op: str, row_id: str) -> None:
+    """Invalidate whatever this process caches for the changed row."""
+    if table != "characters":
+        return
+    if op == "INSERT":
+        # A new name / discord ID may be cached as missing; inserts are rare
+        clear_character_caches()
+    else:
+        invalidate_character(int(row_id))
+
+
+class ChangeListener:
+    """
+    Holds a dedicated asyncpg connection LISTENing on CHANGE_CHANNEL.
+    Reconnects with backoff; caches are flushed on every (re)connect because
+    notifications sent while disconnected are lost.
+    """
+
+    def __init__(self, dsn: Optional[str] = None, reconnect_delay: float = 5.0):
+        self._dsn = dsn
+        self._reconnect_delay = reconnect_delay
+        self._task: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Task] = set()
+
+    def _resolve_dsn(self) -> str:
+        url = self._dsn or get_settings().DATABASE_URL
+        # asyncpg wants a plain libpq URL, not the SQLAlchemy dialect form
+        return url.replace("postgresql+asyncpg://", "postgresql://")
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="change-listener")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self._resolve_dsn())
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _conn: closed.set())
+                await connection.add_listener(CHANGE_CHANNEL, self._on_notify)
+                clear_character_caches()
+                logger.info(f"Listening for row changes on '{CHANGE_CHANNEL}'")
+                await closed.wait()
+                logger.warning("Change listener connection closed, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Change listener failed: {e}")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(self._reconnect_delay)
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            data = json.loads(payload)
+            change = events.RowChanged(
+                table=data["table"], op=data["op"], row_id=str(data["id"])
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed change notification {payload!r}: {e}")
+            return
+
+        apply_row_change(change.table, change.op, change.row_id)
+
+        # Push to subscribers without blocking asyncpg's callback
+        task = asyncio.get_running_loop().create_task(events.publish(change))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+
+_change_listener: Optional[ChangeListener] = None
+
+
+def get_change_listener() -> ChangeListener:
+    global _change_listener
+    if _change_listener is None:
+        _change_listener = ChangeListener()
+    return _change_listener
@@ -1,45 +1,231 @@
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from db.repositories import CharacterRepository, GraveyardRepository
 from models import pydantic_models
-from typing import List, Optional
+from domain import events
+from utils.cache import BoundedCache
+from typing import Any, Dict, List, Optional, Tuple
+
+# Built once: validates raw row mappings and serializes straight to JSON bytes
+_CHARACTER_LIST_ADAPTER = TypeAdapter(List[pydantic_models.CharacterInDB])
+
+# Recent ETags for the character GET endpoints: ("id", id) -> etag and
+# ("discord", discord_user_id) -> id. Any write to a character drops its entry.
+_etag_cache = BoundedCache(maxsize=1024, ttl=300)
+
+
+def character_etag(character: pydantic_models.CharacterInDB) -> str:
+    """Weak ETag from the row ID and its last-modified timestamp."""
+    return f'W/"{character.id}-{character.updated_at.timestamp():.6f}"'
+
+
+def remember_etag(character: pydantic_models.CharacterInDB) -> str:
+    etag = character_etag(character)
+    _etag_cache.set(("id", character.id), etag)
+    _etag_cache.set(("discord", character.discord_user_id), character.id)
+    return etag
+
+
+def get_cached_etag(
+    character_id: Optional[int] = None, discord_user_id: Optional[int] = None
+) -> Optional[str]:
+    """Last known ETag for a character, without touching the database."""
+    if character_id is None and discord_user_id is not None:
+        character_id = _etag_cache.get(("discord", discord_user_id))
+    if character_id is None:
+        return None
+    return _etag_cache.get(("id", character_id))
+
+
+# Read-through cache for single-character lookups. ("id", id) holds the model;
+# ("discord", ...) and ("name", ...) hold the ID that lookup resolved to. Any
+# entry may be _NOT_FOUND (negative caching). Index hits are checked against the
+# cached model, so dropping ("id", id) is enough to invalidate every alias.
+_NOT_FOUND = object()
+_character_cache = BoundedCache(maxsize=1024, ttl=60)
+
+
+class _Generations:
+    """
+    Invalidation sequence numbers per cache key, so a load that started before
+    an invalidation doesn't write its (possibly stale) row back into the cache.
+    Only recorded while a load is in flight; nothing else can race.
+    """
+
+    def __init__(self):
+        self.seq = 0
+        self.readers = 0
+        self.bumped: Dict[Tuple[str, object], int] = {}
+
+    def bump(self, *keys) -> None:
+        self.seq += 1
+        if self.readers:
+            for key in keys:
+                self.bumped[key] = self.seq
+
+    def start_read(self) -> int:
+        self.readers += 1
+        return self.seq
+
+    def end_read(self) -> None:
+        self.readers -= 1
+        if not self.readers:
+            self.bumped.clear()
+
+    def changed_since(self, seq: int, *keys) -> bool:
+        return any(self.bumped.get(key, 0) > seq for key in keys)
+
+
+_generations = _Generations()
+
+
+def invalidate_character(character_id: Optional[int], *touched) -> None:
+    """
+    Drop cached state for a character after a write.
+
+    Args:
+        character_id: ID whose model and ETag are dropped (None for inserts)
+        touched: Models whose discord ID / name may have negative entries cached
+    """
+    keys = []
+    if character_id is not None:
+        keys.append(("id", character_id))
+        _etag_cache.pop(("id", character_id))
+    for character in touched:
+        if character is None:
+            continue
+        keys.append(("discord", character.discord_user_id))
+        keys.append(("name", character.name))
+    for key in keys:
+        _character_cache.pop(key)
+    _generations.bump(*keys)
+
+
+def clear_character_caches() -> None:
+    _character_cache.clear()
+    _etag_cache.clear()
 
 
 class CharacterService:
-    def __init__(self, db: AsyncSession):
-        self.character_repo = CharacterRepository(db)
-        self.graveyard_repo = GraveyardRepository(db)
+    def __init__(self, db: AsyncSession, autocommit: bool = True):
+        self.character_repo = CharacterRepository(db, autocommit=autocommit)
+        self.graveyard_repo = GraveyardRepository(db, autocommit=autocommit)
+        self.autocommit = autocommit
+        # Without autocommit, writes are only visible once the caller commits;
+        # their invalidations wait for run_invalidations() and their events for
+        # publish_events() (see UnitOfWork)
+        self._pending_invalidations: List[Tuple[Optional[int], tuple]] = []
+        self._pending_events: List[Any] = []
+
+    def _invalidate(self, character_id: Optional[int], *touched) -> None:
+        if self.autocommit:
+            invalidate_character(character_id, *touched)
+        else:
+            self._pending_invalidations.append((character_id, touched))
+
+    def run_invalidations(self) -> None:
+        """Apply invalidations queued since the last call (after commit/rollback)."""
+        pending, self._pending_invalidations = self._pending_invalidations, []
+        for character_id, touched in pending:
+            invalidate_character(character_id, *touched)
+
+    async def _publish(self, event: Any) -> None:
+        if self.autocommit:
+            await events.publish(event)
+        else:
+            self._pending_events.append(event)
+
+    async def publish_events(self) -> None:
+        """Publish events queued since the last call (after a successful commit)."""
+        pending, self._pending_events = self._pending_events, []
+        for event in pending:
+            await events.publish(event)
+
+    def discard_events(self) -> None:
+        """Drop queued events whose writes were rolled back."""
+        self._pending_events.clear()
 
     async def create_character(
         self, character_data: pydantic_models.CharacterCreate
     ) -> pydantic_models.CharacterInDB:
         db_character = await self.character_repo.create_character(character_data)
+        # Lookups may have cached this name / discord ID as missing
+        self._invalidate(None, character_data)
         return pydantic_models.CharacterInDB.model_validate(db_character)
 
+    async def _read_through(self, key: Tuple[str, object], matches, load):
+        if self._pending_invalidations:
+            # This session has uncommitted writes: never serve or cache its view
+            db_character = await load()
+            if not db_character:
+                return None
+            return pydantic_models.CharacterInDB.model_validate(db_character)
+
+        cached = _character_cache.get(key)
+        if cached is _NOT_FOUND:
+            return None
+        if cached is not None:
+            character = (
+                cached if key[0] == "id" else _character_cache.get(("id", cached))
+            )
+            if isinstance(character, pydantic_models.CharacterInDB) and matches(
+                character
+            ):
+                # Deep copy so callers can't mutate the shared entry's lists
+                return character.model_copy(deep=True)
+
+        started = _generations.start_read()
+        try:
+            db_character = await load()
+            character = (
+                pydantic_models.CharacterInDB.model_validate(db_character)
+                if db_character
+                else None
+            )
+            # Invalidated while loading: the row may predate the write, don't cache
+            raced = _generations.changed_since(
+                started, key, *([("id", character.id)] if character else [])
+            )
+        finally:
+            _generations.end_read()
+
+        if character is None:
+            if not raced:
+                _character_cache.set(key, _NOT_FOUND)
+            return None
+        if raced:
+            return character
+        _character_cache.set(("id", character.id), character)
+        if key[0] != "id":
+            _character_cache.set(key, character.id)
+        return character.model_copy(deep=True)
+
     async def get_character_by_id(
         self, character_id: int
     ) -> Optional[pydantic_models.CharacterInDB]:
-        db_character = await self.character_repo.get_character_by_id(character_id)
-        if db_character:
-            return pydantic_models.CharacterInDB.model_validate(db_character)
-        return None
+        return await self._read_through(
+            ("id", character_id),
+            lambda c: c.id == character_id,
+            lambda: self.character_repo.get_character_by_id(character_id),
+        )
 
     async def get_character_by_discord_id(
         self, discord_user_id: int
     ) -> Optional[pydantic_models.CharacterInDB]:
-        db_character = await self.character_repo.get_character_by_discord_id(
-            discord_user_id
+        return await self._read_through(
+            ("discord", discord_user_id),
+            lambda c: c.discord_user_id == discord_user_id,
+            lambda: self.character_repo.get_character_by_discord_id(discord_user_id),
         )
-        if db_character:
-            return pydantic_models.CharacterInDB.model_validate(db_character)
-        return None
 
     async def get_character_by_name(
         self, name: str
     ) -> Optional[pydantic_models.CharacterInDB]:
-        db_character = await self.character_repo.get_character_by_name(name)
-        if db_character:
-            return pydantic_models.CharacterInDB.model_validate(db_character)
-        return None
+        return await self._read_through(
+            ("name", name),
+            lambda c: c.name == name,
+            lambda: self.character_repo.get_character_by_name(name),
+        )
 
     async def get_character_by_recruitment_msg_id(
         self, recruitment_msg_id: int
@@ -51,6 +237,11 @@ class CharacterService:
             return pydantic_models.CharacterInDB.model_validate(db_character)
         return None
 
+    async def get_pending_recruitment_refs(
+        self,
+    ) -> List[Tuple[int, int, Optional[int]]]:
+        return await self.character_repo.get_pending_recruitment_refs()
+
     async def get_all_characters(
         self, skip: int = 0, limit: int = 100
     ) -> List[pydantic_models.CharacterInDB]:
@@ -59,6 +250,15 @@ class CharacterService:
             pydantic_models.CharacterInDB.model_validate(char) for char in db_characters
         ]
 
+    async def get_all_characters_json(self, skip: int = 0, limit: int = 100) -> bytes:
+        """
+        Roster as a JSON array, validated once from column mappings.
+        Same payload the CharacterInDB response_model would produce (aliases included).
+        """
+        rows = await self.character_repo.get_all_character_rows(skip, limit)
+        characters = _CHARACTER_LIST_ADAPTER.validate_python([dict(r) for r in rows])
+        return _CHARACTER_LIST_ADAPTER.dump_json(characters, by_alias=True)
+
     async def update_character(
         self, character_id: int, character_data: pydantic_models.CharacterUpdate
     ) -> Optional[pydantic_models.CharacterInDB]:
@@ -66,17 +266,48 @@ class CharacterService:
             character_id, character_data
         )
         if db_character:
-            return pydantic_models.CharacterInDB.model_validate(db_character)
+            character = pydantic_models.CharacterInDB.model_validate(db_character)
+            self._invalidate(character_id, character)
+            return character
+        self._invalidate(character_id)
         return None
 
+    async def approve_character(
+        self, character_id: int, reviewer_id: int
+    ) -> Optional[pydantic_models.CharacterInDB]:
+        """
+        Approve a pending application in one statement and emit CharacterApproved
+        (once committed, for a unit of work).
+        Returns None if the character does not exist or is no longer pending.
+        """
+        db_character = await self.character_repo.approve_character(
+            character_id, reviewer_id
+        )
+        self._invalidate(character_id)
+        if not db_character:
+            return None
+
+        character = pydantic_models.CharacterInDB.model_validate(db_character)
+        await self._publish(
+            events.CharacterApproved(
+                character_id=character.id,
+                reviewer_id=reviewer_id,
+                name=character.name,
+                discord_user_id=character.discord_user_id,
+            )
+        )
+        return character
+
     async def delete_character(self, character_id: int) -> bool:
-        return await self.character_repo.delete_character(character_id)
+        deleted = await self.character_repo.delete_character(character_id)
+        self._invalidate(character_id)
+        return deleted
 
     async def bury_character(
         self, character_id: int, cause_of_death: str, eulogy: Optional[str] = None
     ) -> Optional[pydantic_models.GraveyardInDB]:
-        # First, ensure character exists
-        character = await self.character_repo.get_character_by_id(character_id)
+        # First, ensure character exists (usually answered from the cache)
+        character = await self.get_character_by_id(character_id)
         if not character:
             return None
 
@@ -87,13 +318,20 @@ class CharacterService:
         db_graveyard_entry = await self.graveyard_repo.create_graveyard_entry(
             graveyard_data
         )
+        self._invalidate(character_id)
 
         return pydantic_models.GraveyardInDB.model_validate(db_graveyard_entry)
 
 
 class GraveyardService:
-    def __init__(self, db: AsyncSession):
-        self.graveyard_repo = GraveyardRepository(db)
+    def __init__(self, db: AsyncSession, autocommit: bool = True):
+        self.graveyard_repo = GraveyardRepository(db, autocommit=autocommit)
+
+    async def create_graveyard_entry(
+        self, entry_data: pydantic_models.GraveyardCreate
+    ) -> pydantic_models.GraveyardInDB:
+        db_entry = await self.graveyard_repo.create_graveyard_entry(entry_data)
+        return pydantic_models.GraveyardInDB.model_validate(db_entry)
 
     async def get_graveyard_entry_by_id(
         self, entry_id: int
@@ -22,7 +22,9 @@ Configures the Discord bot client.
 import logging
 import discord
 from discord.ext import commands
-from views.officer_view import OfficerControlView
+from views.officer_view import OFFICER_DYNAMIC_ITEMS
+from services.message_dispatcher import MessageDispatcher
+from services.recruitment_index import get_recruitment_index
 
 logger = logging.getLogger(__name__)
 
@@ -38,19 +40,29 @@ def create_bot():
     # Create bot instance
     bot = commands.Bot(command_prefix="!", intents=intents)
 
+    # Officer buttons carry the character ID in their custom_id
+    # (e.g. "officer_approve:42"), so they keep working after restarts
+    # without registering a placeholder persistent view.
+    bot.add_dynamic_items(*OFFICER_DYNAMIC_ITEMS)
+
+    # Interactive flows wait for replies through one O(1) router rather than
+    # a bot.wait_for predicate per flow evaluated on every message
+    bot.message_dispatcher = MessageDispatcher()
+
+    @bot.listen("on_message")
+    async def route_flow_replies(message: discord.Message):
+        if not message.author.bot:
+            bot.message_dispatcher.dispatch(message)
+
     @bot.event
     async def on_ready():
         logger.info(f"Bot logged in as {bot.user.name} (ID: {bot.user.id})")
 
-        # Register persistent views (timeout=None) so they work after bot restarts
-        # This allows buttons on old messages to still function
+        # Resolve officer button clicks on pending applications from memory
         try:
-            # Register OfficerControlView with a dummy character_id
-            # The actual character_id is stored in the button's custom_id
-            bot.add_view(OfficerControlView(bot, 0))
-            logger.info("Registered persistent view: OfficerControlView")
+            await get_recruitment_index().warm()
         except Exception as e:
-            logger.error(f"Failed to register persistent views: {e}")
+            logger.error(f"Failed to warm recruitment index: {e}")
 
         # Sync slash commands
         try:
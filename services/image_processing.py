@@ -0,0 +1,144 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Image Processing
+Normalizes uploaded portraits into bounded-size WebP variants (thumbnail and
+embed). Decoding and encoding run in a process pool so large images never
+block the event loop; metadata (EXIF, ICC, XMP) is dropped from the outputs.
+"""
+
+import asyncio
+import io
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from PIL import Image, ImageOps
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Longest edge, in pixels, of each generated variant
+VARIANT_BOUNDS: Dict[str, int] = {"thumb": 256, "embed": 1024}
+WEBP_QUALITY = 82
+
+# Formats Pillow decodes to a single still frame; GIFs keep their animation
+# and SVGs are vector, so both are stored as-is without variants.
+PROCESSABLE_CONTENT_TYPES = {"image/png", "image/jpeg", "image/webp"}
+
+
+@dataclass
+class ImageVariant:
+    """One re-encoded rendition of an uploaded image."""
+
+    name: str
+    data: bytes
+    width: int
+    height: int
+    content_type: str = "image/webp"
+
+
+class ImageProcessingError(Exception):
+    """Raised when an image cannot be decoded or re-encoded."""
+
+    pass
+
+
+def normalize_image(
+    image_bytes: bytes,
+    bounds: Optional[Dict[str, int]] = None,
+    quality: int = WEBP_QUALITY,
+) -> List[ImageVariant]:
+    """
+    Decode an image and re-encode it as WebP at each bound.
+
+    Runs inside worker processes, so it must stay a picklable module-level
+    function. Variants are never upscaled.
+    """
+    bounds = bounds or VARIANT_BOUNDS
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            # JPEGs can decode at a reduced scale, skipping most of the work
+            largest = max(bounds.values())
+            img.draft("RGB", (largest, largest))
+            # Apply EXIF rotation before the EXIF block is thrown away
+            img = ImageOps.exif_transpose(img)
+            has_alpha = img.mode in ("RGBA", "LA", "PA") or (
+                img.mode == "P" and "transparency" in img.info
+            )
+            img = img.convert("RGBA" if has_alpha else "RGB")
+            img.info.clear()
+
+            variants = []
+            for name, edge in bounds.items():
+                variant = img.copy()
+                variant.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+                out = io.BytesIO()
+                variant.save(out, "WEBP", quality=quality, method=4)
+                variants.append(
+                    ImageVariant(name, out.getvalue(), variant.width, variant.height)
+                )
+            return variants
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        raise ImageProcessingError(f"Could not normalize image: {e}") from e
+
+
+class ImageProcessor:
+    """Runs normalize_image in a lazily started process pool."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def process(self, image_bytes: bytes) -> Dict[str, ImageVariant]:
+        """Build every variant off the event loop, keyed by variant name."""
+        loop = asyncio.get_running_loop()
+        variants = await loop.run_in_executor(
+            self._get_executor(), normalize_image, image_bytes
+        )
+        return {variant.name: variant for variant in variants}
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_processor_instance: Optional[ImageProcessor] = None
+
+
+def get_image_processor() -> ImageProcessor:
+    """Get or create the global ImageProcessor instance."""
+    global _processor_instance
+    if _processor_instance is None:
+        _processor_instance = ImageProcessor(settings.IMAGE_PROCESSING_WORKERS)
+    return _processor_instance
+
+
+def shutdown_image_processor() -> None:
+    """Stop the global instance's worker processes, if it was created."""
+    global _processor_instance
+    if _processor_instance is not None:
+        _processor_instance.shutdown()
+        _processor_instance = None
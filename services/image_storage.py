@@ -21,13 +21,32 @@ Provides permanent, production-grade image hosting with zero egress fees.
 
 import boto3
 from botocore.exceptions import ClientError
+import aiohttp
 import asyncio
+import hashlib
 import logging
 import uuid
-from typing import Optional, Dict
-from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 from config.settings import settings
+from db.database import get_engine_and_session_maker
+from db.repositories import ImageRepository
+from models import pydantic_models
+from services.image_processing import (
+    PROCESSABLE_CONTENT_TYPES,
+    VARIANT_BOUNDS,
+    ImageProcessingError,
+    ImageProcessor,
+    get_image_processor,
+)
+
+try:  # Optional: native async S3 client
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session as get_aiobotocore_session
+except ImportError:  # Falls back to boto3 in worker threads
+    AioConfig = None
+    get_aiobotocore_session = None
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +60,30 @@ class UploadResult:
     size: int
     filename: str
     content_type: str
+    hash_md5: Optional[str] = None
+    deduplicated: bool = False  # True if an identical image was already stored
+    # Resized WebP renditions stored next to the original, keyed by name
+    variants: Dict[str, "UploadResult"] = field(default_factory=dict)
+
+    def variant_url(self, name: str) -> str:
+        """URL of the named variant, or the original if it wasn't generated."""
+        variant = self.variants.get(name)
+        return variant.url if variant else self.url
+
+
+class DatabaseImageIndex:
+    """Content-addressed lookup of stored images via images.hash_md5."""
+
+    async def find(self, hash_md5: str) -> Optional[pydantic_models.ImageInDB]:
+        _, session_maker = get_engine_and_session_maker()
+        async with session_maker() as session:
+            image = await ImageRepository(session).get_image_by_hash(hash_md5)
+        return pydantic_models.ImageInDB.model_validate(image) if image else None
+
+    async def record(self, image: pydantic_models.ImageCreate) -> None:
+        _, session_maker = get_engine_and_session_maker()
+        async with session_maker() as session:
+            await ImageRepository(session).create_image(image)
 
 
 class ImageStorageError(Exception):
@@ -81,6 +124,14 @@ class ImageStorage:
     MAX_SIZE_MB = 100  # Conservative limit (R2 supports up to 5TB per object)
     MAX_SIZE_BYTES = MAX_SIZE_MB * 1024 * 1024
 
+    # Streaming uploads buffer at most one part (S3 minimum is 5 MiB except
+    # the last), and only this many stream at once
+    PART_SIZE = 8 * 1024 * 1024
+    MAX_CONCURRENT_STREAMS = 4
+    # Attachments above this are stored as the original only; below it the
+    # bytes are read once more for WebP variants (Discord's default upload cap)
+    MAX_VARIANT_SOURCE_BYTES = 10 * 1024 * 1024
+
     ALLOWED_CONTENT_TYPES = {
         "image/jpeg": "jpg",
         "image/png": "png",
@@ -96,19 +147,85 @@ class ImageStorage:
         secret_access_key: str,
         bucket_name: str,
         public_url: str,
+        endpoint_url: Optional[str] = None,
+        image_index: Optional[DatabaseImageIndex] = None,
     ):
         self.bucket_name = bucket_name
+        # When set, identical bytes are stored once (looked up by MD5)
+        self.image_index = image_index
         self.public_url = public_url.rstrip("/")
+        self.endpoint_url = (
+            endpoint_url or f"https://{account_id}.r2.cloudflarestorage.com"
+        )
+        self._credentials = {
+            "aws_access_key_id": access_key_id,
+            "aws_secret_access_key": secret_access_key,
+            "region_name": "auto",  # R2 uses 'auto' region
+        }
+        self.s3_client = self._create_client()
+        self._stream_slots = asyncio.Semaphore(self.MAX_CONCURRENT_STREAMS)
+
+    def _create_client(self):
+        """Create S3 client configured for R2."""
+        return boto3.client("s3", endpoint_url=self.endpoint_url, **self._credentials)
+
+    # --- Transport hooks (overridden by AsyncImageStorage) ---
+
+    async def _put_object(self, **kwargs) -> Dict:
+        # Run in thread pool to avoid blocking
+        return await asyncio.to_thread(self.s3_client.put_object, **kwargs)
+
+    async def _delete_object(self, key: str) -> Dict:
+        return await asyncio.to_thread(
+            self.s3_client.delete_object, Bucket=self.bucket_name, Key=key
+        )
+
+    async def _head_object(self, key: str) -> Dict:
+        return await asyncio.to_thread(
+            self.s3_client.head_object, Bucket=self.bucket_name, Key=key
+        )
+
+    async def _create_multipart_upload(self, **kwargs) -> str:
+        response = await asyncio.to_thread(
+            self.s3_client.create_multipart_upload, **kwargs
+        )
+        return response["UploadId"]
+
+    async def _upload_part(
+        self, key: str, upload_id: str, part_number: int, body: bytes
+    ) -> str:
+        response = await asyncio.to_thread(
+            self.s3_client.upload_part,
+            Bucket=self.bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        return response["ETag"]
+
+    async def _complete_multipart_upload(
+        self, key: str, upload_id: str, parts: List[Dict]
+    ) -> Dict:
+        return await asyncio.to_thread(
+            self.s3_client.complete_multipart_upload,
+            Bucket=self.bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
 
-        # Create S3 client configured for R2
-        self.s3_client = boto3.client(
-            "s3",
-            endpoint_url=f"https://{account_id}.r2.cloudflarestorage.com",
-            aws_access_key_id=access_key_id,
-            aws_secret_access_key=secret_access_key,
-            region_name="auto",  # R2 uses 'auto' region
+    async def _abort_multipart_upload(self, key: str, upload_id: str) -> Dict:
+        return await asyncio.to_thread(
+            self.s3_client.abort_multipart_upload,
+            Bucket=self.bucket_name,
+            Key=key,
+            UploadId=upload_id,
         )
 
+    async def close(self) -> None:
+        """Release pooled connections (no-op for the threaded boto3 client)."""
+
     async def upload(
         self, image_bytes: bytes, filename: str, metadata: Optional[Dict] = None
     ) -> UploadResult:
@@ -140,6 +257,14 @@ class ImageStorage:
         if content_type not in self.ALLOWED_CONTENT_TYPES:
             raise ImageStorageError(f"Unsupported image type: {content_type}")
 
+        # Same bytes already in the vault: skip the put entirely
+        hash_md5 = hashlib.md5(image_bytes, usedforsecurity=False).hexdigest()
+        existing = await self._find_existing(hash_md5)
+        if existing is not None:
+            return self._existing_result(
+                existing, filename, content_type, len(image_bytes), hash_md5
+            )
+
         # Generate unique key
         ext = self._get_extension(filename, content_type)
         key = self._generate_key(filename, ext, metadata)
@@ -147,10 +272,9 @@ class ImageStorage:
         # Prepare metadata
         s3_metadata = self._prepare_metadata(metadata)
 
-        # Upload to R2 (run in thread pool to avoid blocking)
+        # Upload to R2
         try:
-            await asyncio.to_thread(
-                self.s3_client.put_object,
+            await self._put_object(
                 Bucket=self.bucket_name,
                 Key=key,
                 Body=image_bytes,
@@ -164,13 +288,16 @@ class ImageStorage:
 
             logger.info(f"Image uploaded to R2: {filename} ({size_mb:.2f}MB) -> {url}")
 
-            return UploadResult(
+            result = UploadResult(
                 url=url,
                 key=key,
                 size=len(image_bytes),
                 filename=filename,
                 content_type=content_type,
+                hash_md5=hash_md5,
             )
+            await self._record_upload(result, metadata)
+            return result
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
@@ -201,9 +328,7 @@ class ImageStorage:
             True if deleted successfully, False otherwise
         """
         try:
-            await asyncio.to_thread(
-                self.s3_client.delete_object, Bucket=self.bucket_name, Key=key
-            )
+            await self._delete_object(key)
             logger.info(f"Deleted image from R2: {key}")
             return True
 
@@ -222,9 +347,7 @@ class ImageStorage:
             Dictionary of metadata or None if not found
         """
         try:
-            response = await asyncio.to_thread(
-                self.s3_client.head_object, Bucket=self.bucket_name, Key=key
-            )
+            response = await self._head_object(key)
 
             return {
                 "size": response.get("ContentLength"),
@@ -236,6 +359,371 @@ class ImageStorage:
         except ClientError:
             return None
 
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        metadata: Optional[Dict] = None,
+    ) -> UploadResult:
+        """
+        Upload an image as it arrives, holding at most one part in memory.
+
+        Small images (under PART_SIZE) go up with a single put; larger ones
+        become an S3 multipart upload with one part per PART_SIZE bytes.
+
+        Args:
+            chunks: Async iterator of raw bytes (e.g. iter_url_chunks(url))
+            filename: Original filename (used for extension detection)
+            metadata: Optional metadata to store with object
+
+        Returns:
+            UploadResult with permanent CDN URL
+
+        Raises:
+            ImageTooLargeError: If the stream exceeds the size limit
+            BucketNotFoundError: If R2 bucket is inaccessible
+            UploadFailedError: If upload fails
+        """
+        async with self._stream_slots:
+            return await self._upload_stream(chunks, filename, metadata)
+
+    async def _upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        metadata: Optional[Dict],
+    ) -> UploadResult:
+        buffer = bytearray()
+        hasher = hashlib.md5(usedforsecurity=False)
+
+        async def hashed_chunks():
+            async for chunk in chunks:
+                hasher.update(chunk)
+                yield chunk
+
+        iterator = hashed_chunks().__aiter__()
+
+        # Fill the first part (or hit end of stream) to sniff the content type
+        exhausted = False
+        while len(buffer) < self.PART_SIZE:
+            try:
+                buffer += await iterator.__anext__()
+            except StopAsyncIteration:
+                exhausted = True
+                break
+
+        if exhausted:
+            # Fits in one part: a plain put is one request instead of three,
+            # and upload() checks the hash index before sending anything
+            return await self.upload(bytes(buffer), filename, metadata)
+
+        content_type = self._detect_content_type(bytes(buffer[:16]), filename)
+        if content_type not in self.ALLOWED_CONTENT_TYPES:
+            raise ImageStorageError(f"Unsupported image type: {content_type}")
+
+        key = self._generate_key(
+            filename, self._get_extension(filename, content_type), metadata
+        )
+        upload_id = None
+        total = 0
+        parts: List[Dict] = []
+        try:
+            upload_id = await self._create_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=key,
+                ContentType=content_type,
+                Metadata=self._prepare_metadata(metadata),
+                CacheControl="public, max-age=31536000",  # 1 year cache
+            )
+
+            async def send_part(body: bytes):
+                etag = await self._upload_part(key, upload_id, len(parts) + 1, body)
+                parts.append({"PartNumber": len(parts) + 1, "ETag": etag})
+
+            while True:
+                while len(buffer) >= self.PART_SIZE:
+                    part = bytes(buffer[: self.PART_SIZE])
+                    del buffer[: self.PART_SIZE]
+                    total += len(part)
+                    await send_part(part)
+                if exhausted:
+                    break
+                try:
+                    buffer += await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                if total + len(buffer) > self.MAX_SIZE_BYTES:
+                    raise ImageTooLargeError(
+                        f"Image exceeds {self.MAX_SIZE_MB}MB limit while streaming"
+                    )
+
+            if buffer:
+                total += len(buffer)
+                await send_part(bytes(buffer))
+                buffer.clear()
+
+            # Dedup can only happen here, after the parts went up: the MD5
+            # covers the whole body, and knowing it up front would mean
+            # holding all of it in memory, which streaming exists to avoid.
+            # Large duplicates still cost the transfer, but not the storage.
+            hash_md5 = hasher.hexdigest()
+            existing = await self._find_existing(hash_md5)
+            if existing is not None:
+                # Already stored: drop the parts instead of keeping a duplicate
+                await self._abort_multipart_upload(key, upload_id)
+                return self._existing_result(
+                    existing, filename, content_type, total, hash_md5
+                )
+
+            await self._complete_multipart_upload(key, upload_id, parts)
+
+        except Exception as e:
+            if upload_id is not None:
+                try:
+                    await self._abort_multipart_upload(key, upload_id)
+                except Exception as abort_error:
+                    logger.error(
+                        f"Failed to abort multipart upload {key}: {abort_error}"
+                    )
+            if isinstance(e, ImageStorageError):
+                raise
+            if isinstance(e, ClientError):
+                error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                if error_code == "NoSuchBucket":
+                    raise BucketNotFoundError(
+                        f"Bucket '{self.bucket_name}' not found. Check R2 configuration."
+                    )
+                raise UploadFailedError(
+                    f"R2 multipart upload failed: {error_code} - {e}"
+                )
+            raise UploadFailedError(f"Unexpected upload error: {e}")
+
+        url = f"{self.public_url}/{key}"
+        logger.info(
+            f"Image streamed to R2: {filename} ({total / (1024 * 1024):.2f}MB, "
+            f"{len(parts)} parts) -> {url}"
+        )
+        result = UploadResult(
+            url=url,
+            key=key,
+            size=total,
+            filename=filename,
+            content_type=content_type,
+            hash_md5=hash_md5,
+        )
+        await self._record_upload(result, metadata)
+        return result
+
+    async def _find_existing(
+        self, hash_md5: str
+    ) -> Optional[pydantic_models.ImageInDB]:
+        if self.image_index is None:
+            return None
+        try:
+            return await self.image_index.find(hash_md5)
+        except Exception as e:
+            # Dedup is an optimization; never fail an upload over it
+            logger.warning(f"Image hash lookup failed, uploading anyway: {e}")
+            return None
+
+    def _existing_result(
+        self,
+        existing: pydantic_models.ImageInDB,
+        filename: str,
+        content_type: str,
+        size: int,
+        hash_md5: str,
+    ) -> UploadResult:
+        url = existing.img_graphics_vault_link
+        logger.info(f"Image {filename} already stored ({hash_md5}) -> {url}")
+        return UploadResult(
+            url=url,
+            key=url.removeprefix(f"{self.public_url}/"),
+            size=size,
+            filename=filename,
+            content_type=content_type,
+            hash_md5=hash_md5,
+            deduplicated=True,
+        )
+
+    async def _record_upload(
+        self, result: UploadResult, metadata: Optional[Dict]
+    ) -> None:
+        """Register a new object in the images table so later uploads find it."""
+        if self.image_index is None:
+            return
+        metadata = metadata or {}
+        try:
+            await self.image_index.record(
+                pydantic_models.ImageCreate(
+                    img_origin_link=metadata.get("origin_url") or result.url,
+                    img_graphics_vault_link=result.url,
+                    original_filename=result.filename[:256],
+                    uploaded_by_user_id=metadata.get("user_id"),
+                    source_system=metadata.get("source", "discord"),
+                    ownership_context=metadata.get("ownership", "user"),
+                    usage_context=metadata.get("context", "general"),
+                    entity_type=metadata.get("entity_type"),
+                    entity_id=metadata.get("entity_id"),
+                    is_animated=result.content_type == "image/gif",
+                    hash_md5=result.hash_md5,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record image {result.key}: {e}")
+
+    async def upload_portrait(
+        self,
+        image_bytes: bytes,
+        filename: str,
+        metadata: Optional[Dict] = None,
+        processor: Optional[ImageProcessor] = None,
+    ) -> UploadResult:
+        """
+        Upload an original image plus its normalized WebP variants.
+
+        Variants live next to the original ({key}_{variant}.webp), so a
+        deduplicated original finds its variants without reprocessing. A
+        processing failure still returns the stored original.
+        """
+        result = await self.upload(image_bytes, filename, metadata)
+        if await self._needs_variants(result):
+            await self._store_variants(
+                result, image_bytes, filename, metadata, processor
+            )
+        return result
+
+    async def upload_attachment_portrait(
+        self,
+        attachment,
+        metadata: Optional[Dict] = None,
+        processor: Optional[ImageProcessor] = None,
+    ) -> UploadResult:
+        """
+        Stream a Discord attachment into R2 as a portrait.
+
+        The original always goes through upload_attachment (bounded memory).
+        Variants are only generated for processable images up to
+        MAX_VARIANT_SOURCE_BYTES; that read holds a stream slot, so at most
+        MAX_CONCURRENT_STREAMS sources are in memory at once.
+        """
+        result = await self.upload_attachment(attachment, metadata)
+        if (attachment.size or result.size) > self.MAX_VARIANT_SOURCE_BYTES:
+            logger.info(f"Keeping original only for large {attachment.filename}")
+            return result
+        if await self._needs_variants(result):
+            metadata = {"origin_url": attachment.url, **(metadata or {})}
+            async with self._stream_slots:
+                try:
+                    image_bytes = await attachment.read()
+                except Exception as e:
+                    # The original is already stored; don't lose it over variants
+                    logger.warning(
+                        f"Keeping original only for {attachment.filename}: {e}"
+                    )
+                    return result
+                await self._store_variants(
+                    result, image_bytes, attachment.filename, metadata, processor
+                )
+        return result
+
+    async def _needs_variants(self, result: UploadResult) -> bool:
+        """
+        Whether variants still have to be generated for an uploaded original.
+        A deduplicated original whose variants already exist gets them attached.
+        """
+        if result.content_type not in PROCESSABLE_CONTENT_TYPES:
+            return False
+
+        variant_keys = {
+            name: self._variant_key(result.key, name) for name in VARIANT_BOUNDS
+        }
+        if result.deduplicated and all(
+            [await self.get_metadata(key) for key in variant_keys.values()]
+        ):
+            result.variants = {
+                name: UploadResult(
+                    url=f"{self.public_url}/{key}",
+                    key=key,
+                    size=0,
+                    filename=result.filename,
+                    content_type="image/webp",
+                )
+                for name, key in variant_keys.items()
+            }
+            return False
+        return True
+
+    async def _store_variants(
+        self,
+        result: UploadResult,
+        image_bytes: bytes,
+        filename: str,
+        metadata: Optional[Dict],
+        processor: Optional[ImageProcessor],
+    ) -> None:
+        """Render and upload the WebP variants; failures keep the original only."""
+        try:
+            variants = await (processor or get_image_processor()).process(image_bytes)
+        except ImageProcessingError as e:
+            logger.warning(f"Keeping original only for {filename}: {e}")
+            return
+        except Exception as e:
+            # e.g. BrokenProcessPool or OSError from the worker pool
+            logger.error(f"Unexpected error processing {filename}: {e}")
+            return
+
+        async def put_variant(variant) -> UploadResult:
+            key = self._variant_key(result.key, variant.name)
+            await self._put_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Body=variant.data,
+                ContentType=variant.content_type,
+                CacheControl="public, max-age=31536000",
+                Metadata=self._prepare_metadata(metadata),
+            )
+            return UploadResult(
+                url=f"{self.public_url}/{key}",
+                key=key,
+                size=len(variant.data),
+                filename=filename,
+                content_type=variant.content_type,
+            )
+
+        try:
+            uploaded = await asyncio.gather(
+                *(put_variant(v) for v in variants.values())
+            )
+        except ClientError as e:
+            logger.warning(f"Variant upload failed for {filename}: {e}")
+            return
+        except Exception as e:
+            logger.error(f"Unexpected error uploading variants for {filename}: {e}")
+            return
+
+        result.variants = dict(zip(variants, uploaded))
+        sizes = ", ".join(f"{n}={u.size}B" for n, u in result.variants.items())
+        logger.info(f"Portrait variants stored for {filename}: {sizes}")
+
+    @staticmethod
+    def _variant_key(key: str, name: str) -> str:
+        return f"{key.rsplit('.', 1)[0]}_{name}.webp"
+
+    async def upload_attachment(
+        self, attachment, metadata: Optional[Dict] = None
+    ) -> UploadResult:
+        """Stream a Discord attachment straight from the CDN into R2."""
+        if attachment.size and attachment.size > self.MAX_SIZE_BYTES:
+            raise ImageTooLargeError(
+                f"Image size {attachment.size / (1024 * 1024):.2f}MB exceeds "
+                f"{self.MAX_SIZE_MB}MB limit"
+            )
+        metadata = {"origin_url": attachment.url, **(metadata or {})}
+        return await self.upload_stream(
+            iter_url_chunks(attachment.url), attachment.filename, metadata
+        )
+
     async def upload_with_fallback(
         self, image_bytes: bytes, filename: str, metadata: Optional[Dict] = None
     ) -> str:
@@ -261,6 +749,33 @@ class ImageStorage:
             logger.error(f"Unexpected error uploading {filename}: {e}")
             return settings.DEFAULT_PORTRAIT_URL
 
+    async def upload_attachment_with_fallback(
+        self, attachment, metadata: Optional[Dict] = None
+    ) -> str:
+        """
+        Stream a Discord attachment into R2 as a portrait (see
+        upload_attachment_portrait).
+
+        Returns:
+            Embed-sized permanent URL or default portrait URL if upload fails
+        """
+        filename = attachment.filename
+        try:
+            result = await self.upload_attachment_portrait(attachment, metadata)
+            return result.variant_url("embed")
+
+        except ImageTooLargeError as e:
+            logger.warning(f"Image too large for {filename}: {e}")
+            return settings.DEFAULT_PORTRAIT_URL
+
+        except (BucketNotFoundError, UploadFailedError) as e:
+            logger.error(f"R2 upload failed for {filename}: {e}")
+            return settings.DEFAULT_PORTRAIT_URL
+
+        except Exception as e:
+            logger.error(f"Unexpected error uploading {filename}: {e}")
+            return settings.DEFAULT_PORTRAIT_URL
+
     def _detect_content_type(self, image_bytes: bytes, filename: str) -> str:
         """Detect content type from magic bytes or filename."""
         # Check magic bytes
@@ -327,19 +842,137 @@ class ImageStorage:
         return s3_metadata
 
 
+async def iter_url_chunks(
+    url: str, chunk_size: int = 256 * 1024
+) -> AsyncIterator[bytes]:
+    """Yield a remote file (e.g. a Discord attachment) in chunks as it downloads."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+
+
+class AsyncImageStorage(ImageStorage):
+    """
+    ImageStorage on a native async S3 client (aiobotocore).
+
+    One client, and so one pooled aiohttp connector, is opened lazily on first
+    use and shared by every call; no executor threads are involved.
+    """
+
+    MAX_POOL_CONNECTIONS = 20
+
+    def __init__(self, *args, **kwargs):
+        if get_aiobotocore_session is None:
+            raise ImageStorageError("aiobotocore is not installed")
+        self._client_cm = None
+        self._client = None
+        self._client_lock = asyncio.Lock()
+        super().__init__(*args, **kwargs)
+
+    def _create_client(self):
+        # Opened lazily in _get_client(); nothing is built at construction
+        return None
+
+    async def _get_client(self):
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    session = get_aiobotocore_session()
+                    self._client_cm = session.create_client(
+                        "s3",
+                        endpoint_url=self.endpoint_url,
+                        config=AioConfig(
+                            max_pool_connections=self.MAX_POOL_CONNECTIONS
+                        ),
+                        **self._credentials,
+                    )
+                    self._client = await self._client_cm.__aenter__()
+        return self._client
+
+    async def _put_object(self, **kwargs) -> Dict:
+        client = await self._get_client()
+        return await client.put_object(**kwargs)
+
+    async def _delete_object(self, key: str) -> Dict:
+        client = await self._get_client()
+        return await client.delete_object(Bucket=self.bucket_name, Key=key)
+
+    async def _head_object(self, key: str) -> Dict:
+        client = await self._get_client()
+        return await client.head_object(Bucket=self.bucket_name, Key=key)
+
+    async def _create_multipart_upload(self, **kwargs) -> str:
+        client = await self._get_client()
+        response = await client.create_multipart_upload(**kwargs)
+        return response["UploadId"]
+
+    async def _upload_part(
+        self, key: str, upload_id: str, part_number: int, body: bytes
+    ) -> str:
+        client = await self._get_client()
+        response = await client.upload_part(
+            Bucket=self.bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        return response["ETag"]
+
+    async def _complete_multipart_upload(
+        self, key: str, upload_id: str, parts: List[Dict]
+    ) -> Dict:
+        client = await self._get_client()
+        return await client.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+
+    async def _abort_multipart_upload(self, key: str, upload_id: str) -> Dict:
+        client = await self._get_client()
+        return await client.abort_multipart_upload(
+            Bucket=self.bucket_name, Key=key, UploadId=upload_id
+        )
+
+    async def close(self) -> None:
+        if self._client_cm is not None:
+            await self._client_cm.__aexit__(None, None, None)
+        self._client_cm = None
+        self._client = None
+
+
 # Singleton instance
 _storage_instance: Optional[ImageStorage] = None
 
 
 def get_image_storage() -> ImageStorage:
-    """Get or create the global ImageStorage instance."""
+    """
+    Get or create the global ImageStorage instance.
+    Uses the native async backend when aiobotocore is installed.
+    """
     global _storage_instance
     if _storage_instance is None:
-        _storage_instance = ImageStorage(
+        storage_class = (
+            AsyncImageStorage if get_aiobotocore_session is not None else ImageStorage
+        )
+        _storage_instance = storage_class(
             account_id=settings.R2_ACCOUNT_ID,
             access_key_id=settings.R2_ACCESS_KEY_ID,
             secret_access_key=settings.R2_SECRET_ACCESS_KEY,
             bucket_name=settings.R2_BUCKET_NAME,
             public_url=settings.R2_PUBLIC_URL,
+            image_index=DatabaseImageIndex(),
         )
     return _storage_instance
+
+
+async def close_image_storage() -> None:
+    """Close the global instance's pooled connections, if it was created."""
+    global _storage_instance
+    if _storage_instance is not None:
+        await _storage_instance.close()
+        _storage_instance = None
@@ -0,0 +1,201 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+MCP Outbox
+Workflow requests for the MCP server are written to the mcp_outbox table in
+the same transaction as the change that causes them, and delivered later by
+a background dispatcher. User-facing flows never wait on the MCP server, and
+a committed change is never left without its workflow (at-least-once).
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.database import get_engine_and_session_maker
+from db.repositories import MCPOutboxRepository
+from integrations.mcp_client import MCPWorkflowTrigger, get_mcp_client
+
+logger = logging.getLogger(__name__)
+
+PORTRAIT_GENERATION_ENDPOINT = "/webhooks/portrait-generation"
+
+
+class MCPOutbox:
+    """Stages MCP workflow requests alongside other writes."""
+
+    def __init__(self, db: AsyncSession, autocommit: bool = True):
+        self.repository = MCPOutboxRepository(db, autocommit=autocommit)
+
+    async def enqueue(self, endpoint: str, payload: Dict[str, Any]) -> int:
+        entry = await self.repository.enqueue(endpoint, payload)
+        return entry.id
+
+    async def enqueue_portrait_generation(self, character) -> int:
+        """Same payload as MCPWorkflowTrigger.trigger_portrait_generation."""
+        return await self.enqueue(
+            PORTRAIT_GENERATION_ENDPOINT,
+            {
+                "character_id": character.id,
+                "character": {
+                    "name": character.name,
+                    "race": character.race.value,
+                    "class": character.class_name.value,
+                    "personality": character.personality,
+                    "trait_1": character.trait_1,
+                    "trait_2": character.trait_2,
+                    "trait_3": character.trait_3,
+                },
+            },
+        )
+
+
+class OutboxDispatcher:
+    """
+    Background task delivering outbox entries to the MCP server.
+
+    Each round leases a batch of due entries, sends them concurrently, deletes
+    the delivered ones and reschedules failures with exponential backoff.
+    Entries that still fail after `max_attempts` are dropped with an error log.
+
+    Args:
+        client: MCP client (defaults to the shared instance)
+        batch_size: Entries leased per round
+        poll_interval: Seconds between rounds when idle
+        lease_seconds: How long a claimed entry stays hidden from other rounds
+        max_attempts: Deliveries tried before an entry is abandoned
+        retry_backoff: Base delay (seconds) for rescheduling a failed entry
+        session_maker: Session factory (defaults to the app's factory)
+    """
+
+    MAX_BACKOFF_SECONDS = 3600
+
+    def __init__(
+        self,
+        client: Optional[MCPWorkflowTrigger] = None,
+        batch_size: int = 20,
+        poll_interval: float = 5.0,
+        lease_seconds: float = 120.0,
+        max_attempts: int = 12,
+        retry_backoff: float = 30.0,
+        session_maker=None,
+    ):
+        self._client = client
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self._session_maker = session_maker
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def client(self) -> MCPWorkflowTrigger:
+        return self._client or get_mcp_client()
+
+    def _sessions(self):
+        if self._session_maker is None:
+            _, self._session_maker = get_engine_and_session_maker()
+        return self._session_maker()
+
+    def wake(self) -> None:
+        """Deliver without waiting for the next poll (call after committing)."""
+        self._wakeup.set()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="mcp-outbox")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                delivered = await self.dispatch_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"MCP outbox dispatch failed: {e}")
+                delivered = 0
+            # A full batch suggests a backlog: go again straight away
+            if delivered < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    async def dispatch_once(self) -> int:
+        """Deliver one batch of due entries; returns how many succeeded."""
+        async with self._sessions() as session:
+            outbox = MCPOutboxRepository(session)
+            entries = await outbox.claim_batch(self.batch_size, self.lease_seconds)
+            if not entries:
+                return 0
+
+            outcomes = await asyncio.gather(*(self._deliver(entry) for entry in entries))
+
+            finished = []
+            for entry, error in zip(entries, outcomes):
+                if error is None:
+                    finished.append(entry.id)
+                elif entry.attempts >= self.max_attempts:
+                    logger.error(
+                        f"Dropping MCP outbox entry {entry.id} ({entry.endpoint}) "
+                        f"after {entry.attempts} attempts: {error}"
+                    )
+                    finished.append(entry.id)
+                else:
+                    delay = min(
+                        self.retry_backoff * 2 ** (entry.attempts - 1),
+                        self.MAX_BACKOFF_SECONDS,
+                    )
+                    await outbox.reschedule(entry.id, delay, error)
+            await outbox.delete_entries(finished)
+
+        delivered = outcomes.count(None)
+        logger.info(f"MCP outbox delivered {delivered}/{len(entries)} entries")
+        return delivered
+
+    async def _deliver(self, entry) -> Optional[str]:
+        """Send one entry; returns None on success or the error message."""
+        try:
+            await self.client.send_workflow(entry.endpoint, entry.payload)
+            return None
+        except Exception as e:
+            # Anything escaping here would abandon the whole leased batch
+            return str(e) or type(e).__name__
+
+
+_dispatcher: Optional[OutboxDispatcher] = None
+
+
+def get_outbox_dispatcher() -> OutboxDispatcher:
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = OutboxDispatcher()
+    return _dispatcher
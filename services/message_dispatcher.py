@@ -0,0 +1,97 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Message Dispatcher
+Routes incoming messages to the interactive flow waiting on that
+(channel_id, author_id) with one dict lookup, instead of discord.py running
+every pending wait_for check predicate against every guild message.
+"""
+
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+MessageCheck = Callable[[discord.Message], bool]
+
+
+class MessageDispatcher:
+    """
+    Waiters keyed by (channel_id, author_id).
+    Installed on the bot as ``bot.message_dispatcher`` and fed from on_message.
+    """
+
+    def __init__(self):
+        self._waiters: Dict[
+            Tuple[int, int], List[Tuple[asyncio.Future, Optional[MessageCheck]]]
+        ] = {}
+
+    async def wait_for_message(
+        self,
+        channel_id: int,
+        author_id: int,
+        timeout: Optional[float] = None,
+        check: Optional[MessageCheck] = None,
+    ) -> discord.Message:
+        """
+        Wait for the next message by author_id in channel_id.
+
+        Args:
+            channel_id: Channel the message must arrive in
+            author_id: User who must send it
+            timeout: Seconds to wait (raises asyncio.TimeoutError)
+            check: Optional extra predicate (e.g. "has attachments")
+        """
+        key = (channel_id, author_id)
+        future = asyncio.get_running_loop().create_future()
+        waiter = (future, check)
+        self._waiters.setdefault(key, []).append(waiter)
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            waiters = self._waiters.get(key)
+            if waiters is not None:
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[key]
+
+    def dispatch(self, message: discord.Message) -> bool:
+        """Resolve every waiter for this channel/author whose check passes."""
+        waiters = self._waiters.get((message.channel.id, message.author.id))
+        if not waiters:
+            return False
+
+        delivered = False
+        for future, check in list(waiters):
+            if future.done():
+                continue
+            try:
+                if check is not None and not check(message):
+                    continue
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            future.set_result(message)
+            delivered = True
+        return delivered
+
+    def __len__(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
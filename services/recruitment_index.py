@@ -0,0 +1,102 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Recruitment Index
+In-memory map from recruitment message/thread IDs to character IDs,
+so officer buttons resolve their character without a database round trip.
+"""
+
+import logging
+from typing import Dict, Optional, Set
+
+from db.database import get_engine_and_session_maker
+from domain import events
+from services.character_service import CharacterService
+
+logger = logging.getLogger(__name__)
+
+
+class RecruitmentIndex:
+    """Maps Discord message and thread IDs of recruitment posts to character IDs."""
+
+    def __init__(self):
+        self._character_by_discord_id: Dict[int, int] = {}
+        self._discord_ids_by_character: Dict[int, Set[int]] = {}
+
+    def register(self, character_id: int, *discord_ids: Optional[int]) -> None:
+        """Remember the message/thread IDs of a character's recruitment post."""
+        for discord_id in discord_ids:
+            if not discord_id:
+                continue
+            self._character_by_discord_id[int(discord_id)] = character_id
+            self._discord_ids_by_character.setdefault(character_id, set()).add(
+                int(discord_id)
+            )
+
+    def resolve(self, *discord_ids: Optional[int]) -> Optional[int]:
+        """Return the character ID for the first known message/thread ID."""
+        for discord_id in discord_ids:
+            if discord_id and discord_id in self._character_by_discord_id:
+                return self._character_by_discord_id[discord_id]
+        return None
+
+    def forget(self, character_id: int) -> None:
+        """Drop a character once its application is no longer pending."""
+        for discord_id in self._discord_ids_by_character.pop(character_id, set()):
+            self._character_by_discord_id.pop(discord_id, None)
+
+    def clear(self) -> None:
+        self._character_by_discord_id.clear()
+        self._discord_ids_by_character.clear()
+
+    async def warm(self) -> int:
+        """Load every pending recruitment post with a single query."""
+        _, session_maker = get_engine_and_session_maker()
+        async with session_maker() as session:
+            service = CharacterService(session)
+            refs = await service.get_pending_recruitment_refs()
+
+        for character_id, recruitment_msg_id, forum_post_id in refs:
+            self.register(character_id, recruitment_msg_id, forum_post_id)
+        logger.info(f"Recruitment index warmed with {len(refs)} pending character(s)")
+        return len(refs)
+
+    def __len__(self) -> int:
+        return len(self._discord_ids_by_character)
+
+
+# Singleton instance
+_recruitment_index = RecruitmentIndex()
+
+
+def get_recruitment_index() -> RecruitmentIndex:
+    """Get the process-wide recruitment index."""
+    return _recruitment_index
+
+
+def _on_character_approved(event: events.CharacterApproved) -> None:
+    _recruitment_index.forget(event.character_id)
+
+
+def _on_row_changed(event: events.RowChanged) -> None:
+    # Deleted elsewhere (API, MCP server): stop resolving its buttons from memory
+    if event.table == "characters" and event.op == "DELETE":
+        _recruitment_index.forget(int(event.row_id))
+
+
+events.subscribe(events.CharacterApproved, _on_character_approved)
+events.subscribe(events.RowChanged, _on_row_changed)
@@ -0,0 +1,183 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Registration Drafts
+Persists in-progress registration answers so a redeploy doesn't lose them.
+Saves are debounced per user and written as a single upsert; failures are
+logged and never interrupt the registration itself.
+"""
+
+import asyncio
+import logging
+import weakref
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from config.settings import get_settings
+from db.database import get_engine_and_session_maker
+from db.repositories import RegistrationDraftRepository
+from models import pydantic_models
+
+logger = logging.getLogger(__name__)
+
+
+class RegistrationDraftStore:
+    """
+    Debounced writer and loader for registration drafts.
+
+    Args:
+        delay: Seconds to wait for further saves before writing (coalesces bursts)
+        session_maker: Session factory (defaults to the app's factory)
+    """
+
+    def __init__(self, delay: float = 2.0, session_maker=None):
+        self.delay = delay
+        self._session_maker = session_maker
+        # Latest unsaved snapshot and its pending writer task, per user
+        self._pending: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+        # Serializes a user's upserts with discard() so a write already in
+        # flight cannot land after the delete and resurrect the draft. Weak
+        # values: a lock goes away once nobody holds or waits for it
+        self._locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    def _sessions(self):
+        if self._session_maker is None:
+            _, self._session_maker = get_engine_and_session_maker()
+        return self._session_maker()
+
+    def save(self, discord_user_id: int, step: str, data: Dict[str, Any]) -> None:
+        """Schedule a write of the user's draft; later saves replace earlier ones."""
+        self._pending[discord_user_id] = (step, dict(data))
+        if discord_user_id not in self._tasks:
+            self._tasks[discord_user_id] = asyncio.create_task(
+                self._write_later(discord_user_id)
+            )
+
+    async def _write_later(self, discord_user_id: int) -> None:
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            # A flush may already have replaced this task with a newer one
+            if self._tasks.get(discord_user_id) is asyncio.current_task():
+                del self._tasks[discord_user_id]
+        await self._write(discord_user_id)
+
+    def _lock(self, discord_user_id: int) -> asyncio.Lock:
+        return self._locks.setdefault(discord_user_id, asyncio.Lock())
+
+    async def _write(self, discord_user_id: int) -> None:
+        async with self._lock(discord_user_id):
+            # Taken under the lock: a discard() that ran meanwhile dropped it
+            snapshot = self._pending.pop(discord_user_id, None)
+            if snapshot is None:
+                return
+            step, data = snapshot
+            try:
+                async with self._sessions() as session:
+                    await RegistrationDraftRepository(session).upsert_draft(
+                        discord_user_id, step, data
+                    )
+            except Exception as e:
+                logger.error(
+                    f"Failed to save registration draft for {discord_user_id}: {e}"
+                )
+
+    async def flush(self, discord_user_id: Optional[int] = None) -> None:
+        """Write pending drafts now (one user, or all of them on shutdown)."""
+        if discord_user_id is not None:
+            user_ids = [discord_user_id]
+        else:
+            user_ids = list(self._pending)
+        for user_id in user_ids:
+            task = self._tasks.pop(user_id, None)
+            if task is not None:
+                task.cancel()
+            await self._write(user_id)
+
+    async def load(
+        self, discord_user_id: int
+    ) -> Optional[pydantic_models.RegistrationDraftInDB]:
+        """The user's saved draft, if any and not yet expired."""
+        await self.flush(discord_user_id)
+        try:
+            async with self._sessions() as session:
+                draft = await RegistrationDraftRepository(session).get_draft(
+                    discord_user_id
+                )
+        except Exception as e:
+            logger.error(
+                f"Failed to load registration draft for {discord_user_id}: {e}"
+            )
+            return None
+        if draft is None or draft.updated_at < _expiry_cutoff():
+            return None
+        return pydantic_models.RegistrationDraftInDB.model_validate(draft)
+
+    async def discard(self, discord_user_id: int) -> None:
+        """Forget the user's draft (registration finished or abandoned)."""
+        task = self._tasks.pop(discord_user_id, None)
+        if task is not None:
+            task.cancel()
+        self._pending.pop(discord_user_id, None)
+        # Waits for an upsert that is already running, then deletes after it
+        async with self._lock(discord_user_id):
+            try:
+                async with self._sessions() as session:
+                    await RegistrationDraftRepository(session).delete_draft(
+                        discord_user_id
+                    )
+            except Exception as e:
+                logger.error(
+                    f"Failed to discard registration draft for {discord_user_id}: {e}"
+                )
+
+    async def purge_expired(self) -> int:
+        """Delete drafts untouched for REGISTRATION_DRAFT_TTL_HOURS."""
+        async with self._sessions() as session:
+            return await RegistrationDraftRepository(session).delete_drafts_older_than(
+                _expiry_cutoff()
+            )
+
+
+def _expiry_cutoff() -> datetime:
+    ttl = timedelta(hours=get_settings().REGISTRATION_DRAFT_TTL_HOURS)
+    return datetime.now(timezone.utc) - ttl
+
+
+async def run_draft_cleanup(interval_seconds: float = 3600) -> None:
+    """Background job: purge expired drafts every interval, forever."""
+    while True:
+        try:
+            purged = await get_draft_store().purge_expired()
+            if purged:
+                logger.info(f"Purged {purged} expired registration draft(s)")
+        except Exception as e:
+            logger.error(f"Registration draft cleanup failed: {e}")
+        await asyncio.sleep(interval_seconds)
+
+
+_draft_store: Optional[RegistrationDraftStore] = None
+
+
+def get_draft_store() -> RegistrationDraftStore:
+    global _draft_store
+    if _draft_store is None:
+        _draft_store = RegistrationDraftStore()
+    return _draft_store
@@ -0,0 +1,102 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Unit of Work
+One session, one transaction: services opened through a UnitOfWork
+stage their writes and the whole batch commits once on exit.
+"""
+
+import logging
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.database import get_engine_and_session_maker
+from services.character_service import CharacterService, GraveyardService
+from services.mcp_outbox import MCPOutbox
+
+logger = logging.getLogger(__name__)
+
+
+class UnitOfWork:
+    """
+    Async context manager grouping several service calls into one transaction.
+
+    Usage:
+        async with UnitOfWork() as uow:
+            await uow.characters.update_character(char_id, update_data)
+            await uow.graveyard.create_graveyard_entry(entry)
+        # committed here; rolled back if the block raised
+
+    Args:
+        session_maker: Session factory to use (defaults to the app's factory)
+    """
+
+    def __init__(self, session_maker=None):
+        self._session_maker = session_maker
+        self._session_cm = None
+        self.session: Optional[AsyncSession] = None
+        self.characters: Optional[CharacterService] = None
+        self.graveyard: Optional[GraveyardService] = None
+        self.outbox: Optional[MCPOutbox] = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        session_maker = self._session_maker
+        if session_maker is None:
+            _, session_maker = get_engine_and_session_maker()
+
+        self._session_cm = session_maker()
+        self.session = await self._session_cm.__aenter__()
+        self.characters = CharacterService(self.session, autocommit=False)
+        self.graveyard = GraveyardService(self.session, autocommit=False)
+        self.outbox = MCPOutbox(self.session, autocommit=False)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                logger.warning(f"Rolling back unit of work: {exc!r}")
+                await self.rollback()
+        finally:
+            await self._session_cm.__aexit__(exc_type, exc, tb)
+        # Never swallow the caller's exception
+        return False
+
+    async def commit(self):
+        """
+        Commit everything staged so far.
+        Call this early when later steps (e.g. Discord posts) need the rows visible.
+        """
+        try:
+            await self.session.commit()
+        except BaseException:
+            self.characters.discard_events()
+            raise
+        finally:
+            # Only now can other sessions see the writes; drop what they cached
+            self.characters.run_invalidations()
+        # Subscribers only hear about writes that actually happened
+        await self.characters.publish_events()
+
+    async def rollback(self):
+        self.characters.discard_events()
+        try:
+            await self.session.rollback()
+        finally:
+            self.characters.run_invalidations()
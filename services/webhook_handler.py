@@ -3,11 +3,12 @@ import logging
 import json
 from aiohttp import web
 from config.settings import get_settings
-from utils.embed_parser import parse_embed_json, build_cemetery_embed
+from utils.embed_parser import parse_embed_json, build_cemetery_embed, pack_embeds
 from services.character_service import CharacterService
 from db.database import get_engine_and_session_maker
 import discord
 from views.officer_view import OfficerControlView
+from services.recruitment_index import get_recruitment_index
 from models.pydantic_models import CharacterUpdate
 
 logger = logging.getLogger(__name__)
@@ -115,18 +116,23 @@ async def handle_post_to_recruitment(character_data, discord_bot=None):
                     discord.Object(id=settings.RECRUITMENT_DEFAULT_TAG_ID)
                 )
 
+            # Most sheets fit in the starter message, so the post is one API call
+            packed = pack_embeds(embeds)
             thread_with_message = await channel.create_thread(
                 name=thread_name,
                 content=content,
-                embed=embeds[0] if embeds else None,
+                embeds=packed[0] if packed else discord.utils.MISSING,
                 applied_tags=applied_tags if applied_tags else discord.utils.MISSING,
             )
             message = thread_with_message.message
             forum_thread_id = thread_with_message.thread.id
-            if len(embeds) > 1:
-                await thread_with_message.thread.send(embeds=embeds[1:])
+            for batch in packed[1:]:
+                await thread_with_message.thread.send(embeds=batch)
         else:
-            message = await channel.send(content=content, embeds=embeds)
+            packed = pack_embeds(embeds) or [[]]
+            message = await channel.send(content=content, embeds=packed[0])
+            for batch in packed[1:]:
+                await channel.send(embeds=batch)
             if hasattr(message, "create_thread"):
                 await message.create_thread(name=f"Discussion: {char_name}")
 
@@ -134,6 +140,7 @@ async def handle_post_to_recruitment(character_data, discord_bot=None):
         if char_id:
             view = OfficerControlView(bot_instance, int(char_id))
             await message.edit(view=view)
+            get_recruitment_index().register(int(char_id), message.id, forum_thread_id)
 
             # Update DB with recruitment message ID and forum post ID if needed
             _, session_maker = get_engine_and_session_maker()
@@ -143,7 +150,6 @@ async def handle_post_to_recruitment(character_data, discord_bot=None):
                 if forum_thread_id:
                     update_data.forum_post_id = forum_thread_id
                 await service.update_character(int(char_id), update_data)
-                await session.commit()
 
         logger.info(
             f"✅ Recruitment post created for {char_name}, msg_id={message.id}, forum_post_id={forum_thread_id}"
@@ -228,7 +234,8 @@ async def handle_initiate_burial(character_data, discord_bot=None):
 
         if original_embeds:
             logger.info(f"Sending {len(original_embeds)} embed(s) to cemetery thread")
-            await cemetery_thread_msg.thread.send(embeds=original_embeds)
+            for batch in pack_embeds(original_embeds):
+                await cemetery_thread_msg.thread.send(embeds=batch)
         else:
             logger.warning(f"No embeds to send to cemetery for {char_name}")
 
@@ -9,6 +9,7 @@ from schemas.db_schemas import (
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 from db.repositories import CharacterRepository
+from typing import List
 from uuid import uuid4
 
 # Use pytest_asyncio.fixture for async fixtures
@@ -120,3 +121,136 @@ async def test_bury_character_api(async_client: AsyncClient, test_character: Cha
     graveyard_entry = response.json()
     assert graveyard_entry["character_id"] == test_character.id
     assert graveyard_entry["cause_of_death"] == cause_of_death
+
+
+@pytest.mark.asyncio
+async def test_list_characters_matches_response_model(
+    async_client: AsyncClient, test_character: Character
+):
+    from models.pydantic_models import CharacterInDB
+
+    response = await async_client.get("/characters/", params={"limit": 1000})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+    listed = {c["id"]: c for c in response.json()}
+    expected = CharacterInDB.model_validate(test_character).model_dump(
+        mode="json", by_alias=True
+    )
+    # Fast path emits exactly what response_model serialization would
+    assert listed[test_character.id] == expected
+    assert listed[test_character.id]["class"] == "Paladin"
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark
+@pytest.mark.parametrize("row_count", [100, 1000])
+async def test_list_characters_benchmark(
+    async_client: AsyncClient, async_session: AsyncSession, row_count: int
+):
+    """GET /characters at roster scale, against the validate-twice legacy path."""
+    import json
+    import time
+
+    from pydantic import TypeAdapter
+    from sqlalchemy import delete, insert
+    from models.pydantic_models import CharacterInDB
+    from services.character_service import CharacterService
+
+    prefix = f"Bench{uuid4().hex[:6]}"
+    base_id = 900_000_000 + (uuid4().int % 1_000_000) * 1_000
+    await async_session.execute(
+        insert(Character),
+        [
+            {
+                "discord_user_id": base_id + i,
+                "discord_username": f"{prefix}User{i}",
+                "name": f"{prefix}_{i}",
+                "race": CharacterRaceEnum.Human,
+                "class_name": CharacterClassEnum.Warrior,
+                "roles": [CharacterRoleEnum.Tank.value],
+                "professions": ["Mining"],
+                "backstory": "Stands in line for the roster. " * 20,
+                "trait_1": "Stout",
+                "trait_2": "Loyal",
+                "trait_3": "Patient",
+            }
+            for i in range(row_count)
+        ],
+    )
+    await async_session.commit()
+
+    try:
+        start = time.perf_counter()
+        response = await async_client.get("/characters/", params={"limit": row_count})
+        elapsed = time.perf_counter() - start
+        assert response.status_code == 200
+        assert len(response.json()) == row_count
+
+        # Legacy: ORM -> model_validate in the service, then response_model again
+        adapter = TypeAdapter(List[CharacterInDB])
+        legacy_start = time.perf_counter()
+        models = await CharacterService(async_session).get_all_characters(0, row_count)
+        json.dumps(
+            adapter.dump_python(
+                adapter.validate_python(models), mode="json", by_alias=True
+            )
+        )
+        legacy_elapsed = time.perf_counter() - legacy_start
+
+        assert elapsed < 5.0, (
+            f"GET /characters x{row_count}: {elapsed * 1000:.2f}ms "
+            f"(legacy serialization path {legacy_elapsed * 1000:.2f}ms)"
+        )
+    finally:
+        await async_session.execute(
+            delete(Character).where(Character.name.like(f"{prefix}_%"))
+        )
+        await async_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_get_character_conditional_get(
+    async_client: AsyncClient, test_character: Character
+):
+    from unittest.mock import AsyncMock, patch
+
+    first = await async_client.get(f"/characters/{test_character.id}")
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"') and str(test_character.id) in etag
+
+    # Cached ETag answers the revalidation without calling into the service
+    with patch(
+        "services.character_service.CharacterService.get_character_by_id",
+        new_callable=AsyncMock,
+    ) as mock_get:
+        second = await async_client.get(
+            f"/characters/{test_character.id}", headers={"If-None-Match": etag}
+        )
+        by_discord = await async_client.get(
+            f"/characters/by-discord/{test_character.discord_user_id}",
+            headers={"If-None-Match": etag},
+        )
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert by_discord.status_code == 304
+    mock_get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_invalidates_etag(
+    async_client: AsyncClient, test_character: Character
+):
+    first = await async_client.get(f"/characters/{test_character.id}")
+    etag = first.headers["etag"]
+
+    await async_client.patch(
+        f"/characters/{test_character.id}", json={"backstory": "A new chapter."}
+    )
+
+    response = await async_client.get(
+        f"/characters/{test_character.id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["backstory"] == "A new chapter."
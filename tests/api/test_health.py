@@ -0,0 +1,19 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from integrations.mcp_client import CircuitBreaker
+from routers.health import mcp_health
+
+
+@pytest.mark.asyncio
+async def test_mcp_health_exposes_only_coarse_status():
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = MagicMock(breaker=breaker)
+    client.get_metrics.return_value = {"requests": 3, "breaker_state": "closed"}
+
+    with patch("routers.health.get_mcp_client", return_value=client):
+        assert await mcp_health() == {"status": "ok"}
+        breaker.record_failure()
+        assert await mcp_health() == {"status": "degraded"}
+
+    client.get_metrics.assert_not_called()
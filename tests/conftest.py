@@ -73,6 +73,16 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_character_caches():
+    """Tests write through repositories directly; start each with a cold cache."""
+    from services.character_service import clear_character_caches
+
+    clear_character_caches()
+    yield
+    clear_character_caches()
+
+
 @pytest_asyncio.fixture(scope="session")
 def postgres_container():
     try:
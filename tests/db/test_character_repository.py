@@ -1,5 +1,6 @@
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 from db.repositories import CharacterRepository
 from models.pydantic_models import CharacterCreate, CharacterUpdate
@@ -122,3 +123,119 @@ async def test_delete_character(
 
     retrieved_character = await character_repo.get_character_by_id(new_character.id)
     assert retrieved_character is None
+
+
+@pytest.fixture
+def statement_log(initialized_test_db_engine):
+    """Records every SQL statement sent to the test database."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        statements.append(statement)
+
+    engine = initialized_test_db_engine.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _character_statements(statements):
+    return [s for s in statements if "characters" in s]
+
+
+@pytest.mark.asyncio
+async def test_writes_cost_one_statement(
+    character_repo: CharacterRepository, statement_log
+):
+    character_data = CharacterCreate(
+        discord_user_id=565656565,
+        discord_username=f"roundtrip_{uuid4().hex[:8]}",
+        name="RoundTrip",
+        race="Dwarf",
+        class_name="Paladin",
+        roles=[],
+        professions=["Mining"],
+        backstory="Counts every coin, and every query.",
+        trait_1="Frugal",
+        trait_2="Precise",
+        trait_3="Patient",
+    )
+
+    created = await character_repo.create_character(character_data)
+    create_statements = _character_statements(statement_log)
+    statement_log.clear()
+
+    updated = await character_repo.update_character(
+        created.id, CharacterUpdate(backstory="Counts only what matters.")
+    )
+    update_statements = _character_statements(statement_log)
+
+    # Exactly one INSERT/UPDATE ... RETURNING each: no pre-SELECT, no refresh
+    assert len(create_statements) == 1
+    assert create_statements[0].lstrip().upper().startswith("INSERT")
+    assert len(update_statements) == 1
+    assert update_statements[0].lstrip().upper().startswith("UPDATE")
+
+    # Returned rows are fully loaded without extra round trips
+    assert created.id is not None and created.created_at is not None
+    assert updated.backstory == "Counts only what matters."
+    assert updated.updated_at is not None
+
+    await character_repo.delete_character(created.id)
+
+
+@pytest.mark.asyncio
+async def test_create_persists_precomputed_payloads(
+    character_repo: CharacterRepository, statement_log
+):
+    embed_json = [{"title": "Payload", "fields": [{"name": "Race", "value": "Gnome"}]}]
+    character_data = CharacterCreate(
+        discord_user_id=676767676,
+        discord_username=f"payload_{uuid4().hex[:8]}",
+        name="Payload",
+        race="Gnome",
+        class_name="Mage",
+        roles=[],
+        backstory="Arrives fully rendered.",
+        trait_1="Clever",
+        trait_2="Small",
+        trait_3="Loud",
+        embed_json=embed_json,
+        embed_hash="a" * 64,
+        talents_json={"arcane": 5},
+    )
+
+    created = await character_repo.create_character(character_data)
+
+    # Sheet and talents ride along in the INSERT, no follow-up UPDATE
+    assert len(_character_statements(statement_log)) == 1
+    assert created.embed_json == embed_json
+    assert created.embed_hash == "a" * 64
+    assert created.talents_json == {"arcane": 5}
+
+    await character_repo.delete_character(created.id)
+
+
+@pytest.mark.asyncio
+async def test_create_without_payloads_uses_column_defaults(
+    character_repo: CharacterRepository,
+):
+    created = await character_repo.create_character(
+        CharacterCreate(
+            discord_user_id=686868686,
+            discord_username=f"defaults_{uuid4().hex[:8]}",
+            name="Defaults",
+            race="Human",
+            class_name="Rogue",
+            roles=[],
+            backstory="Plain.",
+            trait_1="Quiet",
+            trait_2="Quick",
+            trait_3="Quirky",
+        )
+    )
+
+    assert created.embed_json == {}
+    assert created.embed_hash is None
+
+    await character_repo.delete_character(created.id)
@@ -1,6 +1,12 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
-from views.officer_view import OfficerControlView
+from views.officer_view import (
+    OfficerControlView,
+    OfficerApproveButton,
+    OfficerRejectButton,
+)
 from schemas.db_schemas import CharacterStatusEnum
 
 
@@ -9,6 +15,8 @@ def mock_settings():
     mock = MagicMock()
     mock.OFFICER_ROLE_IDS = [999, 888]
     mock.CHARACTER_SHEET_VAULT_CHANNEL_ID = 12345
+    mock.SEEKER_ROLE_ID = 0
+    mock.RECRUITMENT_APPROVED_TAG_ID = None
     return mock
 
 
@@ -100,3 +108,85 @@ async def test_approve_button_success(mock_interaction, mock_settings, async_ses
         mock_interaction.channel.edit.assert_called_with(
             locked=True, archived=True, name="[APPROVED] Thorgar"
         )
+
+
+@pytest.mark.asyncio
+async def test_vault_thread_named_before_recruitment_rename(
+    mock_interaction, mock_settings
+):
+    # Closing the recruitment thread renames the cached channel in place
+    mock_interaction.user.roles = [MagicMock(id=999)]
+    mock_interaction.channel.name = "[PENDING] Thorgar"
+    mock_interaction.message = MagicMock()
+    mock_interaction.message.edit = AsyncMock()
+
+    async def rename(**kwargs):
+        mock_interaction.channel.name = kwargs["name"]
+
+    async def history(limit):
+        await asyncio.sleep(0)  # let the other side effects run first
+        return
+        yield
+
+    mock_interaction.channel.edit = AsyncMock(side_effect=rename)
+    mock_interaction.channel.history = history
+
+    character = MagicMock(id=1, discord_user_id=123)
+    character.name = "Thorgar"
+    vault_channel = AsyncMock()
+    bot = MagicMock()
+    bot.get_channel.return_value = vault_channel
+
+    view = OfficerControlView(bot=bot, character_id=1)
+    view.settings = mock_settings
+
+    with patch("views.officer_view.get_engine_and_session_maker") as mock_get_engine:
+        mock_get_engine.return_value = (None, MagicMock())
+        with patch("views.officer_view.CharacterService") as mock_service:
+            mock_service.return_value.approve_character = AsyncMock(
+                return_value=character
+            )
+            mock_service.return_value.update_character = AsyncMock()
+
+            await view.approve_logic(mock_interaction)
+
+    assert mock_interaction.channel.name == "[APPROVED] Thorgar"
+    vault_channel.create_thread.assert_called_once()
+    assert vault_channel.create_thread.call_args.kwargs["name"] == (
+        "[REGISTERED] Thorgar"
+    )
+
+
+@pytest.mark.asyncio
+async def test_officer_buttons_encode_character_id():
+    view = OfficerControlView(bot=MagicMock(), character_id=42)
+
+    custom_ids = {item.custom_id for item in view.children}
+
+    assert custom_ids == {
+        "officer_approve:42",
+        "officer_reject:42",
+        "officer_request_edit:42",
+    }
+
+
+@pytest.mark.asyncio
+async def test_dynamic_item_restores_character_id(mock_interaction):
+    template = OfficerApproveButton.__discord_ui_compiled_template__
+    match = template.fullmatch("officer_approve:42")
+
+    item = await OfficerApproveButton.from_custom_id(mock_interaction, MagicMock(), match)
+
+    assert item.character_id == 42
+    assert item.custom_id == "officer_approve:42"
+
+
+@pytest.mark.asyncio
+async def test_dynamic_item_accepts_legacy_custom_id(mock_interaction):
+    # Posts made before IDs were encoded still route, via the context lookup
+    template = OfficerRejectButton.__discord_ui_compiled_template__
+    match = template.fullmatch("officer_reject")
+
+    item = await OfficerRejectButton.from_custom_id(mock_interaction, MagicMock(), match)
+
+    assert item.character_id is None
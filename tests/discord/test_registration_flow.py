@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from flows.registration_flow import RegistrationFlow
@@ -64,3 +65,104 @@ async def test_registration_finalize_success(mock_interaction, async_session):
 
             # Verify Webhook/Thread creation trigger
             mock_post_recruitment.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_background_portrait_upload_replaces_cdn_url(
+    mock_interaction, async_session
+):
+    flow = RegistrationFlow(mock_interaction)
+    r2_url = "https://test.r2.dev/portraits/hero_embed.webp"
+    upload_done = asyncio.Event()
+
+    async def slow_upload(attachment, metadata):
+        await upload_done.wait()
+        return r2_url
+
+    attachment = MagicMock(url="https://cdn.discordapp.com/attachments/1/2/hero.png")
+    storage = MagicMock()
+    storage.upload_attachment_with_fallback = slow_upload
+    with patch("flows.registration_flow.get_image_storage", return_value=storage):
+        flow.start_portrait_upload(attachment)
+
+    # The wizard moves on while the upload is still in flight
+    assert not flow._portrait_upload.done()
+
+    flow.data = {
+        "confirmed": True,
+        "portrait_url": attachment.url,
+        "embed_hash": "stale",
+        "valid_model": CharacterCreate(
+            discord_user_id=878787878,
+            discord_username="PortraitUser",
+            name="PortraitChar",
+            race=CharacterRaceEnum.Human,
+            class_name=CharacterClassEnum.Warrior,
+            roles=[CharacterRoleEnum.Tank],
+            professions=["Mining"],
+            backstory="A long story...",
+            portrait_url=attachment.url,
+            trait_1="Brave",
+            trait_2="Strong",
+            trait_3="Loyal",
+        ),
+    }
+    upload_done.set()
+    await flow.resolve_portrait_upload()
+
+    assert flow.data["portrait_url"] == r2_url
+    assert flow.data["valid_model"].portrait_url == r2_url
+    assert flow.data["embed_hash"] is None
+
+    with patch(
+        "flows.registration_flow.get_engine_and_session_maker"
+    ) as mock_get_engine:
+        mock_session_maker = MagicMock()
+        mock_session_maker.return_value.__aenter__.return_value = async_session
+        mock_get_engine.return_value = (None, mock_session_maker)
+        with patch(
+            "flows.registration_flow.handle_post_to_recruitment", new_callable=AsyncMock
+        ):
+            await flow.finalize()
+
+    from services.character_service import CharacterService
+
+    char = await CharacterService(async_session).get_character_by_discord_id(
+        878787878
+    )
+    assert char.portrait_url == r2_url
+
+
+@pytest.mark.asyncio
+async def test_queue_mcp_workflows_skips_missing_character(mock_interaction):
+    # update_character returns None when the row vanished mid-registration
+    flow = RegistrationFlow(mock_interaction)
+    uow = MagicMock()
+    uow.outbox.enqueue_portrait_generation = AsyncMock()
+
+    await flow._queue_mcp_workflows(uow, None)
+
+    uow.outbox.enqueue_portrait_generation.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_draft_skips_portrait_while_upload_is_pending(mock_interaction):
+    # The CDN link expires and the upload task is lost on restart
+    flow = RegistrationFlow(mock_interaction)
+    flow.data = {
+        "char_name": "Drafty",
+        "portrait_url": "https://cdn.discordapp.com/attachments/1/2/hero.png",
+    }
+    flow._portrait_upload = asyncio.get_running_loop().create_future()
+    store = MagicMock()
+
+    with patch("flows.registration_flow.get_draft_store", return_value=store):
+        flow._save_draft("portrait", ["quotes", "portrait"])
+        flow._portrait_upload = None
+        flow.data["portrait_url"] = "https://test.r2.dev/portraits/hero.webp"
+        flow._save_draft("portrait", ["quotes", "portrait"])
+
+    pending, settled = [c.args[2] for c in store.save.call_args_list]
+    assert pending == {"completed": ["quotes"], "answers": {"char_name": "Drafty"}}
+    assert settled["completed"] == ["quotes", "portrait"]
+    assert settled["answers"]["portrait_url"].startswith("https://test.r2.dev/")
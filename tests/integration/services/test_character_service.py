@@ -80,3 +80,168 @@ async def test_duplicate_character_prevention(async_session):
 
     with pytest.raises(IntegrityError):
         await service.create_character(char_data_duplicate)
+
+
+@pytest.mark.asyncio
+async def test_approve_character_single_update(async_session):
+    """Approval stamps status and reviewer in one go and emits CharacterApproved."""
+    from domain import events
+
+    service = CharacterService(async_session)
+    created = await service.create_character(
+        pydantic_models.CharacterCreate(
+            discord_user_id=454545454,  # Unique ID to avoid conflicts
+            discord_username="ApproveUser",
+            name="Approve_Test",
+            race=CharacterRaceEnum.Dwarf,
+            class_name=CharacterClassEnum.Paladin,
+            roles=[CharacterRoleEnum.Healer],
+            backstory="Awaiting judgement.",
+            trait_1="Devout",
+            trait_2="Steady",
+            trait_3="Bearded",
+        )
+    )
+
+    received = []
+    events.subscribe(events.CharacterApproved, received.append)
+    try:
+        approved = await service.approve_character(created.id, reviewer_id=777)
+        # A second approval is a no-op: the character is no longer pending
+        again = await service.approve_character(created.id, reviewer_id=888)
+    finally:
+        events.unsubscribe(events.CharacterApproved, received.append)
+
+    assert approved.status.value == "REGISTERED"
+    assert approved.reviewed_by_user_id == 777
+    assert again is None
+    assert [e.character_id for e in received] == [created.id]
+
+
+@pytest.mark.asyncio
+async def test_lookups_are_read_through_cached(async_session):
+    """Repeat lookups come from memory; writes invalidate explicitly."""
+    from unittest.mock import patch
+
+    service = CharacterService(async_session)
+    repo = service.character_repo
+
+    with patch.object(
+        repo, "get_character_by_name", wraps=repo.get_character_by_name
+    ) as by_name:
+        # Negative result is cached until a create for that name
+        assert await service.get_character_by_name("Cached_Test") is None
+        assert await service.get_character_by_name("Cached_Test") is None
+        assert by_name.await_count == 1
+
+        created = await service.create_character(
+            pydantic_models.CharacterCreate(
+                discord_user_id=464646464,  # Unique ID to avoid conflicts
+                discord_username="CacheUser",
+                name="Cached_Test",
+                race=CharacterRaceEnum.Gnome,
+                class_name=CharacterClassEnum.Mage,
+                roles=[CharacterRoleEnum.RangedDPS],
+                backstory="Remembers everything.",
+                trait_1="Sharp",
+                trait_2="Tiny",
+                trait_3="Curious",
+            )
+        )
+        assert (await service.get_character_by_name("Cached_Test")).id == created.id
+        assert by_name.await_count == 2
+
+    with patch.object(
+        repo, "get_character_by_id", wraps=repo.get_character_by_id
+    ) as by_id:
+        await service.get_character_by_id(created.id)
+        await service.get_character_by_id(created.id)
+        assert by_id.await_count == 1
+
+        await service.update_character(
+            created.id, pydantic_models.CharacterUpdate(backstory="Forgot once.")
+        )
+        refreshed = await service.get_character_by_id(created.id)
+        assert refreshed.backstory == "Forgot once."
+        assert by_id.await_count == 2
+
+        await service.delete_character(created.id)
+        assert await service.get_character_by_id(created.id) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_lookups_return_independent_copies(async_session):
+    """Mutating a returned model (nested lists included) never leaks into the cache."""
+    service = CharacterService(async_session)
+    created = await service.create_character(
+        pydantic_models.CharacterCreate(
+            discord_user_id=464646465,  # Unique ID to avoid conflicts
+            discord_username="CopyUser",
+            name="Copy_Test",
+            race=CharacterRaceEnum.Gnome,
+            class_name=CharacterClassEnum.Mage,
+            roles=[CharacterRoleEnum.RangedDPS],
+            professions=["Tailoring"],
+            backstory="Keeps copies.",
+            trait_1="Sharp",
+            trait_2="Tiny",
+            trait_3="Curious",
+        )
+    )
+
+    first = await service.get_character_by_id(created.id)
+    first.professions.append("Enchanting")
+    first.roles.clear()
+
+    second = await service.get_character_by_id(created.id)
+    assert second.professions == ["Tailoring"]
+    assert second.roles == [CharacterRoleEnum.RangedDPS]
+
+
+@pytest.mark.asyncio
+async def test_load_racing_an_invalidation_is_not_cached():
+    """A row loaded before a concurrent write is returned but never cached."""
+    import asyncio
+    from datetime import datetime, timezone
+    from unittest.mock import MagicMock
+    from schemas.db_schemas import CharacterStatusEnum
+    from services.character_service import invalidate_character
+
+    now = datetime.now(timezone.utc)
+    stale = pydantic_models.CharacterInDB(
+        id=464646466,
+        discord_user_id=464646466,
+        discord_username="RaceUser",
+        name="Race_Test",
+        race=CharacterRaceEnum.Gnome,
+        class_name=CharacterClassEnum.Mage,
+        backstory="Read a moment too early.",
+        trait_1="Sharp",
+        trait_2="Tiny",
+        trait_3="Curious",
+        created_at=now,
+        updated_at=now,
+    )
+    fresh = stale.model_copy(update={"status": CharacterStatusEnum.REGISTERED})
+    rows = [stale, fresh]
+    loading, release = asyncio.Event(), asyncio.Event()
+
+    async def load(character_id):
+        row = rows.pop(0)
+        if row is stale:
+            loading.set()
+            await release.wait()
+        return row
+
+    service = CharacterService(MagicMock())
+    service.character_repo.get_character_by_id = load
+
+    read = asyncio.create_task(service.get_character_by_id(stale.id))
+    await loading.wait()
+    invalidate_character(stale.id)  # Another session's write commits meanwhile
+    release.set()
+
+    assert (await read).status == CharacterStatusEnum.PENDING
+    assert (await service.get_character_by_id(stale.id)).status == (
+        CharacterStatusEnum.REGISTERED
+    )
@@ -0,0 +1,229 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the unit-of-work transaction boundary
+
+Test coverage for services/unit_of_work.py:
+- Multi-step writes commit once on exit
+- An exception rolls back every staged write
+- Character cache invalidation waits for commit / rollback
+- Domain events are published after commit and dropped on rollback
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from db.repositories import CharacterRepository
+from domain import events
+from models import pydantic_models
+from schemas.db_schemas import (
+    CharacterRaceEnum,
+    CharacterClassEnum,
+    CharacterRoleEnum,
+    CharacterStatusEnum,
+)
+from services.character_service import CharacterService, GraveyardService
+from services.unit_of_work import UnitOfWork
+
+
+@pytest.fixture
+def session_maker(initialized_test_db_engine):
+    return sessionmaker(
+        initialized_test_db_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+
+def _character(discord_user_id: int, name: str) -> pydantic_models.CharacterCreate:
+    return pydantic_models.CharacterCreate(
+        discord_user_id=discord_user_id,
+        discord_username=f"{name}User",
+        name=name,
+        race=CharacterRaceEnum.Human,
+        class_name=CharacterClassEnum.Priest,
+        roles=[CharacterRoleEnum.Healer],
+        backstory="Bound for the graveyard.",
+        trait_1="Pious",
+        trait_2="Calm",
+        trait_3="Doomed",
+    )
+
+
+@pytest.mark.asyncio
+async def test_burial_commits_once(session_maker):
+    async with session_maker() as session:
+        created = await CharacterService(session).create_character(
+            _character(585858585, "Uow_Burial")  # Unique ID to avoid conflicts
+        )
+
+    async with UnitOfWork(session_maker) as uow:
+        await uow.characters.update_character(
+            created.id,
+            pydantic_models.CharacterUpdate(status=CharacterStatusEnum.DECEASED),
+        )
+        await uow.graveyard.create_graveyard_entry(
+            pydantic_models.GraveyardCreate(
+                character_id=created.id, cause_of_death="Hogger"
+            )
+        )
+
+    # Both writes are visible from a fresh session
+    async with session_maker() as session:
+        char = await CharacterService(session).get_character_by_id(created.id)
+        entries = await GraveyardService(session).get_graveyard_entries_for_character(
+            created.id
+        )
+    assert char.status == CharacterStatusEnum.DECEASED
+    assert [e.cause_of_death for e in entries] == ["Hogger"]
+
+
+@pytest.mark.asyncio
+async def test_error_rolls_back_all_writes(session_maker):
+    async with session_maker() as session:
+        created = await CharacterService(session).create_character(
+            _character(595959595, "Uow_Rollback")  # Unique ID to avoid conflicts
+        )
+
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(session_maker) as uow:
+            await uow.characters.update_character(
+                created.id,
+                pydantic_models.CharacterUpdate(status=CharacterStatusEnum.DECEASED),
+            )
+            await uow.graveyard.create_graveyard_entry(
+                pydantic_models.GraveyardCreate(
+                    character_id=created.id, cause_of_death="Defias"
+                )
+            )
+            raise RuntimeError("Discord went away")
+
+    async with session_maker() as session:
+        char = await CharacterService(session).get_character_by_id(created.id)
+        entries = await GraveyardService(session).get_graveyard_entries_for_character(
+            created.id
+        )
+    assert char.status == CharacterStatusEnum.PENDING
+    assert entries == []
+
+
+@pytest.mark.asyncio
+async def test_cache_invalidated_on_commit_not_before(session_maker):
+    async with session_maker() as session:
+        service = CharacterService(session)
+        created = await service.create_character(
+            _character(565656566, "Uow_CacheCommit")  # Unique ID to avoid conflicts
+        )
+        await service.get_character_by_id(created.id)  # Warm the cache
+
+    async with UnitOfWork(session_maker) as uow:
+        await uow.characters.update_character(
+            created.id,
+            pydantic_models.CharacterUpdate(status=CharacterStatusEnum.DECEASED),
+        )
+        # The writing session sees its own change without caching it...
+        own = await uow.characters.get_character_by_id(created.id)
+        assert own.status == CharacterStatusEnum.DECEASED
+        # ...and other sessions keep the committed row until the commit
+        async with session_maker() as session:
+            other = await CharacterService(session).get_character_by_id(created.id)
+        assert other.status == CharacterStatusEnum.PENDING
+
+    async with session_maker() as session:
+        char = await CharacterService(session).get_character_by_id(created.id)
+    assert char.status == CharacterStatusEnum.DECEASED
+
+
+@pytest.mark.asyncio
+async def test_rollback_leaves_no_uncommitted_state_cached(session_maker):
+    async with session_maker() as session:
+        created = await CharacterService(session).create_character(
+            _character(565656567, "Uow_CacheRollback")  # Unique ID to avoid conflicts
+        )
+
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(session_maker) as uow:
+            await uow.characters.update_character(
+                created.id,
+                pydantic_models.CharacterUpdate(status=CharacterStatusEnum.DECEASED),
+            )
+            await uow.characters.get_character_by_id(created.id)
+            raise RuntimeError("Discord went away")
+
+    async with session_maker() as session:
+        char = await CharacterService(session).get_character_by_id(created.id)
+    assert char.status == CharacterStatusEnum.PENDING
+
+
+def _stub_session_maker(commit_error=None):
+    """Session factory whose session only records commit / rollback."""
+    session = AsyncMock()
+    session.commit.side_effect = commit_error
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=session)
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=session_cm)
+
+
+@pytest.fixture
+def approvals():
+    """Character IDs from CharacterApproved events, in publish order."""
+    seen = []
+
+    def handler(event):
+        seen.append(event.character_id)
+
+    events.subscribe(events.CharacterApproved, handler)
+    now = datetime.now(timezone.utc)
+    approved = pydantic_models.CharacterInDB(
+        **_character(575757575, "Uow_Approved").model_dump(exclude_none=True),
+        id=575757575,
+        status=CharacterStatusEnum.REGISTERED,
+        created_at=now,
+        updated_at=now,
+    )
+    with patch.object(
+        CharacterRepository, "approve_character", autospec=True, return_value=approved
+    ):
+        yield seen
+    events.unsubscribe(events.CharacterApproved, handler)
+
+
+@pytest.mark.asyncio
+async def test_approval_event_waits_for_commit(approvals):
+    async with UnitOfWork(_stub_session_maker()) as uow:
+        await uow.characters.approve_character(575757575, reviewer_id=777)
+        # Subscribers must not act on an approval that may still roll back
+        assert approvals == []
+
+    assert approvals == [575757575]
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_approval_is_never_published(approvals):
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(_stub_session_maker()) as uow:
+            await uow.characters.approve_character(575757575, reviewer_id=777)
+            raise RuntimeError("Discord went away")
+
+    with pytest.raises(ConnectionError):
+        async with UnitOfWork(_stub_session_maker(ConnectionError())) as uow:
+            await uow.characters.approve_character(575757575, reviewer_id=777)
+
+    assert approvals == []
@@ -15,12 +15,26 @@ Test coverage for integrations/mcp_client.py:
 - Health check functionality
 - Async context manager behavior
 - Request authentication
+- Retries, circuit breaker and metrics
+- Batched requests against a local stand-in server
 """
 
+import asyncio
+
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
-from aiohttp import ClientError
-from integrations.mcp_client import MCPWorkflowTrigger, WorkflowResponse, get_mcp_client
+from aiohttp import ClientError, web
+from aiohttp.test_utils import TestServer
+from integrations.mcp_client import (
+    BATCH_ENDPOINT,
+    CircuitBreaker,
+    MCPBatcher,
+    MCPWorkflowTrigger,
+    WorkflowResponse,
+    get_mcp_client,
+    get_shared_connector,
+)
 
 
 def create_mock_response(status=200, json_data=None, text_data=None):
@@ -364,6 +378,341 @@ class TestMCPWorkflowTriggerSingleton:
         assert client1 is client2
 
 
+class TestMCPWorkflowTriggerResilience:
+    """Test retries, circuit breaker and metrics."""
+
+    @pytest.fixture
+    def resilient_client(self, mock_aiohttp_session):
+        client = MCPWorkflowTrigger(
+            base_url="http://localhost:8000",
+            api_key="test_api_key",
+            retry_backoff=0,
+            breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60),
+        )
+        client.session = mock_aiohttp_session
+        return client
+
+    @pytest.mark.asyncio
+    async def test_idempotent_request_retried(
+        self, resilient_client, mock_aiohttp_session
+    ):
+        """Read-only summary survives a transient 503."""
+        mock_aiohttp_session.request = MagicMock(
+            side_effect=[
+                create_mock_response(status=503, text_data="warming up"),
+                create_mock_response(status=200, json_data={"summary": "- quiet"}),
+            ]
+        )
+
+        result = await resilient_client.request_channel_summary(channel_id="42")
+
+        assert result.success is True
+        assert result.message == "- quiet"
+        assert mock_aiohttp_session.request.call_count == 2
+        assert resilient_client.get_metrics()["retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_non_idempotent_request_not_retried(
+        self, resilient_client, mock_aiohttp_session
+    ):
+        """Welcome posts to Discord, so a failure is never replayed."""
+        mock_aiohttp_session.request = MagicMock(
+            side_effect=ClientError("Connection refused")
+        )
+
+        result = await resilient_client.trigger_character_welcome(
+            member_id="1", guild_id="2", character_data={"name": "Test"}
+        )
+
+        assert result.success is False
+        assert mock_aiohttp_session.request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_breaker_opens_and_fails_fast(
+        self, resilient_client, mock_aiohttp_session
+    ):
+        mock_aiohttp_session.request = MagicMock(
+            side_effect=ClientError("Connection refused")
+        )
+
+        for _ in range(3):
+            await resilient_client.trigger_event_announcement({"title": "Raid"})
+        result = await resilient_client.trigger_event_announcement({"title": "Raid"})
+
+        assert mock_aiohttp_session.request.call_count == 3
+        assert result.success is False
+        assert "circuit is open" in result.error
+        metrics = resilient_client.get_metrics()
+        assert metrics["breaker_state"] == CircuitBreaker.OPEN
+        assert metrics["short_circuited"] == 1
+        assert metrics["failures"] == 3
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_closes_breaker(
+        self, resilient_client, mock_aiohttp_session
+    ):
+        breaker = resilient_client.breaker
+        for _ in range(3):
+            breaker.record_failure()
+        breaker.reset_timeout = 0  # Cool-down elapsed
+
+        mock_aiohttp_session.request = MagicMock(
+            return_value=create_mock_response(status=200, json_data={"status": "ok"})
+        )
+
+        assert await resilient_client.health_check() is True
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_single_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+        breaker.record_failure()
+        assert breaker.opened_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_frees_half_open_slot(
+        self, resilient_client, mock_aiohttp_session
+    ):
+        """A probe cancelled mid-flight must not leave the breaker rejecting all."""
+        breaker = resilient_client.breaker
+        for _ in range(3):
+            breaker.record_failure()
+        breaker.reset_timeout = 0
+
+        async def hang(*args, **kwargs):
+            await asyncio.Event().wait()
+
+        resilient_client._send = hang
+        probe = asyncio.create_task(resilient_client.health_check())
+        await asyncio.sleep(0)
+        assert breaker.allow_request() is False  # Probe holds the slot
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request() is True
+
+    @pytest.mark.asyncio
+    async def test_malformed_probe_response_counts_as_failure(
+        self, resilient_client, mock_aiohttp_session
+    ):
+        breaker = resilient_client.breaker
+        for _ in range(3):
+            breaker.record_failure()
+        breaker.reset_timeout = 0
+        response = create_mock_response(status=200)
+        response.json = AsyncMock(side_effect=ValueError("Expecting value"))
+        mock_aiohttp_session.request = MagicMock(return_value=response)
+
+        with pytest.raises(ValueError):
+            await resilient_client.send_workflow("/webhooks/portrait", {})
+
+        assert breaker.opened_count == 2
+        assert breaker.state == CircuitBreaker.HALF_OPEN  # reset_timeout is 0
+        assert breaker.allow_request() is True
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_trip_breaker(
+        self, resilient_client, mock_aiohttp_session
+    ):
+        mock_aiohttp_session.request = MagicMock(
+            return_value=create_mock_response(status=422, text_data="bad payload")
+        )
+
+        for _ in range(5):
+            await resilient_client.trigger_portrait_generation(1, {"name": "Test"})
+
+        assert resilient_client.breaker.state == CircuitBreaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_metrics_record_latency(
+        self, resilient_client, mock_aiohttp_session
+    ):
+        mock_aiohttp_session.request = MagicMock(
+            return_value=create_mock_response(status=200, json_data={"status": "ok"})
+        )
+
+        await resilient_client.health_check()
+        metrics = resilient_client.get_metrics()
+
+        assert metrics["requests"] == 1
+        assert metrics["latency_p50"] is not None
+        assert metrics["breaker_state"] == CircuitBreaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_sessions_share_one_connector(self):
+        first = MCPWorkflowTrigger(base_url="http://localhost:8000", api_key="k")
+        second = MCPWorkflowTrigger(base_url="http://localhost:8000", api_key="k")
+
+        async with first, second:
+            connector = first.session.connector
+            assert connector is get_shared_connector()
+            assert second.session.connector is connector
+
+        # Closing the sessions keeps the pooled connections alive
+        assert not connector.closed
+        await connector.close()
+
+
+class StandInMCPServer:
+    """Local aiohttp app mimicking the MCP server's batch endpoint."""
+
+    def __init__(self):
+        self.batches = []
+        self.fail_batch = False
+        self.raw_response = None  # Sent verbatim instead of real results
+        self.app = web.Application()
+        self.app.router.add_post(BATCH_ENDPOINT, self.handle_batch)
+
+    async def handle_batch(self, request):
+        assert request.headers["X-API-Key"] == "test_api_key"
+        if self.fail_batch:
+            return web.Response(status=503, text="overloaded")
+        body = await request.json()
+        self.batches.append(body["requests"])
+        if self.raw_response is not None:
+            return web.json_response(self.raw_response)
+        results = []
+        for item in body["requests"]:
+            name = item["payload"].get("character", {}).get("name")
+            if name == "Broken":
+                results.append({"id": item["id"], "status": 422, "body": "bad data"})
+            else:
+                results.append(
+                    {
+                        "id": item["id"],
+                        "status": 200,
+                        "body": {"workflow_id": f"wf_{name}", "message": "queued"},
+                    }
+                )
+        return web.json_response({"results": results})
+
+
+@pytest_asyncio.fixture
+async def stand_in_server():
+    stand_in = StandInMCPServer()
+    server = TestServer(stand_in.app)
+    await server.start_server()
+    stand_in.url = str(server.make_url("")).rstrip("/")
+    yield stand_in
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def batching_client(stand_in_server):
+    client = MCPWorkflowTrigger(
+        base_url=stand_in_server.url, api_key="test_api_key", batch_window=0.05
+    )
+    yield client
+    if client.session:
+        await client.session.close()
+
+
+class TestMCPBatcher:
+    """Test coalescing workflow triggers into batch requests."""
+
+    @staticmethod
+    def _welcome(client, name):
+        return client.trigger_character_welcome(
+            member_id="1", guild_id="2", character_data={"name": name}
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_triggers_share_one_request(
+        self, batching_client, stand_in_server
+    ):
+        names = ["Ayla", "Brom", "Cedric", "Dusk", "Elwynn"]
+
+        results = await asyncio.gather(
+            *(self._welcome(batching_client, name) for name in names)
+        )
+
+        assert len(stand_in_server.batches) == 1
+        assert len(stand_in_server.batches[0]) == len(names)
+        # Results map back to the caller that made each request
+        assert [r.workflow_id for r in results] == [f"wf_{n}" for n in names]
+        assert all(r.success for r in results)
+
+    @pytest.mark.asyncio
+    async def test_item_failure_only_affects_its_caller(
+        self, batching_client, stand_in_server
+    ):
+        ok, broken = await asyncio.gather(
+            self._welcome(batching_client, "Fine"),
+            self._welcome(batching_client, "Broken"),
+        )
+
+        assert ok.success is True
+        assert broken.success is False
+        assert "422" in broken.error
+        assert batching_client.breaker.state == CircuitBreaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_fails_every_caller(
+        self, batching_client, stand_in_server
+    ):
+        stand_in_server.fail_batch = True
+
+        results = await asyncio.gather(
+            self._welcome(batching_client, "Ayla"),
+            self._welcome(batching_client, "Brom"),
+        )
+
+        assert [r.success for r in results] == [False, False]
+        assert all("503" in r.error for r in results)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "raw_response",
+        [
+            ["not", "an", "object"],
+            {"results": [{"id": 0, "status": "accepted"}, {"id": 1}]},
+            {"results": ["garbage"]},
+        ],
+        ids=["list", "non-int-status", "non-dict-item"],
+    )
+    async def test_malformed_response_fails_every_caller(
+        self, batching_client, stand_in_server, raw_response
+    ):
+        stand_in_server.raw_response = raw_response
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                self._welcome(batching_client, "Ayla"),
+                self._welcome(batching_client, "Brom"),
+            ),
+            timeout=5,
+        )
+
+        assert all(r.success is False for r in results)
+        assert all("Malformed MCP batch response" in r.error for r in results)
+
+    @pytest.mark.asyncio
+    async def test_max_batch_flushes_early(self, batching_client, stand_in_server):
+        batching_client.batcher = MCPBatcher(batching_client, window=10, max_batch=3)
+
+        results = await asyncio.gather(
+            *(self._welcome(batching_client, f"Hero{i}") for i in range(6))
+        )
+
+        # A 10s window would time the test out if max_batch didn't flush
+        assert [len(batch) for batch in stand_in_server.batches] == [3, 3]
+        assert all(r.success for r in results)
+
+    @pytest.mark.asyncio
+    async def test_separate_windows_send_separate_batches(
+        self, batching_client, stand_in_server
+    ):
+        await self._welcome(batching_client, "First")
+        await self._welcome(batching_client, "Second")
+
+        assert len(stand_in_server.batches) == 2
+
+
 # TODO: Add integration tests with real MCP server (separate test suite)
 # TODO: Add tests for request headers and authentication details
 # TODO: Add tests for timeout behavior
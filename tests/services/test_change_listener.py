@@ -0,0 +1,127 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the Postgres LISTEN/NOTIFY change listener
+
+Test coverage for services/change_listener.py:
+- Notification payloads invalidating cached characters
+- RowChanged events pushed to subscribers
+- Malformed payloads being ignored
+- End-to-end delivery over a real LISTEN connection
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+from unittest.mock import patch
+
+from domain import events
+from services.change_listener import CHANGE_CHANNEL, ChangeListener, apply_row_change
+
+
+def _payload(table, op, row_id):
+    return json.dumps({"table": table, "op": op, "id": str(row_id)})
+
+
+class TestApplyRowChange:
+    """Test cache invalidation per table and operation."""
+
+    def test_character_update_invalidates_that_character(self):
+        with patch("services.change_listener.invalidate_character") as invalidate:
+            apply_row_change("characters", "UPDATE", "42")
+        invalidate.assert_called_once_with(42)
+
+    def test_character_insert_clears_negative_entries(self):
+        with patch("services.change_listener.clear_character_caches") as clear:
+            apply_row_change("characters", "INSERT", "43")
+        clear.assert_called_once()
+
+    def test_other_tables_leave_character_cache_alone(self):
+        with patch("services.change_listener.invalidate_character") as invalidate:
+            apply_row_change("guild_bank_items", "UPDATE", "7")
+        invalidate.assert_not_called()
+
+
+class TestChangeListener:
+    """Test notification handling."""
+
+    @pytest.mark.asyncio
+    async def test_notification_publishes_row_changed(self):
+        received = []
+        events.subscribe(events.RowChanged, received.append)
+        try:
+            listener = ChangeListener()
+            with patch("services.change_listener.apply_row_change") as apply:
+                listener._on_notify(
+                    None, 1, CHANGE_CHANNEL, _payload("talents", "DELETE", "t-1")
+                )
+                await asyncio.sleep(0)
+        finally:
+            events.unsubscribe(events.RowChanged, received.append)
+
+        apply.assert_called_once_with("talents", "DELETE", "t-1")
+        assert received == [events.RowChanged("talents", "DELETE", "t-1")]
+
+    @pytest.mark.asyncio
+    async def test_malformed_payload_is_ignored(self):
+        listener = ChangeListener()
+        with patch("services.change_listener.apply_row_change") as apply:
+            listener._on_notify(None, 1, CHANGE_CHANNEL, "not json")
+            listener._on_notify(None, 1, CHANGE_CHANNEL, json.dumps({"op": "UPDATE"}))
+        apply.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_receives_notify_from_database(self, initialized_test_db_engine):
+        """A NOTIFY from any connection reaches the listener."""
+        from sqlalchemy import text
+
+        received = asyncio.Queue()
+        events.subscribe(events.RowChanged, received.put_nowait)
+        listener = ChangeListener(dsn=os.environ["DATABASE_URL"], reconnect_delay=0.1)
+        try:
+            listener.start()
+            # Wait until LISTEN is registered before notifying
+            for _ in range(50):
+                async with initialized_test_db_engine.connect() as conn:
+                    listening = await conn.scalar(
+                        text(
+                            "SELECT count(*) FROM pg_stat_activity "
+                            "WHERE query ILIKE :q"
+                        ),
+                        {"q": f"%LISTEN%{CHANGE_CHANNEL}%"},
+                    )
+                if listening:
+                    break
+                await asyncio.sleep(0.1)
+
+            async with initialized_test_db_engine.begin() as conn:
+                await conn.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {
+                        "channel": CHANGE_CHANNEL,
+                        "payload": _payload("guild_bank_items", "UPDATE", 5),
+                    },
+                )
+
+            change = await asyncio.wait_for(received.get(), timeout=5)
+        finally:
+            events.unsubscribe(events.RowChanged, received.put_nowait)
+            await listener.stop()
+
+        assert change == events.RowChanged("guild_bank_items", "UPDATE", "5")
@@ -0,0 +1,106 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for Image Processing
+
+Test coverage for services/image_processing.py:
+- Bounded WebP variant generation
+- Metadata stripping and EXIF orientation
+- Process pool execution
+"""
+
+import io
+
+import pytest
+from PIL import Image
+
+from services.image_processing import (
+    VARIANT_BOUNDS,
+    ImageProcessingError,
+    ImageProcessor,
+    normalize_image,
+)
+
+
+def _image_bytes(size, fmt="PNG", mode="RGB", color="red", **save_kwargs) -> bytes:
+    out = io.BytesIO()
+    Image.new(mode, size, color=color).save(out, fmt, **save_kwargs)
+    return out.getvalue()
+
+
+class TestNormalizeImage:
+    def test_variants_are_bounded_webp(self):
+        variants = {v.name: v for v in normalize_image(_image_bytes((3000, 1500)))}
+
+        assert set(variants) == set(VARIANT_BOUNDS)
+        for name, variant in variants.items():
+            assert variant.content_type == "image/webp"
+            assert max(variant.width, variant.height) == VARIANT_BOUNDS[name]
+            with Image.open(io.BytesIO(variant.data)) as img:
+                assert img.format == "WEBP"
+                assert img.size == (variant.width, variant.height)
+
+    def test_small_images_are_not_upscaled(self):
+        variants = normalize_image(_image_bytes((100, 80)))
+
+        assert all((v.width, v.height) == (100, 80) for v in variants)
+
+    def test_strips_exif_and_applies_orientation(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Orientation: rotate 90° clockwise
+        exif[0x010F] = "SecretCam"  # Make
+        data = _image_bytes((400, 200), "JPEG", exif=exif.tobytes())
+
+        variant = normalize_image(data, bounds={"embed": 1024})[0]
+
+        assert (variant.width, variant.height) == (200, 400)
+        with Image.open(io.BytesIO(variant.data)) as img:
+            assert not img.getexif()
+            assert "exif" not in img.info
+
+    def test_keeps_transparency(self):
+        translucent = _image_bytes((50, 50), mode="RGBA", color=(255, 0, 0, 128))
+        variant = normalize_image(translucent)[0]
+
+        with Image.open(io.BytesIO(variant.data)) as img:
+            assert img.mode == "RGBA"
+
+    def test_rejects_undecodable_bytes(self):
+        with pytest.raises(ImageProcessingError):
+            normalize_image(b"definitely not an image")
+
+
+class TestImageProcessor:
+    @pytest.mark.asyncio
+    async def test_process_runs_in_pool(self):
+        processor = ImageProcessor(max_workers=1)
+        try:
+            variants = await processor.process(_image_bytes((2048, 2048)))
+        finally:
+            processor.shutdown()
+
+        assert variants["thumb"].width == VARIANT_BOUNDS["thumb"]
+        assert variants["embed"].width == VARIANT_BOUNDS["embed"]
+
+    @pytest.mark.asyncio
+    async def test_errors_cross_the_process_boundary(self):
+        processor = ImageProcessor(max_workers=1)
+        try:
+            with pytest.raises(ImageProcessingError):
+                await processor.process(b"garbage")
+        finally:
+            processor.shutdown()
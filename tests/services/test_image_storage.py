@@ -15,9 +15,16 @@ Test coverage for services/image_storage.py:
 - Content type detection
 - Error handling and fallbacks
 - S3/R2 integration (mocked)
+- Content-hash deduplication
+- Portrait WebP variants
+- Streaming attachment portraits with bounded variant reads
 """
 
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+import hashlib
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 from services.image_storage import (
     ImageStorage,
@@ -27,6 +34,8 @@ from services.image_storage import (
     UploadFailedError,
     UploadResult,
 )
+from models.pydantic_models import ImageInDB
+from services.image_processing import ImageProcessingError, ImageVariant
 from config.settings import settings
 
 
@@ -199,6 +208,450 @@ class TestImageStorageErrorHandling:
         assert "Access denied" in str(exc_info.value)
 
 
+async def _chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+class TestImageStorageStreaming:
+    """Test streaming multipart uploads."""
+
+    PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+    @pytest.fixture
+    def streaming_storage(self, image_storage, mock_r2_client):
+        image_storage.PART_SIZE = 64  # Tiny parts keep the test data small
+        mock_r2_client.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        mock_r2_client.upload_part.side_effect = lambda **kw: {
+            "ETag": f"etag-{kw['PartNumber']}"
+        }
+        return image_storage
+
+    @pytest.mark.asyncio
+    async def test_stream_uploads_bounded_parts(
+        self, streaming_storage, mock_r2_client
+    ):
+        """Parts are PART_SIZE bytes (last one shorter) and sent in order."""
+        data = self.PNG_HEADER + b"\x00" * 200
+
+        result = await streaming_storage.upload_stream(
+            _chunks(data, 10), "big.png", metadata={"context": "portraits"}
+        )
+
+        bodies = [c.kwargs["Body"] for c in mock_r2_client.upload_part.call_args_list]
+        assert [len(b) for b in bodies] == [64, 64, 64, 16]
+        assert b"".join(bodies) == data
+        completed = mock_r2_client.complete_multipart_upload.call_args.kwargs
+        assert completed["MultipartUpload"]["Parts"] == [
+            {"PartNumber": n, "ETag": f"etag-{n}"} for n in range(1, 5)
+        ]
+        assert result.size == len(data)
+        assert result.content_type == "image/png"
+        mock_r2_client.put_object.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_small_stream_uses_single_put(
+        self, streaming_storage, mock_r2_client
+    ):
+        data = self.PNG_HEADER + b"\x00" * 20
+
+        result = await streaming_storage.upload_stream(_chunks(data, 8), "small.png")
+
+        mock_r2_client.put_object.assert_called_once()
+        mock_r2_client.create_multipart_upload.assert_not_called()
+        assert result.size == len(data)
+
+    @pytest.mark.asyncio
+    async def test_oversized_stream_aborts(self, streaming_storage, mock_r2_client):
+        streaming_storage.MAX_SIZE_BYTES = 150
+        data = self.PNG_HEADER + b"\x00" * 300
+
+        with pytest.raises(ImageTooLargeError):
+            await streaming_storage.upload_stream(_chunks(data, 10), "huge.png")
+
+        mock_r2_client.abort_multipart_upload.assert_called_once()
+        mock_r2_client.complete_multipart_upload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_part_failure_aborts(self, streaming_storage, mock_r2_client):
+        from botocore.exceptions import ClientError
+
+        mock_r2_client.upload_part.side_effect = ClientError(
+            {"Error": {"Code": "InternalError"}}, "UploadPart"
+        )
+        data = self.PNG_HEADER + b"\x00" * 200
+
+        with pytest.raises(UploadFailedError):
+            await streaming_storage.upload_stream(_chunks(data, 10), "big.png")
+
+        mock_r2_client.abort_multipart_upload.assert_called_once()
+
+
+class _MemoryImageIndex:
+    """In-memory stand-in for DatabaseImageIndex."""
+
+    def __init__(self):
+        self.images = {}
+
+    async def find(self, hash_md5):
+        return self.images.get(hash_md5)
+
+    async def record(self, image):
+        self.images[image.hash_md5] = ImageInDB(
+            id=len(self.images) + 1,
+            created_at=datetime.now(timezone.utc),
+            **image.model_dump(),
+        )
+
+
+class TestImageStorageDeduplication:
+    """Test content-addressed deduplication by MD5."""
+
+    PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 200
+
+    @pytest.fixture
+    def dedup_storage(self, image_storage, mock_r2_client):
+        image_storage.image_index = _MemoryImageIndex()
+        image_storage.PART_SIZE = 64
+        mock_r2_client.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        mock_r2_client.upload_part.side_effect = lambda **kw: {
+            "ETag": f"etag-{kw['PartNumber']}"
+        }
+        return image_storage
+
+    @pytest.mark.asyncio
+    async def test_reupload_skips_put(self, dedup_storage, mock_r2_client):
+        """Same bytes twice: one put, second call returns the stored URL."""
+        first = await dedup_storage.upload(self.PNG, "a.png", {"user_id": 42})
+        second = await dedup_storage.upload(self.PNG, "b.png")
+
+        mock_r2_client.put_object.assert_called_once()
+        assert first.hash_md5 == hashlib.md5(self.PNG).hexdigest()
+        assert not first.deduplicated
+        assert second.deduplicated
+        assert second.url == first.url
+        assert second.key == first.key
+        recorded = dedup_storage.image_index.images[first.hash_md5]
+        assert recorded.uploaded_by_user_id == 42
+        assert recorded.img_graphics_vault_link == first.url
+
+    @pytest.mark.asyncio
+    async def test_stream_hashes_while_reading(self, dedup_storage, mock_r2_client):
+        """Multipart stream is hashed incrementally; a repeat aborts its parts."""
+        first = await dedup_storage.upload_stream(_chunks(self.PNG, 10), "a.png")
+        second = await dedup_storage.upload_stream(_chunks(self.PNG, 10), "b.png")
+
+        assert first.hash_md5 == hashlib.md5(self.PNG).hexdigest()
+        mock_r2_client.complete_multipart_upload.assert_called_once()
+        mock_r2_client.abort_multipart_upload.assert_called_once()
+        assert second.deduplicated
+        assert second.url == first.url
+
+    @pytest.mark.asyncio
+    async def test_single_part_stream_dedups_before_sending(
+        self, dedup_storage, mock_r2_client
+    ):
+        """A stream that fits in one part is looked up before any request."""
+        dedup_storage.PART_SIZE = 1024
+        first = await dedup_storage.upload_stream(_chunks(self.PNG, 10), "a.png")
+        second = await dedup_storage.upload_stream(_chunks(self.PNG, 10), "b.png")
+
+        mock_r2_client.put_object.assert_called_once()
+        mock_r2_client.create_multipart_upload.assert_not_called()
+        assert second.deduplicated
+        assert second.url == first.url
+
+    @pytest.mark.asyncio
+    async def test_multipart_dedup_happens_after_parts_are_sent(
+        self, dedup_storage, mock_r2_client
+    ):
+        """The full-body hash is only known at the end of a multipart stream."""
+        first = await dedup_storage.upload_stream(_chunks(self.PNG, 10), "a.png")
+        parts_per_upload = mock_r2_client.upload_part.call_count
+        calls = []
+        find = dedup_storage.image_index.find
+
+        async def logged_find(hash_md5):
+            calls.append("find")
+            return await find(hash_md5)
+
+        def logged_part(**kw):
+            calls.append("part")
+            return {"ETag": f"etag-{kw['PartNumber']}"}
+
+        dedup_storage.image_index.find = logged_find
+        mock_r2_client.upload_part.side_effect = logged_part
+
+        second = await dedup_storage.upload_stream(_chunks(self.PNG, 10), "b.png")
+
+        assert calls == ["part"] * parts_per_upload + ["find"]
+        mock_r2_client.abort_multipart_upload.assert_called_once()
+        assert second.deduplicated
+        assert second.url == first.url
+
+    @pytest.mark.asyncio
+    async def test_index_failure_does_not_block_upload(
+        self, dedup_storage, mock_r2_client
+    ):
+        async def broken_find(hash_md5):
+            raise RuntimeError("database unavailable")
+
+        dedup_storage.image_index.find = broken_find
+
+        result = await dedup_storage.upload(self.PNG, "a.png")
+
+        mock_r2_client.put_object.assert_called_once()
+        assert not result.deduplicated
+
+
+class _FakeProcessor:
+    def __init__(self, error=None):
+        self.calls = 0
+        self.error = error
+
+    async def process(self, image_bytes):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return {
+            "thumb": ImageVariant("thumb", b"t" * 10, 256, 128),
+            "embed": ImageVariant("embed", b"e" * 40, 1024, 512),
+        }
+
+
+class TestImageStoragePortraitVariants:
+    """Test WebP variant uploads alongside the original."""
+
+    PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 200
+
+    @pytest.mark.asyncio
+    async def test_variants_stored_next_to_original(
+        self, image_storage, mock_r2_client
+    ):
+        result = await image_storage.upload_portrait(
+            self.PNG, "hero.png", {"context": "portraits"}, processor=_FakeProcessor()
+        )
+
+        stem = result.key.rsplit(".", 1)[0]
+        assert result.variants["thumb"].key == f"{stem}_thumb.webp"
+        assert result.variants["embed"].key == f"{stem}_embed.webp"
+        assert result.variant_url("embed").endswith("_embed.webp")
+        keys = [c.kwargs["Key"] for c in mock_r2_client.put_object.call_args_list]
+        assert keys[0] == result.key
+        assert sorted(keys[1:]) == [f"{stem}_embed.webp", f"{stem}_thumb.webp"]
+        assert mock_r2_client.put_object.call_args.kwargs["ContentType"] == (
+            "image/webp"
+        )
+
+    @pytest.mark.asyncio
+    async def test_processing_failure_keeps_original(
+        self, image_storage, mock_r2_client
+    ):
+        processor = _FakeProcessor(error=ImageProcessingError("corrupt"))
+
+        result = await image_storage.upload_portrait(
+            self.PNG, "hero.png", processor=processor
+        )
+
+        assert result.variants == {}
+        assert result.variant_url("embed") == result.url
+        mock_r2_client.put_object.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_gif_skips_processing(self, image_storage, mock_r2_client):
+        processor = _FakeProcessor()
+
+        result = await image_storage.upload_portrait(
+            b"GIF89a" + b"\x00" * 50, "dance.gif", processor=processor
+        )
+
+        assert processor.calls == 0
+        assert result.variants == {}
+
+    @pytest.mark.asyncio
+    async def test_deduplicated_original_reuses_variants(
+        self, image_storage, mock_r2_client
+    ):
+        image_storage.image_index = _MemoryImageIndex()
+        processor = _FakeProcessor()
+        first = await image_storage.upload_portrait(
+            self.PNG, "a.png", processor=processor
+        )
+
+        second = await image_storage.upload_portrait(
+            self.PNG, "b.png", processor=processor
+        )
+
+        assert processor.calls == 1
+        assert second.deduplicated
+        assert second.variant_url("embed") == first.variant_url("embed")
+
+
+class _FakeAttachment:
+    def __init__(self, data: bytes, filename: str = "hero.png", size=None):
+        self.data = data
+        self.filename = filename
+        self.size = len(data) if size is None else size
+        self.url = f"https://cdn.discordapp.com/attachments/1/2/{filename}"
+        self.reads = 0
+
+    async def read(self):
+        self.reads += 1
+        return self.data
+
+
+class TestImageStorageAttachmentPortrait:
+    """Test portraits streamed from Discord attachments."""
+
+    PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 200
+
+    @pytest.fixture
+    def cdn(self):
+        """Serve attachment bytes in chunks instead of downloading them."""
+        with patch("services.image_storage.iter_url_chunks") as iter_chunks:
+            yield iter_chunks
+
+    @pytest.mark.asyncio
+    async def test_original_streams_and_small_image_gets_variants(
+        self, image_storage, mock_r2_client, cdn
+    ):
+        attachment = _FakeAttachment(self.PNG)
+        cdn.return_value = _chunks(self.PNG, 16)
+        processor = _FakeProcessor()
+
+        result = await image_storage.upload_attachment_portrait(
+            attachment, {"context": "portraits"}, processor=processor
+        )
+
+        cdn.assert_called_once_with(attachment.url)
+        assert attachment.reads == 1
+        assert processor.calls == 1
+        assert result.variant_url("embed").endswith("_embed.webp")
+        original = mock_r2_client.put_object.call_args_list[0].kwargs
+        assert original["Body"] == self.PNG
+        assert original["Metadata"]["origin_url"] == attachment.url
+
+    @pytest.mark.asyncio
+    async def test_large_attachment_is_never_read_into_memory(
+        self, image_storage, mock_r2_client, cdn
+    ):
+        image_storage.PART_SIZE = 64
+        image_storage.MAX_VARIANT_SOURCE_BYTES = 100
+        mock_r2_client.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        mock_r2_client.upload_part.side_effect = lambda **kw: {
+            "ETag": f"etag-{kw['PartNumber']}"
+        }
+        attachment = _FakeAttachment(self.PNG)
+        cdn.return_value = _chunks(self.PNG, 16)
+        processor = _FakeProcessor()
+
+        result = await image_storage.upload_attachment_portrait(
+            attachment, processor=processor
+        )
+
+        mock_r2_client.complete_multipart_upload.assert_called_once()
+        assert attachment.reads == 0
+        assert processor.calls == 0
+        assert result.variant_url("embed") == result.url
+
+    @pytest.mark.asyncio
+    async def test_unprocessable_attachment_is_not_read(
+        self, image_storage, mock_r2_client, cdn
+    ):
+        gif = b"GIF89a" + b"\x00" * 50
+        attachment = _FakeAttachment(gif, "dance.gif")
+        cdn.return_value = _chunks(gif, 16)
+
+        result = await image_storage.upload_attachment_portrait(
+            attachment, processor=_FakeProcessor()
+        )
+
+        assert attachment.reads == 0
+        assert result.content_type == "image/gif"
+
+    @pytest.mark.asyncio
+    async def test_variant_reads_share_the_stream_slots(
+        self, image_storage, mock_r2_client, cdn
+    ):
+        image_storage._stream_slots = asyncio.Semaphore(1)
+        in_memory = 0
+        peak = 0
+
+        class SlowProcessor(_FakeProcessor):
+            async def process(self, image_bytes):
+                nonlocal in_memory, peak
+                in_memory += 1
+                peak = max(peak, in_memory)
+                await asyncio.sleep(0.01)
+                in_memory -= 1
+                return await super().process(image_bytes)
+
+        cdn.side_effect = lambda url: _chunks(self.PNG, 16)
+        processor = SlowProcessor()
+
+        await asyncio.gather(
+            *(
+                image_storage.upload_attachment_portrait(
+                    _FakeAttachment(self.PNG, f"hero{i}.png"), processor=processor
+                )
+                for i in range(3)
+            )
+        )
+
+        assert processor.calls == 3
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_fallback_returns_embed_variant(
+        self, image_storage, mock_r2_client, cdn
+    ):
+        attachment = _FakeAttachment(self.PNG)
+        cdn.return_value = _chunks(self.PNG, 16)
+
+        with patch(
+            "services.image_storage.get_image_processor",
+            return_value=_FakeProcessor(),
+        ):
+            url = await image_storage.upload_attachment_with_fallback(attachment)
+
+        assert url.endswith("_embed.webp")
+
+    @pytest.mark.asyncio
+    async def test_unexpected_processing_error_keeps_original(
+        self, image_storage, mock_r2_client, cdn
+    ):
+        class BrokenPoolProcessor(_FakeProcessor):
+            async def process(self, image_bytes):
+                raise BrokenProcessPool("worker died")
+
+        attachment = _FakeAttachment(self.PNG)
+        cdn.return_value = _chunks(self.PNG, 16)
+
+        with patch(
+            "services.image_storage.get_image_processor",
+            return_value=BrokenPoolProcessor(),
+        ):
+            url = await image_storage.upload_attachment_with_fallback(attachment)
+
+        # The original is already in R2, so it is served instead of the default
+        assert url != settings.DEFAULT_PORTRAIT_URL
+        assert url == f"{image_storage.public_url}/" + (
+            mock_r2_client.put_object.call_args.kwargs["Key"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_fallback_on_oversized_attachment(
+        self, image_storage, mock_r2_client, cdn
+    ):
+        attachment = _FakeAttachment(self.PNG, size=image_storage.MAX_SIZE_BYTES + 1)
+
+        url = await image_storage.upload_attachment_with_fallback(attachment)
+
+        assert url == settings.DEFAULT_PORTRAIT_URL
+        cdn.assert_not_called()
+        assert attachment.reads == 0
+
+
 # TODO: Add integration tests with real R2 bucket (separate test suite)
 # TODO: Add tests for delete() method
 # TODO: Add tests for get_metadata() method
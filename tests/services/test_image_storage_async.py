@@ -0,0 +1,137 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the native async R2/S3 image storage backend
+
+Test coverage for services/image_storage.py (AsyncImageStorage):
+- Upload, metadata and delete round trip against a local S3 stand-in (moto)
+- Error mapping shared with the boto3 backend
+- One pooled client reused across calls
+- Streaming multipart uploads
+"""
+
+import pytest
+
+pytest.importorskip("aiobotocore")
+moto_server = pytest.importorskip("moto.server")
+
+import boto3  # noqa: E402
+
+from services.image_storage import (  # noqa: E402
+    AsyncImageStorage,
+    BucketNotFoundError,
+)
+
+TEST_PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01"
+    b"\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89"
+)
+
+
+@pytest.fixture(scope="module")
+def s3_endpoint():
+    """Local S3-compatible server with a test bucket."""
+    server = moto_server.ThreadedMotoServer(ip_address="127.0.0.1", port=0)
+    server.start()
+    host, port = server.get_host_and_port()
+    endpoint = f"http://{host}:{port}"
+    boto3.client(
+        "s3",
+        endpoint_url=endpoint,
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+        region_name="us-east-1",
+    ).create_bucket(Bucket="test-bucket")
+    yield endpoint
+    server.stop()
+
+
+def _storage(endpoint, bucket="test-bucket"):
+    return AsyncImageStorage(
+        account_id="test_account",
+        access_key_id="test",
+        secret_access_key="test",
+        bucket_name=bucket,
+        public_url="https://test.r2.dev",
+        endpoint_url=endpoint,
+    )
+
+
+class TestAsyncImageStorage:
+    """Test the aiobotocore backend end to end."""
+
+    @pytest.mark.asyncio
+    async def test_upload_metadata_delete_round_trip(self, s3_endpoint):
+        storage = _storage(s3_endpoint)
+        try:
+            result = await storage.upload(
+                TEST_PNG, "thorgar.png", metadata={"context": "portraits"}
+            )
+            assert result.url == f"https://test.r2.dev/{result.key}"
+            assert result.key.startswith("portraits/")
+
+            meta = await storage.get_metadata(result.key)
+            assert meta["size"] == len(TEST_PNG)
+            assert meta["content_type"] == "image/png"
+            assert meta["metadata"]["context"] == "portraits"
+
+            assert await storage.delete(result.key) is True
+            assert await storage.get_metadata(result.key) is None
+        finally:
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_bucket_maps_to_bucket_not_found(self, s3_endpoint):
+        storage = _storage(s3_endpoint, bucket="no-such-bucket")
+        try:
+            with pytest.raises(BucketNotFoundError):
+                await storage.upload(TEST_PNG, "lost.png")
+        finally:
+            await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_client_is_created_once_and_reused(self, s3_endpoint):
+        storage = _storage(s3_endpoint)
+        try:
+            assert storage.s3_client is None  # Nothing built at construction
+            first = await storage._get_client()
+            await storage.upload(TEST_PNG, "a.png")
+            await storage.upload(TEST_PNG, "b.png")
+            assert await storage._get_client() is first
+        finally:
+            await storage.close()
+        assert storage._client is None
+
+    @pytest.mark.asyncio
+    async def test_streaming_multipart_upload(self, s3_endpoint):
+        """A 10 MiB stream goes up as two parts and reads back intact."""
+        data = TEST_PNG + bytes(10 * 1024 * 1024)
+
+        async def chunks():
+            for i in range(0, len(data), 256 * 1024):
+                yield data[i : i + 256 * 1024]
+
+        storage = _storage(s3_endpoint)
+        try:
+            result = await storage.upload_stream(chunks(), "huge.png")
+            meta = await storage.get_metadata(result.key)
+        finally:
+            await storage.close()
+
+        assert result.size == len(data)
+        assert meta["size"] == len(data)
+        assert meta["content_type"] == "image/png"
@@ -0,0 +1,223 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the MCP workflow outbox
+
+Test coverage for services/mcp_outbox.py:
+- Entries commit (or roll back) with the character change
+- Batched delivery deletes delivered entries
+- Failed deliveries are rescheduled, then dropped after max attempts
+- Unexpected client errors reschedule only their own entry
+- Leased entries are hidden from concurrent rounds
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from db.repositories import MCPOutboxRepository
+from integrations.mcp_client import MCPConnectionError
+from models import pydantic_models
+from schemas.db_schemas import (
+    CharacterClassEnum,
+    CharacterRaceEnum,
+    CharacterRoleEnum,
+    MCPOutboxEntry,
+)
+from services.mcp_outbox import PORTRAIT_GENERATION_ENDPOINT, OutboxDispatcher
+from services.unit_of_work import UnitOfWork
+
+
+class FakeMCPClient:
+    def __init__(self, fail_endpoints=(), errors=None):
+        self.fail_endpoints = set(fail_endpoints)
+        self.errors = errors or {}
+        self.sent = []
+
+    async def send_workflow(self, endpoint, payload):
+        if endpoint in self.fail_endpoints:
+            raise MCPConnectionError("Failed to connect to MCP server")
+        if endpoint in self.errors:
+            raise self.errors[endpoint]
+        self.sent.append((endpoint, payload))
+        return {"workflow_id": f"wf_{len(self.sent)}"}
+
+
+@pytest_asyncio.fixture
+async def session_maker(initialized_test_db_engine):
+    maker = sessionmaker(
+        initialized_test_db_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with maker() as session:
+        await session.execute(delete(MCPOutboxEntry))
+        await session.commit()
+    return maker
+
+
+async def _entries(session_maker):
+    async with session_maker() as session:
+        result = await session.execute(select(MCPOutboxEntry))
+        return result.scalars().all()
+
+
+async def _enqueue(session_maker, *endpoints):
+    async with session_maker() as session:
+        repository = MCPOutboxRepository(session)
+        for endpoint in endpoints:
+            await repository.enqueue(endpoint, {"endpoint": endpoint})
+
+
+def _character(discord_user_id: int, name: str) -> pydantic_models.CharacterCreate:
+    return pydantic_models.CharacterCreate(
+        discord_user_id=discord_user_id,
+        discord_username=f"{name}User",
+        name=name,
+        race=CharacterRaceEnum.Gnome,
+        class_name=CharacterClassEnum.Mage,
+        roles=[CharacterRoleEnum.RangedDPS],
+        backstory="Wants a painted portrait.",
+        trait_1="Curious",
+        trait_2="Small",
+        trait_3="Loud",
+        request_sdxl=True,
+    )
+
+
+class TestOutboxTransaction:
+    @pytest.mark.asyncio
+    async def test_entry_commits_with_character(self, session_maker):
+        async with UnitOfWork(session_maker) as uow:
+            created = await uow.characters.create_character(
+                _character(868686868, "Outbox_Commit")  # Unique ID
+            )
+            await uow.outbox.enqueue_portrait_generation(created)
+
+        entries = await _entries(session_maker)
+        assert [e.endpoint for e in entries] == [PORTRAIT_GENERATION_ENDPOINT]
+        assert entries[0].payload["character_id"] == created.id
+        assert entries[0].payload["character"]["race"] == "Gnome"
+
+    @pytest.mark.asyncio
+    async def test_rollback_discards_entry(self, session_maker):
+        with pytest.raises(RuntimeError):
+            async with UnitOfWork(session_maker) as uow:
+                created = await uow.characters.create_character(
+                    _character(858585858, "Outbox_Rollback")  # Unique ID
+                )
+                await uow.outbox.enqueue_portrait_generation(created)
+                raise RuntimeError("registration failed")
+
+        assert await _entries(session_maker) == []
+
+
+class TestOutboxDispatcher:
+    @pytest.mark.asyncio
+    async def test_batch_delivered_and_deleted(self, session_maker):
+        await _enqueue(session_maker, "/webhooks/a", "/webhooks/b", "/webhooks/c")
+        client = FakeMCPClient()
+        dispatcher = OutboxDispatcher(
+            client=client, batch_size=2, session_maker=session_maker
+        )
+
+        assert await dispatcher.dispatch_once() == 2
+        assert await dispatcher.dispatch_once() == 1
+        assert await dispatcher.dispatch_once() == 0
+
+        assert [endpoint for endpoint, _ in client.sent] == [
+            "/webhooks/a",
+            "/webhooks/b",
+            "/webhooks/c",
+        ]
+        assert await _entries(session_maker) == []
+
+    @pytest.mark.asyncio
+    async def test_failure_rescheduled_with_backoff(self, session_maker):
+        await _enqueue(session_maker, "/webhooks/down", "/webhooks/up")
+        client = FakeMCPClient(fail_endpoints={"/webhooks/down"})
+        dispatcher = OutboxDispatcher(client=client, session_maker=session_maker)
+
+        assert await dispatcher.dispatch_once() == 1
+
+        (entry,) = await _entries(session_maker)
+        assert entry.endpoint == "/webhooks/down"
+        assert entry.attempts == 1
+        assert "Failed to connect" in entry.last_error
+        # Backing off: not due again yet
+        assert await dispatcher.dispatch_once() == 0
+        assert len(client.sent) == 1
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_reschedules_only_its_entry(self, session_maker):
+        await _enqueue(session_maker, "/webhooks/garbled", "/webhooks/up")
+        client = FakeMCPClient(
+            errors={"/webhooks/garbled": ValueError("Expecting value: line 1")}
+        )
+        dispatcher = OutboxDispatcher(client=client, session_maker=session_maker)
+
+        assert await dispatcher.dispatch_once() == 1
+
+        (entry,) = await _entries(session_maker)
+        assert entry.endpoint == "/webhooks/garbled"
+        assert entry.attempts == 1
+        assert "Expecting value" in entry.last_error
+        assert [endpoint for endpoint, _ in client.sent] == ["/webhooks/up"]
+
+    @pytest.mark.asyncio
+    async def test_deliver_never_raises(self):
+        dispatcher = OutboxDispatcher(
+            client=FakeMCPClient(errors={"/webhooks/x": KeyError("workflow_id")})
+        )
+        entry = MCPOutboxEntry(endpoint="/webhooks/x", payload={})
+
+        assert await dispatcher._deliver(entry) == "'workflow_id'"
+
+    @pytest.mark.asyncio
+    async def test_dropped_after_max_attempts(self, session_maker):
+        await _enqueue(session_maker, "/webhooks/down")
+        dispatcher = OutboxDispatcher(
+            client=FakeMCPClient(fail_endpoints={"/webhooks/down"}),
+            max_attempts=2,
+            retry_backoff=0,
+            session_maker=session_maker,
+        )
+
+        await dispatcher.dispatch_once()
+        assert len(await _entries(session_maker)) == 1
+        await dispatcher.dispatch_once()
+        assert await _entries(session_maker) == []
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_redelivered(self, session_maker):
+        """A dispatcher that died mid-delivery doesn't lose the entry."""
+        await _enqueue(session_maker, "/webhooks/a")
+        async with session_maker() as session:
+            claimed = await MCPOutboxRepository(session).claim_batch(10, 60)
+            assert len(claimed) == 1
+            # Leased: a second round sees nothing
+            assert await MCPOutboxRepository(session).claim_batch(10, 60) == []
+            await session.execute(
+                update(MCPOutboxEntry).values(available_at=MCPOutboxEntry.created_at)
+            )
+            await session.commit()
+
+        client = FakeMCPClient()
+        dispatcher = OutboxDispatcher(client=client, session_maker=session_maker)
+
+        assert await dispatcher.dispatch_once() == 1
+        assert client.sent == [("/webhooks/a", {"endpoint": "/webhooks/a"})]
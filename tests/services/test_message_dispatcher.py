@@ -0,0 +1,146 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for routing flow replies by (channel_id, author_id)
+
+Test coverage for services/message_dispatcher.py:
+- Delivery to the matching waiter only
+- Extra check predicates (e.g. attachments required)
+- Timeouts cleaning up their waiter
+- Dispatch cost with many active flows (-m benchmark)
+- InteractiveFlow using the dispatcher when installed
+"""
+
+import asyncio
+import time
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from flows.base_flow import InteractiveFlow
+from services.message_dispatcher import MessageDispatcher
+
+
+def _message(channel_id, author_id, attachments=()):
+    return SimpleNamespace(
+        channel=SimpleNamespace(id=channel_id),
+        author=SimpleNamespace(id=author_id),
+        attachments=list(attachments),
+    )
+
+
+class TestMessageDispatcher:
+    """Test the O(1) message router."""
+
+    @pytest.mark.asyncio
+    async def test_routes_to_matching_waiter(self):
+        dispatcher = MessageDispatcher()
+        waiting = asyncio.create_task(dispatcher.wait_for_message(10, 1, timeout=1))
+        await asyncio.sleep(0)
+
+        assert dispatcher.dispatch(_message(10, 2)) is False  # Other author
+        assert dispatcher.dispatch(_message(11, 1)) is False  # Other channel
+        reply = _message(10, 1)
+        assert dispatcher.dispatch(reply) is True
+
+        assert await waiting is reply
+        assert len(dispatcher) == 0
+
+    @pytest.mark.asyncio
+    async def test_check_filters_messages(self):
+        dispatcher = MessageDispatcher()
+        waiting = asyncio.create_task(
+            dispatcher.wait_for_message(
+                10, 1, timeout=1, check=lambda m: bool(m.attachments)
+            )
+        )
+        await asyncio.sleep(0)
+
+        assert dispatcher.dispatch(_message(10, 1)) is False
+        upload = _message(10, 1, attachments=["portrait.png"])
+        assert dispatcher.dispatch(upload) is True
+        assert await waiting is upload
+
+    @pytest.mark.asyncio
+    async def test_timeout_removes_waiter(self):
+        dispatcher = MessageDispatcher()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await dispatcher.wait_for_message(10, 1, timeout=0.01)
+
+        assert len(dispatcher) == 0
+        assert dispatcher.dispatch(_message(10, 1)) is False
+
+    @pytest.mark.asyncio
+    async def test_unrelated_messages_leave_waiters_pending(self):
+        dispatcher = MessageDispatcher()
+        waiters = [
+            asyncio.create_task(dispatcher.wait_for_message(10, user_id, timeout=5))
+            for user_id in range(20)
+        ]
+        await asyncio.sleep(0)
+
+        assert not any(dispatcher.dispatch(_message(99, i)) for i in range(200))
+        await asyncio.sleep(0)
+        assert not any(task.done() for task in waiters)
+        assert len(dispatcher) == 20
+        for task in waiters:
+            task.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    @pytest.mark.benchmark
+    async def test_dispatch_cost_independent_of_active_flows(self):
+        """Unrelated messages cost one dict miss, however many flows wait."""
+        dispatcher = MessageDispatcher()
+        waiters = [
+            asyncio.create_task(dispatcher.wait_for_message(10, user_id, timeout=5))
+            for user_id in range(2_000)
+        ]
+        await asyncio.sleep(0)
+
+        start = time.perf_counter()
+        for i in range(20_000):
+            dispatcher.dispatch(_message(99, i))
+        elapsed = time.perf_counter() - start
+
+        for task in waiters:
+            task.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        assert (
+            elapsed < 1.0
+        ), f"dispatch: {elapsed * 1000:.2f}ms for 20,000 messages, 2,000 flows"
+
+
+class TestInteractiveFlowDispatch:
+    """Test flows waiting through the dispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_flow_uses_installed_dispatcher(self, mock_interaction):
+        mock_interaction.channel_id = 555
+        mock_interaction.client.message_dispatcher = MessageDispatcher()
+        mock_interaction.client.wait_for = AsyncMock()
+        flow = InteractiveFlow(mock_interaction)
+
+        waiting = asyncio.create_task(flow.wait_for_message(timeout=1))
+        await asyncio.sleep(0)
+        reply = _message(555, mock_interaction.user.id)
+        mock_interaction.client.message_dispatcher.dispatch(reply)
+
+        assert await waiting is reply
+        mock_interaction.client.wait_for.assert_not_called()
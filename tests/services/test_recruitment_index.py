@@ -0,0 +1,98 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the recruitment message/thread -> character ID index
+
+Test coverage for services/recruitment_index.py:
+- Registration and resolution of message/thread IDs
+- Forgetting characters once reviewed
+- Warming from a single pending-characters query
+- Officer view resolving clicks without a DB session
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from services.recruitment_index import RecruitmentIndex
+from views.officer_view import OfficerControlView
+
+
+@pytest.fixture
+def index():
+    return RecruitmentIndex()
+
+
+class TestRecruitmentIndex:
+    """Test the in-memory lookup map."""
+
+    def test_resolve_by_message_or_thread(self, index):
+        """Both the starter message ID and the thread ID resolve."""
+        index.register(7, 1001, 2002)
+
+        assert index.resolve(1001) == 7
+        assert index.resolve(2002) == 7
+        assert index.resolve(None, 2002) == 7
+        assert index.resolve(3003) is None
+
+    def test_forget_drops_all_ids(self, index):
+        """Reviewed characters no longer resolve."""
+        index.register(7, 1001, 2002)
+        index.register(8, 1002)
+
+        index.forget(7)
+
+        assert index.resolve(1001) is None
+        assert index.resolve(2002) is None
+        assert index.resolve(1002) == 8
+
+    @pytest.mark.asyncio
+    async def test_warm_uses_single_query(self, index):
+        """Warming loads every pending post through one service call."""
+        service = MagicMock()
+        service.get_pending_recruitment_refs = AsyncMock(
+            return_value=[(1, 111, 111), (2, 222, None)]
+        )
+        session_maker = MagicMock()
+
+        with patch(
+            "services.recruitment_index.get_engine_and_session_maker",
+            return_value=(None, session_maker),
+        ), patch("services.recruitment_index.CharacterService", return_value=service):
+            loaded = await index.warm()
+
+        assert loaded == 2
+        service.get_pending_recruitment_refs.assert_awaited_once()
+        assert index.resolve(222) == 2
+
+
+class TestOfficerViewLookup:
+    """Test officer buttons resolving their character from the index."""
+
+    @pytest.mark.asyncio
+    async def test_click_resolves_without_database(self, mock_interaction):
+        """A persistent view click on an indexed thread never opens a session."""
+        mock_interaction.channel.id = 4242
+        index = RecruitmentIndex()
+        index.register(99, 4242)
+        view = OfficerControlView(bot=MagicMock(), character_id=None)
+
+        with patch(
+            "views.officer_view.get_recruitment_index", return_value=index
+        ), patch("views.officer_view.get_engine_and_session_maker") as mock_engine:
+            character_id = await view._get_character_id_from_context(mock_interaction)
+
+        assert character_id == 99
+        mock_engine.assert_not_called()
@@ -0,0 +1,207 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for registration draft persistence
+
+Test coverage for services/registration_drafts.py:
+- Debounced saves coalescing into one upsert
+- Loading a draft back after a "restart"
+- Discarding and purging expired drafts
+- Discard ordered after an upsert already in flight
+- Per-user locks released once unused
+- RegistrationFlow restoring answers from a draft
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from db.repositories import RegistrationDraftRepository
+from schemas.db_schemas import RegistrationDraft
+from services.registration_drafts import RegistrationDraftStore
+
+
+@pytest.fixture
+def session_maker(initialized_test_db_engine):
+    return sessionmaker(
+        initialized_test_db_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+
+@pytest.fixture
+def store(session_maker):
+    return RegistrationDraftStore(delay=0.05, session_maker=session_maker)
+
+
+class TestRegistrationDraftStore:
+    """Test the debounced draft writer."""
+
+    @pytest.mark.asyncio
+    async def test_rapid_saves_coalesce_into_one_upsert(self, store):
+        user_id = 818181818
+        with patch.object(
+            RegistrationDraftRepository,
+            "upsert_draft",
+            autospec=True,
+            side_effect=RegistrationDraftRepository.upsert_draft,
+        ) as upsert:
+            store.save(user_id, "name", {"answers": {"char_name": "Draftling"}})
+            store.save(user_id, "race", {"answers": {"race": "Gnome"}})
+            await asyncio.sleep(0.2)
+
+        assert upsert.await_count == 1
+        draft = await store.load(user_id)
+        assert draft.step == "race"
+        assert draft.data == {"answers": {"race": "Gnome"}}
+        await store.discard(user_id)
+
+    @pytest.mark.asyncio
+    async def test_draft_survives_a_new_store(self, store, session_maker):
+        """A fresh store (new process) sees what the old one flushed."""
+        user_id = 828282828
+        store.save(user_id, "backstory", {"completed": ["name", "backstory"]})
+        await store.flush()
+
+        restarted = RegistrationDraftStore(session_maker=session_maker)
+        draft = await restarted.load(user_id)
+        assert draft.data["completed"] == ["name", "backstory"]
+
+        await restarted.discard(user_id)
+        assert await restarted.load(user_id) is None
+
+    @pytest.mark.asyncio
+    async def test_expired_drafts_are_hidden_and_purged(self, store, session_maker):
+        user_id = 838383838
+        store.save(user_id, "name", {"completed": ["name"]})
+        await store.flush()
+
+        async with session_maker() as session:
+            await session.execute(
+                update(RegistrationDraft)
+                .where(RegistrationDraft.discord_user_id == user_id)
+                .values(updated_at=datetime.now(timezone.utc) - timedelta(days=30))
+            )
+            await session.commit()
+
+        assert await store.load(user_id) is None
+        assert await store.purge_expired() >= 1
+        async with session_maker() as session:
+            assert await RegistrationDraftRepository(session).get_draft(user_id) is None
+
+    @pytest.mark.asyncio
+    async def test_discard_waits_for_in_flight_upsert(self):
+        """A draft being written when the flow finishes must not outlive the delete."""
+        user_id = 838383839
+        calls = []
+        upsert_started = asyncio.Event()
+        release_upsert = asyncio.Event()
+
+        async def slow_upsert(repo, discord_user_id, step, data):
+            calls.append("upsert")
+            upsert_started.set()
+            await release_upsert.wait()
+
+        async def delete(repo, discord_user_id):
+            calls.append("delete")
+
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock()
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+        store = RegistrationDraftStore(
+            delay=0, session_maker=MagicMock(return_value=session_cm)
+        )
+
+        with patch.object(
+            RegistrationDraftRepository, "upsert_draft", autospec=True
+        ) as upsert, patch.object(
+            RegistrationDraftRepository, "delete_draft", autospec=True
+        ) as delete_draft:
+            upsert.side_effect = slow_upsert
+            delete_draft.side_effect = delete
+
+            store.save(user_id, "portrait", {"answers": {"char_name": "Late"}})
+            await upsert_started.wait()
+            discard = asyncio.create_task(store.discard(user_id))
+            await asyncio.sleep(0.01)
+            assert calls == ["upsert"]  # Delete is held back behind the upsert
+
+            release_upsert.set()
+            await discard
+
+        assert calls == ["upsert", "delete"]
+        # Nobody holds or waits for the user's lock anymore, so it is gone
+        assert len(store._locks) == 0
+
+    @pytest.mark.asyncio
+    async def test_locks_do_not_outlive_their_writes(self):
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock()
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+        store = RegistrationDraftStore(
+            delay=60, session_maker=MagicMock(return_value=session_cm)
+        )
+
+        with patch.object(
+            RegistrationDraftRepository, "upsert_draft", autospec=True
+        ), patch.object(RegistrationDraftRepository, "delete_draft", autospec=True):
+            for user_id in range(828282820, 828282830):
+                store.save(user_id, "name", {"answers": {"char_name": "Brief"}})
+            await store.flush()
+            await store.discard(828282820)
+
+        assert len(store._locks) == 0
+
+
+class TestRegistrationFlowResume:
+    """Test the flow restoring answers from a draft."""
+
+    @pytest.mark.asyncio
+    async def test_resume_restores_answers(self, mock_interaction, store):
+        from flows.registration_flow import RegistrationFlow
+
+        mock_interaction.user.id = 848484848
+        store.save(
+            848484848,
+            "race",
+            {
+                "completed": ["name", "race"],
+                "answers": {"char_name": "Resumed", "race": "Dwarf"},
+            },
+        )
+        await store.flush()
+
+        flow = RegistrationFlow(mock_interaction)
+        mock_interaction.followup.send = AsyncMock()
+
+        async def click_resume(*args, view=None, **kwargs):
+            # First button is "Continue where I left off"
+            await view.children[0].callback(AsyncMock())
+
+        mock_interaction.followup.send.side_effect = click_resume
+
+        with patch("flows.registration_flow.get_draft_store", return_value=store):
+            completed = await flow.step_resume()
+
+        assert completed == ["name", "race"]
+        assert flow.data["char_name"] == "Resumed"
+        assert flow.data["race"] == "Dwarf"
+        await store.discard(848484848)
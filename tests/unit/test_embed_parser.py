@@ -15,8 +15,25 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import json
+import random
+import time
+from types import SimpleNamespace
 from unittest.mock import MagicMock
-from utils.embed_parser import serialize_embeds, parse_embed_json
+import discord
+import pytest
+from utils import embed_parser
+from utils.embed_parser import (
+    serialize_embeds,
+    parse_embed_json,
+    compute_embed_hash,
+    render_character_embed_dicts,
+    split_long_text,
+    stylize_name,
+    build_character_embeds,
+    pack_embeds,
+    EMBED_MAX_FIELDS,
+    MESSAGE_MAX_EMBED_CHARS,
+)
 
 
 class TestEmbedParser:
@@ -100,3 +117,214 @@ class TestEmbedParser:
 
         # Note: Full round-trip (parse back to Embed) requires discord.py
         # For unit testing, verifying serialize preserves data structure is sufficient
+
+
+def _make_character(**overrides):
+    fields = {
+        "name": "Thorgar",
+        "race": "Orc",
+        "class_name": "Warrior",
+        "roles": ["Tank"],
+        "professions": ["Mining"],
+        "backstory": "A battle-hardened veteran of the Second War.",
+        "personality": "Gruff but honorable",
+        "quotes": "Lok'tar! | Blood and thunder!",
+        "portrait_url": "https://example.com/thorgar.png",
+        "trait_1": "Scarred",
+        "trait_2": "Loyal",
+        "trait_3": "Stubborn",
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class TestCharacterEmbedCache:
+    """
+    Tests for the content-hash keyed character sheet render cache.
+    """
+
+    def setup_method(self):
+        embed_parser._embed_render_cache.clear()
+
+    def test_hash_ignores_non_display_fields(self):
+        """Status and message IDs do not change the render hash."""
+        base = _make_character()
+        other = _make_character(status="REGISTERED", recruitment_msg_id=42)
+
+        assert compute_embed_hash(base) == compute_embed_hash(other)
+
+    def test_hash_changes_with_display_fields(self):
+        """Editing anything shown on the sheet produces a new hash."""
+        base = _make_character()
+        edited = _make_character(backstory="A different tale.")
+
+        assert compute_embed_hash(base) != compute_embed_hash(edited)
+
+    def test_unchanged_character_reuses_render(self, monkeypatch):
+        """A second render of the same character is served from the cache."""
+        character = _make_character()
+        first = render_character_embed_dicts(character)
+
+        def fail(_):
+            raise AssertionError("character sheet was rendered twice")
+
+        monkeypatch.setattr(embed_parser, "_render_character_embeds", fail)
+        second = render_character_embed_dicts(character)
+
+        assert first == second
+        assert first[0]["footer"]["text"] == "Azeroth Bound • Character Registry"
+
+    def test_cached_dicts_are_not_shared(self):
+        """Mutating a returned render must not leak into the cache."""
+        character = _make_character()
+        first = render_character_embed_dicts(character)
+        first[0]["fields"].append({"name": "x", "value": "y", "inline": False})
+
+        second = render_character_embed_dicts(character)
+        assert len(second[0]["fields"]) == len(first[0]["fields"]) - 1
+
+
+_SENTENCES = [
+    "Born in the shadow of Blackrock Mountain, {name} learned early that fire forgives nothing.",
+    "The caravans of Lakeshire still whisper of the night the bridge fell!",
+    "Was it duty or vengeance that carried {name} north to the Alterac foothills?",
+    "Years among the Wildhammer taught patience, a steady hand, and a distrust of nobles.",
+    "\nWhen the Scourge crossed the Thandol Span, the old oaths were tested once more.",
+    "Now {name} travels with the guild, seeking a tale worth ending well.",
+]
+
+
+def _legacy_split_long_text(text, max_length=1024):
+    """The original slice-and-rfind splitter, kept as a reference implementation."""
+    if not text:
+        return []
+    if len(text) <= max_length:
+        return [text]
+    chunks = []
+    remaining = text
+    while remaining:
+        if len(remaining) <= max_length:
+            chunks.append(remaining)
+            break
+        split_pos = max_length
+        for delim in [". ", "! ", "? ", "\n"]:
+            last_delim = remaining[:max_length].rfind(delim)
+            if last_delim > max_length * 0.7:
+                split_pos = last_delim + len(delim)
+                break
+        chunks.append(remaining[:split_pos].rstrip())
+        remaining = remaining[split_pos:].lstrip()
+    return chunks
+
+
+def _backstory_corpus(size=200, length=4000):
+    rng = random.Random(1337)
+    corpus = []
+    for i in range(size):
+        name = f"Hero{i}"
+        parts = []
+        while sum(len(p) for p in parts) < length:
+            parts.append(rng.choice(_SENTENCES).format(name=name) + " ")
+        corpus.append("".join(parts)[:length])
+    return corpus
+
+
+class TestEmbedParserPerformance:
+    """
+    Benchmarks for backstory splitting and name stylization.
+
+    Timed tests are marked `benchmark` and only run with `pytest -m benchmark`.
+    """
+
+    def test_split_long_text_matches_legacy(self):
+        """The single-pass chunker produces exactly the legacy chunks."""
+        for backstory in _backstory_corpus(size=50):
+            for max_length in (256, 1024):
+                assert split_long_text(backstory, max_length) == (
+                    _legacy_split_long_text(backstory, max_length)
+                )
+
+    def test_stylize_name_uses_bold_letters(self):
+        assert stylize_name("Thorgar Bloodfist").startswith("𝐓𝐡𝐨𝐫𝐠𝐚𝐫 𝐁")
+
+    @pytest.mark.benchmark
+    def test_split_long_text_benchmark(self):
+        """Split a corpus of realistic 4,000-char backstories."""
+        corpus = _backstory_corpus()
+
+        start = time.perf_counter()
+        for backstory in corpus:
+            chunks = split_long_text(backstory)
+            assert all(len(c) <= 1024 for c in chunks)
+        elapsed = time.perf_counter() - start
+
+        legacy_start = time.perf_counter()
+        for backstory in corpus:
+            _legacy_split_long_text(backstory)
+        legacy_elapsed = time.perf_counter() - legacy_start
+
+        assert elapsed < 1.0, (
+            f"split_long_text: {elapsed * 1000:.2f}ms "
+            f"(legacy {legacy_elapsed * 1000:.2f}ms) for {len(corpus)} backstories"
+        )
+
+    @pytest.mark.benchmark
+    def test_stylize_name_benchmark(self):
+        """Stylize every character name once via the translate table."""
+        names = [f"Thorgar Bloodfist {i}" for i in range(10_000)]
+
+        start = time.perf_counter()
+        styled = [stylize_name(n) for n in names]
+        elapsed = time.perf_counter() - start
+
+        assert len(styled) == len(names)
+        assert (
+            elapsed < 1.0
+        ), f"stylize_name: {elapsed * 1000:.2f}ms for {len(names)} names"
+
+
+class TestPackEmbeds:
+    """
+    Tests for packing embeds into messages within Discord's limits.
+    """
+
+    def test_character_sheet_fits_one_message(self):
+        """A typical sheet (quick-ref, lore, quotes) posts as a single message."""
+        embeds = build_character_embeds(_make_character())
+
+        messages = pack_embeds(embeds)
+
+        assert len(messages) == 1
+        assert len(messages[0]) == len(embeds)
+
+    def test_splits_on_character_budget(self):
+        """Embeds are carried over once a message would pass 6000 chars."""
+        embeds = [discord.Embed(description="x" * 2500) for _ in range(5)]
+
+        messages = pack_embeds(embeds)
+
+        assert [len(m) for m in messages] == [2, 2, 1]
+        for message in messages:
+            assert sum(len(e) for e in message) <= MESSAGE_MAX_EMBED_CHARS
+
+    def test_splits_on_embed_count(self):
+        """No message carries more than 10 embeds."""
+        embeds = [discord.Embed(title=f"Embed {i}") for i in range(23)]
+
+        messages = pack_embeds(embeds)
+
+        assert [len(m) for m in messages] == [10, 10, 3]
+        assert [e.title for m in messages for e in m] == [e.title for e in embeds]
+
+    def test_oversized_embed_gets_continuations(self):
+        """An embed with more than 25 fields is split into continuation embeds."""
+        embed = discord.Embed(title="Roster", color=0xC69B6D)
+        for i in range(30):
+            embed.add_field(name=f"Field {i}", value="value", inline=False)
+
+        messages = pack_embeds([embed])
+
+        parts = messages[0]
+        assert [len(p.fields) for p in parts] == [EMBED_MAX_FIELDS, 5]
+        assert parts[0].title == "Roster"
+        assert parts[1].color == parts[0].color
@@ -0,0 +1,292 @@
+# Azeroth Bound Discord Bot
+# Copyright (C) 2025 [Paweł Kochanowicz - <github.com/pkochanowicz> ]
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the talent scraper
+
+Test coverage for scrape_talents.py (offline, no browser):
+- Parsing saved class pages into talent rows
+- Parity of the HTML parser backends (parse-time benchmark: -m benchmark)
+- Concurrent scraping bounded by the worker pool
+- Per-class checkpoints and resume
+- Incomplete pages and checkpoints are never resumed from
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+import scrape_talents
+from scrape_talents import (
+    PARSER_BACKENDS,
+    TALENT_NOTES,
+    expected_talent_count,
+    extract_raw_talents,
+    load_checkpoint,
+    parse_class_page,
+    save_checkpoint,
+    scrape_talents_concurrent,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+WARRIOR_HTML = (Path(__file__).parent / "fixtures" / "warrior_talents.html").read_text(
+    encoding="utf-8"
+)
+# Pages saved from earlier scraping sessions (redirect stub / empty render)
+SAVED_PAGES = [REPO_ROOT / "page.html", REPO_ROOT / "rendered_page.html"]
+
+requires_lxml = pytest.mark.skipif(
+    scrape_talents.lxml_html is None, reason="lxml is not installed"
+)
+
+
+def _large_page(copies: int = 150) -> str:
+    """A class page the size of a full Next.js render (fixture grid repeated)."""
+    head, rest = WARRIOR_HTML.split("<main>", 1)
+    grid, tail = rest.split("</main>", 1)
+    filler = '<div class="flex"><span class="text-sm">tooltip</span></div>\n' * 20
+    return head + "<main>" + (grid + filler) * copies + "</main>" + tail
+
+
+class TestParseClassPage:
+    def test_talent_rows_from_fixture(self):
+        talents = {t["name"]: t for t in parse_class_page(WARRIOR_HTML, "WARRIOR")}
+
+        strike = talents["Improved Heroic Strike"]
+        assert strike["id"] == "warrior_arms_improvedheroicstrike"
+        assert strike["tree"] == "ARMS"
+        assert (strike["tier"], strike["column"]) == (1, 1)
+        assert strike["max_rank"] == 3
+        assert strike["points_req"] == 0
+        assert strike["icon_url"] == (
+            "https://talent-builder.haaxor1689.dev/icons/ability_rogue_ambush.png"
+        )
+
+        mortal = talents["Mortal Strike"]
+        assert (mortal["tier"], mortal["column"]) == (7, 2)
+        assert mortal["points_req"] == 30
+        assert talents["Unbridled Wrath"]["tree"] == "FURY"
+        # Unknown talents fall back to the class name as their tree
+        assert talents["Secret Unlisted Talent"]["tree"] == "Warrior"
+
+    @pytest.mark.parametrize("path", SAVED_PAGES, ids=lambda p: p.name)
+    def test_saved_pages_without_talents(self, path):
+        assert parse_class_page(path.read_text(encoding="utf-8"), "MAGE") == []
+
+
+class TestParserBackends:
+    @requires_lxml
+    @pytest.mark.parametrize("path", SAVED_PAGES, ids=lambda p: p.name)
+    def test_backends_agree_on_saved_pages(self, path):
+        html = path.read_text(encoding="utf-8")
+        assert extract_raw_talents(html, "lxml") == extract_raw_talents(html, "bs4")
+
+    @requires_lxml
+    def test_backends_agree_on_fixture(self):
+        rows = extract_raw_talents(WARRIOR_HTML, "lxml")
+
+        assert len(rows) == 5
+        assert rows == extract_raw_talents(WARRIOR_HTML, "bs4")
+        assert parse_class_page(WARRIOR_HTML, "WARRIOR", "lxml") == (
+            parse_class_page(WARRIOR_HTML, "WARRIOR", "bs4")
+        )
+
+    @requires_lxml
+    def test_backends_agree_on_nested_markup(self):
+        html = (
+            '<div><button class="relative group" style="transform: '
+            'translate3d(160px, 243px, 0px);"><span><img src="/a.png"></span>'
+            '<img src="/b.png"></button><div class="tw-surfaceish">decoy</div>'
+            '<div class="hidden tw-surface"><div><h4 class="tw-color">'
+            "Blood <b>&amp;</b> Thunder</h4></div>"
+            '<p class="font-bold">Rank <span>0</span>/2</p>'
+            '<p class="whitespace-pre-wrap">  Line one\nline two  </p></div>'
+            '<button class="group"><img alt="no source"></button></div>'
+        )
+
+        rows = extract_raw_talents(html, "lxml")
+
+        assert rows == extract_raw_talents(html, "bs4")
+        assert rows == [
+            {
+                "name": "Blood & Thunder",
+                "icon": "/a.png",
+                "ranks": 2,
+                "description": "Line one\nline two",
+                "talentTree": None,
+                "row": 4,
+                "column": 3,
+                "prereqTalent": None,
+            }
+        ]
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            extract_raw_talents(WARRIOR_HTML, "regex")
+
+    @requires_lxml
+    @pytest.mark.parametrize("name", sorted(PARSER_BACKENDS))
+    def test_backends_find_every_talent_on_a_large_page(self, name):
+        pages = [_large_page()] + [p.read_text(encoding="utf-8") for p in SAVED_PAGES]
+
+        assert sum(len(PARSER_BACKENDS[name](page)) for page in pages) == 5 * 150
+
+    @requires_lxml
+    @pytest.mark.benchmark
+    def test_parse_time_benchmark(self):
+        """Parse a full-size page and the saved pages with every backend."""
+        pages = [_large_page()] + [p.read_text(encoding="utf-8") for p in SAVED_PAGES]
+
+        timings = {}
+        for name, backend in PARSER_BACKENDS.items():
+            start = time.perf_counter()
+            for page in pages:
+                backend(page)
+            timings[name] = time.perf_counter() - start
+
+        assert timings["lxml"] < timings["bs4"], (
+            f"talent page parse: lxml {timings['lxml'] * 1000:.2f}ms, "
+            f"bs4 {timings['bs4'] * 1000:.2f}ms for {len(pages)} pages"
+        )
+
+
+@pytest.fixture
+def complete_warrior(monkeypatch):
+    """Treats the 5-talent warrior fixture as a fully rendered page."""
+    monkeypatch.setattr(
+        scrape_talents,
+        "expected_talent_count",
+        lambda key: 5 if key == "WARRIOR" else expected_talent_count(key),
+    )
+
+
+class TestConcurrentScrape:
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("complete_warrior")
+    async def test_bounded_concurrency_and_order(self, tmp_path):
+        active, peak = 0, 0
+
+        async def fetch(class_name):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return WARRIOR_HTML if class_name == "warrior" else "<html></html>"
+
+        talents, trees = await scrape_talents_concurrent(
+            concurrency=3, checkpoint_dir=str(tmp_path), fetch_html=fetch
+        )
+
+        assert peak == 3
+        assert [t["id"].split("_")[0] for t in talents] == ["warrior"] * 5
+        assert {t["class"] for t in trees} == set(TALENT_NOTES)
+        # Only classes that produced talents are checkpointed
+        assert [p.name for p in tmp_path.iterdir()] == ["warrior.json"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("complete_warrior")
+    async def test_resume_skips_checkpointed_classes(self, tmp_path):
+        saved = parse_class_page(WARRIOR_HTML, "WARRIOR")
+        save_checkpoint("WARRIOR", saved, str(tmp_path))
+        fetched = []
+
+        async def fetch(class_name):
+            fetched.append(class_name)
+            return "<html></html>"
+
+        talents, _ = await scrape_talents_concurrent(
+            checkpoint_dir=str(tmp_path), fetch_html=fetch
+        )
+
+        assert "warrior" not in fetched
+        assert len(fetched) == len(TALENT_NOTES) - 1
+        assert talents == saved
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("complete_warrior")
+    async def test_fresh_run_ignores_checkpoints(self, tmp_path):
+        save_checkpoint("WARRIOR", [], str(tmp_path))
+        fetched = []
+
+        async def fetch(class_name):
+            fetched.append(class_name)
+            return WARRIOR_HTML if class_name == "warrior" else "<html></html>"
+
+        await scrape_talents_concurrent(
+            checkpoint_dir=str(tmp_path), resume=False, fetch_html=fetch
+        )
+
+        assert "warrior" in fetched
+        assert len(load_checkpoint("WARRIOR", str(tmp_path))) == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_class_does_not_stop_the_rest(self, tmp_path):
+        async def fetch(class_name):
+            if class_name == "mage":
+                raise TimeoutError("selector never appeared")
+            return WARRIOR_HTML if class_name == "warrior" else "<html></html>"
+
+        talents, _ = await scrape_talents_concurrent(
+            checkpoint_dir=str(tmp_path), fetch_html=fetch
+        )
+
+        assert len(talents) == 5
+        assert load_checkpoint("MAGE", str(tmp_path)) is None
+
+    @pytest.mark.asyncio
+    async def test_partial_page_is_not_checkpointed(self, tmp_path):
+        async def fetch(class_name):
+            return WARRIOR_HTML if class_name == "warrior" else "<html></html>"
+
+        talents, _ = await scrape_talents_concurrent(
+            checkpoint_dir=str(tmp_path), fetch_html=fetch
+        )
+
+        # 5 of the 54 warrior talents rendered: returned, but refetched next run
+        assert len(talents) == 5
+        assert not list(tmp_path.iterdir())
+
+    def test_incomplete_checkpoint_is_ignored(self, tmp_path):
+        save_checkpoint("WARRIOR", [{"id": "warrior_x"}], str(tmp_path))
+
+        assert expected_talent_count("WARRIOR") == 54
+        assert load_checkpoint("WARRIOR", str(tmp_path)) is None
+
+    def test_checkpoint_without_expected_count_is_ignored(self, tmp_path):
+        (tmp_path / "warrior.json").write_text(
+            json.dumps({"class": "WARRIOR", "talents": [{"id": "warrior_x"}]}),
+            encoding="utf-8",
+        )
+
+        assert load_checkpoint("WARRIOR", str(tmp_path)) is None
+
+    def test_corrupt_checkpoint_is_ignored(self, tmp_path):
+        (tmp_path / "warrior.json").write_text("{not json", encoding="utf-8")
+
+        assert load_checkpoint("WARRIOR", str(tmp_path)) is None
+
+    def test_checkpoint_round_trip(self, tmp_path):
+        save_checkpoint("ROGUE", [{"id": "rogue_x"}], str(tmp_path), expected=1)
+
+        data = json.loads((tmp_path / "rogue.json").read_text(encoding="utf-8"))
+        assert data == {"class": "ROGUE", "expected": 1, "talents": [{"id": "rogue_x"}]}
+        assert load_checkpoint("ROGUE", str(tmp_path)) == [{"id": "rogue_x"}]
+        assert not list(tmp_path.glob("*.tmp"))
+        assert scrape_talents.CHECKPOINT_DIR.endswith("checkpoints")
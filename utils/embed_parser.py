@@ -1,12 +1,42 @@
 # utils/embed_parser.py
+from bisect import bisect_right
+import copy
+import hashlib
 import json
 import logging
-from typing import List, Any
+from typing import List, Any, Dict, Optional
 import discord
 from domain.game_data import get_class_emoji, get_class_color
+from utils.cache import BoundedCache
 
 logger = logging.getLogger(__name__)
 
+# Character attributes that influence the rendered character sheet.
+# Anything outside this list (status, message IDs, timestamps...) never
+# changes the embeds, so it is left out of the render hash.
+EMBED_DISPLAY_FIELDS = (
+    "name",
+    "race",
+    "class_name",
+    "roles",
+    "professions",
+    "backstory",
+    "personality",
+    "quotes",
+    "portrait_url",
+    "trait_1",
+    "trait_2",
+    "trait_3",
+)
+
+# Rendered sheets keyed by compute_embed_hash(); values are embed dicts.
+_embed_render_cache = BoundedCache(maxsize=256)
+
+# Discord embed limits (per embed / per message)
+EMBED_MAX_FIELDS = 25
+MESSAGE_MAX_EMBEDS = 10
+MESSAGE_MAX_EMBED_CHARS = 6000  # Summed over every embed in one message
+
 
 def serialize_embeds(embeds: List[discord.Embed]) -> str:
     """Serialize Discord Embed objects to JSON string."""
@@ -45,63 +75,17 @@ def create_simple_embed(
     return discord.Embed(title=title, description=description, color=color)
 
 
-def stylize_name(name: str) -> str:
-    # Unicode Mathematical Bold mapping
-    bold_map = {
-        "A": "𝐀",
-        "B": "𝐁",
-        "C": "𝐂",
-        "D": "𝐃",
-        "E": "𝐄",
-        "F": "𝐅",
-        "G": "𝐆",
-        "H": "𝐇",
-        "I": "𝐈",
-        "J": "𝐉",
-        "K": "𝐊",
-        "L": "𝐋",
-        "M": "𝐌",
-        "N": "𝐍",
-        "O": "𝐎",
-        "P": "𝐏",
-        "Q": "𝐐",
-        "R": "𝐑",
-        "S": "𝐒",
-        "T": "𝐓",
-        "U": "𝐔",
-        "V": "𝐕",
-        "W": "𝐖",
-        "X": "𝐗",
-        "Y": "𝐘",
-        "Z": "𝐙",
-        "a": "𝐚",
-        "b": "𝐛",
-        "c": "𝐜",
-        "d": "𝐝",
-        "e": "𝐞",
-        "f": "𝐟",
-        "g": "𝐠",
-        "h": "𝐡",
-        "i": "𝐢",
-        "j": "𝐣",
-        "k": "𝐤",
-        "l": "𝐥",
-        "m": "𝐦",
-        "n": "𝐧",
-        "o": "𝐨",
-        "p": "𝐩",
-        "q": "𝐪",
-        "r": "𝐫",
-        "s": "𝐬",
-        "t": "𝐭",
-        "u": "𝐮",
-        "v": "𝐯",
-        "w": "𝐰",
-        "x": "𝐱",
-        "y": "𝐲",
-        "z": "𝐳",
+# Unicode Mathematical Bold mapping (A-Z -> U+1D400.., a-z -> U+1D41A..)
+_BOLD_TRANSLATION = str.maketrans(
+    {
+        **{chr(ord("A") + i): chr(0x1D400 + i) for i in range(26)},
+        **{chr(ord("a") + i): chr(0x1D41A + i) for i in range(26)},
     }
-    return "".join(bold_map.get(c, c) for c in name)
+)
+
+
+def stylize_name(name: str) -> str:
+    return name.translate(_BOLD_TRANSLATION)
 
 
 def truncate_field(text: str, max_length: int = 1024) -> str:
@@ -112,6 +96,18 @@ def truncate_field(text: str, max_length: int = 1024) -> str:
     return text[: max_length - 3] + "..."
 
 
+_SPLIT_DELIMITERS = (". ", "! ", "? ", "\n")
+
+
+def _find_all(text: str, delim: str) -> List[int]:
+    positions = []
+    pos = text.find(delim)
+    while pos != -1:
+        positions.append(pos)
+        pos = text.find(delim, pos + len(delim))
+    return positions
+
+
 def split_long_text(text: str, max_length: int = 1024) -> List[str]:
     """Split text into chunks that fit in Discord embed fields."""
     if not text:
@@ -119,26 +115,34 @@ def split_long_text(text: str, max_length: int = 1024) -> List[str]:
     if len(text) <= max_length:
         return [text]
 
+    # Locate every sentence boundary once; each chunk then only needs a bisect
+    boundaries = [(delim, _find_all(text, delim)) for delim in _SPLIT_DELIMITERS]
+    min_split = max_length * 0.7  # Only split if we're at least 70% through
+
     chunks = []
-    remaining = text
+    start = 0
+    end = len(text)
 
-    while remaining:
-        if len(remaining) <= max_length:
-            chunks.append(remaining)
+    while start < end:
+        if end - start <= max_length:
+            chunks.append(text[start:])
             break
 
-        # Try to split at a sentence boundary (. ! ?)
+        # Try to split at a sentence boundary (. ! ?), in delimiter priority order
         split_pos = max_length
-        for delim in [". ", "! ", "? ", "\n"]:
-            last_delim = remaining[:max_length].rfind(delim)
-            if (
-                last_delim > max_length * 0.7
-            ):  # Only split if we're at least 70% through
-                split_pos = last_delim + len(delim)
-                break
-
-        chunks.append(remaining[:split_pos].rstrip())
-        remaining = remaining[split_pos:].lstrip()
+        for delim, positions in boundaries:
+            # Last delimiter fully inside text[start:start + max_length]
+            idx = bisect_right(positions, start + max_length - len(delim)) - 1
+            if idx >= 0 and positions[idx] >= start:
+                last_delim = positions[idx] - start
+                if last_delim > min_split:
+                    split_pos = last_delim + len(delim)
+                    break
+
+        chunks.append(text[start : start + split_pos].rstrip())
+        start += split_pos
+        while start < end and text[start].isspace():
+            start += 1
 
     return chunks
 
@@ -153,10 +157,53 @@ def split_quotes(quotes: str) -> List[str]:
     return quote_list[:3]
 
 
+def _display_value(value: Any) -> Any:
+    if hasattr(value, "value"):  # Enum
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return [_display_value(v) for v in value]
+    return value
+
+
+def compute_embed_hash(character: Any) -> str:
+    """
+    Hash the display fields of a character sheet.
+    Two characters with the same hash render to identical embeds.
+    """
+    payload = {
+        field: _display_value(getattr(character, field, None))
+        for field in EMBED_DISPLAY_FIELDS
+    }
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def render_character_embed_dicts(
+    character: Any, embed_hash: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Return the character sheet as serialized embed dicts (the embed_json format).
+    Results are cached by content hash, so unchanged characters skip rendering.
+    """
+    embed_hash = embed_hash or compute_embed_hash(character)
+    embed_dicts = _embed_render_cache.get(embed_hash)
+    if embed_dicts is None:
+        embed_dicts = [e.to_dict() for e in _render_character_embeds(character)]
+        _embed_render_cache.set(embed_hash, embed_dicts)
+    # Embed.from_dict keeps references to nested dicts, so never hand out the cached ones
+    return copy.deepcopy(embed_dicts)
+
+
 def build_character_embeds(character: Any) -> List[discord.Embed]:
     """
     Build character sheet. Accepts Pydantic model (CharacterCreate/InDB) or SQLAlchemy object.
     """
+    return [
+        discord.Embed.from_dict(d) for d in render_character_embed_dicts(character)
+    ]
+
+
+def _render_character_embeds(character: Any) -> List[discord.Embed]:
     embeds = []
 
     # Handle Class Name (Enum or String)
@@ -259,6 +306,57 @@ def build_character_embeds(character: Any) -> List[discord.Embed]:
     return embeds
 
 
+def _split_oversized_embed(embed: discord.Embed) -> List[discord.Embed]:
+    """Move fields that break the per-embed limits into continuation embeds."""
+    if (
+        len(embed.fields) <= EMBED_MAX_FIELDS
+        and len(embed) <= MESSAGE_MAX_EMBED_CHARS
+    ):
+        return [embed]
+
+    fields = [(f.name, f.value, f.inline) for f in embed.fields]
+    head = embed.copy()
+    head.clear_fields()
+    parts = [head]
+    current = head
+    for name, value, inline in fields:
+        field_len = len(name or "") + len(value or "")
+        if (
+            len(current.fields) >= EMBED_MAX_FIELDS
+            or len(current) + field_len > MESSAGE_MAX_EMBED_CHARS
+        ):
+            current = discord.Embed(color=embed.color)
+            parts.append(current)
+        current.add_field(name=name, value=value, inline=inline)
+    return parts
+
+
+def pack_embeds(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    """
+    Pack embeds into as few messages as Discord allows, keeping their order.
+    Each returned list can be sent as the `embeds=` of a single message.
+    """
+    messages: List[List[discord.Embed]] = []
+    current: List[discord.Embed] = []
+    current_chars = 0
+
+    for embed in embeds:
+        for part in _split_oversized_embed(embed):
+            part_chars = len(part)
+            if current and (
+                len(current) >= MESSAGE_MAX_EMBEDS
+                or current_chars + part_chars > MESSAGE_MAX_EMBED_CHARS
+            ):
+                messages.append(current)
+                current, current_chars = [], 0
+            current.append(part)
+            current_chars += part_chars
+
+    if current:
+        messages.append(current)
+    return messages
+
+
 def build_cemetery_embed(character_name: str, char_class: str) -> discord.Embed:
     embed = discord.Embed(
         title=f"⚰️ {stylize_name(character_name)}",
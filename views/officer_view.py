@@ -1,9 +1,15 @@
+import asyncio
+import re
+from typing import Optional
 import discord
-from discord.ui import View, Button
+from discord.ui import View, Button, DynamicItem
 from services.character_service import CharacterService
 from schemas.db_schemas import CharacterStatusEnum
 from config.settings import get_settings
 from db.database import get_engine_and_session_maker
+from models.pydantic_models import CharacterUpdate
+from services.recruitment_index import get_recruitment_index
+from utils.embed_parser import pack_embeds
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,9 +34,15 @@ class OfficerControlView(View):
     def __init__(self, bot, character_id: int = None):
         super().__init__(timeout=None)
         self.bot = bot
-        self.character_id = character_id  # Can be None for registered persistent views
+        self.character_id = character_id  # None only for legacy posts without IDs
         self.settings = get_settings()
 
+        # The character ID travels in each button's custom_id, so clicks after
+        # a restart are routed by the registered DynamicItem templates
+        self.add_item(OfficerApproveButton(character_id))
+        self.add_item(OfficerRejectButton(character_id))
+        self.add_item(OfficerRequestEditButton(character_id))
+
     async def _get_character_id_from_context(
         self, interaction: discord.Interaction
     ) -> int:
@@ -42,28 +54,29 @@ class OfficerControlView(View):
         if self.character_id:
             return self.character_id
 
-        # Otherwise, look it up from the recruitment thread/message
-        from db.database import get_engine_and_session_maker
-        from services.character_service import CharacterService
+        channel_id = interaction.channel.id if interaction.channel else None
+        message_id = interaction.message.id if interaction.message else None
+
+        # Recruitment posts are indexed at startup and when they are created
+        index = get_recruitment_index()
+        character_id = index.resolve(channel_id, message_id)
+        if character_id:
+            return character_id
 
+        # Otherwise, look it up from the recruitment thread/message
         _, session_maker = get_engine_and_session_maker()
         async with session_maker() as session:
             service = CharacterService(session)
 
             # Try to find character by recruitment_msg_id (which is the thread ID for forum posts)
-            if interaction.channel:
-                char = await service.get_character_by_recruitment_msg_id(
-                    interaction.channel.id
-                )
-                if char:
-                    return char.id
-
-            # Fallback: try interaction.message.id
-            if interaction.message:
-                char = await service.get_character_by_recruitment_msg_id(
-                    interaction.message.id
-                )
+            for discord_id in (channel_id, message_id):
+                if not discord_id:
+                    continue
+                char = await service.get_character_by_recruitment_msg_id(discord_id)
                 if char:
+                    index.register(
+                        char.id, char.recruitment_msg_id, char.forum_post_id
+                    )
                     return char.id
 
         raise ValueError("Could not determine character_id from interaction context")
@@ -83,12 +96,6 @@ class OfficerControlView(View):
             return False
         return True
 
-    @discord.ui.button(
-        label="Approve", style=discord.ButtonStyle.green, custom_id="officer_approve"
-    )
-    async def approve_button(self, interaction: discord.Interaction, button: Button):
-        await self.approve_logic(interaction)
-
     async def approve_logic(self, interaction: discord.Interaction):
         if not await self.check_permissions(interaction):
             return
@@ -106,111 +113,44 @@ class OfficerControlView(View):
             # Get character_id from context (supports persistent views after bot restart)
             character_id = await self._get_character_id_from_context(interaction)
 
+            # One UPDATE ... RETURNING; emits CharacterApproved
             _, session_maker = get_engine_and_session_maker()
             async with session_maker() as session:
                 service = CharacterService(session)
-
-                from models.pydantic_models import CharacterUpdate
-
-                char_update = CharacterUpdate(status=CharacterStatusEnum.REGISTERED)
-
-                updated_char = await service.update_character(character_id, char_update)
-                await session.commit()
-
-                if not updated_char:
-                    await interaction.followup.send(
-                        "❌ Character not found in DB.", ephemeral=True
-                    )
-                    return
-
-                logger.info(
-                    f"Character {updated_char.name} (ID: {character_id}) approved by {interaction.user.name}"
+                updated_char = await service.approve_character(
+                    character_id, interaction.user.id
                 )
 
-                vault_channel_id = self.settings.CHARACTER_SHEET_VAULT_CHANNEL_ID
-                vault_channel = self.bot.get_channel(
-                    vault_channel_id
-                ) or await self.bot.fetch_channel(vault_channel_id)
-
-                if not vault_channel:
-                    await interaction.followup.send(
-                        "❌ Vault channel not found.", ephemeral=True
-                    )
-                    return
-
-                # Collect ALL embeds from the recruitment thread, not just the starter message
-                all_embeds = []
-                if interaction.channel:
-                    # Fetch all messages in the thread to get all embeds
-                    async for message in interaction.channel.history(limit=100):
-                        if message.embeds:
-                            all_embeds.extend(message.embeds)
-                    # Reverse to get original order (history gives newest first)
-                    all_embeds.reverse()
-
-                # Fallback to starter message embeds if thread fetch fails
-                if not all_embeds and interaction.message:
-                    all_embeds = interaction.message.embeds
-
-                thread_name = (
-                    interaction.channel.name.replace("[PENDING]", "[REGISTERED]")
-                    if interaction.channel
-                    else f"Character {updated_char.name}"
-                )
-
-                # Post all embeds to vault - first embed in thread creation, rest as follow-up
-                if all_embeds:
-                    vault_thread_msg = await vault_channel.create_thread(
-                        name=thread_name,
-                        content=f"Approved by {interaction.user.mention}",
-                        embed=all_embeds[0] if len(all_embeds) > 0 else None,
-                    )
-                    # Post remaining embeds as follow-up messages
-                    if len(all_embeds) > 1:
-                        await vault_thread_msg.thread.send(embeds=all_embeds[1:])
-                else:
-                    vault_thread_msg = await vault_channel.create_thread(
-                        name=thread_name,
-                        content=f"Approved by {interaction.user.mention}",
-                    )
-
-                char_update_2 = CharacterUpdate(
-                    forum_post_id=vault_thread_msg.thread.id
-                )
-                await service.update_character(character_id, char_update_2)
-                await session.commit()
-
-                logger.info(
-                    f"Posted {len(all_embeds)} embeds to character-sheet-vault for {updated_char.name}"
+            if not updated_char:
+                await interaction.followup.send(
+                    "❌ Character not found in DB or already reviewed.", ephemeral=True
                 )
+                return
 
-                # Remove buttons from the recruitment message
-                if interaction.message:
-                    await interaction.message.edit(view=None)
-                    logger.info(
-                        f"Removed buttons from recruitment message for {updated_char.name}"
-                    )
+            logger.info(
+                f"Character {updated_char.name} (ID: {character_id}) approved by {interaction.user.name}"
+            )
 
-                # Lock and archive the recruitment thread
-                if interaction.channel:
-                    await interaction.channel.edit(
-                        locked=True,
-                        archived=True,
-                        name=f"[APPROVED] {updated_char.name}",
-                    )
-                    logger.info(
-                        f"Locked and archived recruitment thread for {updated_char.name}"
-                    )
+            # Read before the gather: closing the thread renames it in place
+            vault_thread_name = (
+                interaction.channel.name.replace("[PENDING]", "[REGISTERED]")
+                if interaction.channel
+                else f"Character {updated_char.name}"
+            )
 
-                try:
-                    user = self.bot.get_user(
-                        updated_char.discord_user_id
-                    ) or await self.bot.fetch_user(updated_char.discord_user_id)
-                    await user.send(
-                        f"🎉 Your character **{updated_char.name}** has been APPROVED! Welcome to Azeroth Bound.\nSheet: {vault_thread_msg.thread.jump_url}"
+            # Discord side effects are independent of each other, run them together
+            results = await asyncio.gather(
+                self._publish_to_vault(interaction, updated_char, vault_thread_name),
+                self._grant_member_role(interaction, updated_char),
+                self._close_recruitment_thread(interaction, updated_char),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"Approval side effect failed for {updated_char.name}: {result}",
+                        exc_info=result,
                     )
-                except Exception as e:
-                    logger.warning(f"Failed to DM user: {e}")
         except Exception as e:
             logger.error(f"Error in approve_logic: {e}", exc_info=True)
             try:
@@ -220,10 +160,114 @@ class OfficerControlView(View):
             except Exception:
                 logger.error("Failed to send error message to user")
 
-    @discord.ui.button(
-        label="Reject", style=discord.ButtonStyle.red, custom_id="officer_reject"
-    )
-    async def reject_button(self, interaction: discord.Interaction, button: Button):
+    async def _publish_to_vault(
+        self, interaction: discord.Interaction, character, thread_name: str
+    ):
+        """Copy the sheet to the vault, record the vault thread and DM the owner."""
+        vault_channel_id = self.settings.CHARACTER_SHEET_VAULT_CHANNEL_ID
+        vault_channel = self.bot.get_channel(
+            vault_channel_id
+        ) or await self.bot.fetch_channel(vault_channel_id)
+
+        if not vault_channel:
+            await interaction.followup.send(
+                "❌ Vault channel not found.", ephemeral=True
+            )
+            return
+
+        # Collect ALL embeds from the recruitment thread, not just the starter message
+        all_embeds = []
+        if interaction.channel:
+            # Fetch all messages in the thread to get all embeds
+            async for message in interaction.channel.history(limit=100):
+                if message.embeds:
+                    all_embeds.extend(message.embeds)
+            # Reverse to get original order (history gives newest first)
+            all_embeds.reverse()
+
+        # Fallback to starter message embeds if thread fetch fails
+        if not all_embeds and interaction.message:
+            all_embeds = interaction.message.embeds
+
+        # Post all embeds to vault, packed into as few messages as possible
+        packed = pack_embeds(list(all_embeds)) if all_embeds else []
+        if packed:
+            vault_thread_msg = await vault_channel.create_thread(
+                name=thread_name,
+                content=f"Approved by {interaction.user.mention}",
+                embeds=packed[0],
+            )
+            for batch in packed[1:]:
+                await vault_thread_msg.thread.send(embeds=batch)
+        else:
+            vault_thread_msg = await vault_channel.create_thread(
+                name=thread_name,
+                content=f"Approved by {interaction.user.mention}",
+            )
+
+        _, session_maker = get_engine_and_session_maker()
+        async with session_maker() as session:
+            service = CharacterService(session)
+            await service.update_character(
+                character.id,
+                CharacterUpdate(forum_post_id=vault_thread_msg.thread.id),
+            )
+
+        logger.info(
+            f"Posted {len(all_embeds)} embeds to character-sheet-vault for {character.name}"
+        )
+
+        try:
+            user = self.bot.get_user(
+                character.discord_user_id
+            ) or await self.bot.fetch_user(character.discord_user_id)
+            await user.send(
+                f"🎉 Your character **{character.name}** has been APPROVED! Welcome to Azeroth Bound.\nSheet: {vault_thread_msg.thread.jump_url}"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to DM user: {e}")
+
+    async def _grant_member_role(self, interaction: discord.Interaction, character):
+        """Give the applicant the guild's Seeker role, if one is configured."""
+        role_id = self.settings.SEEKER_ROLE_ID
+        if not role_id or not interaction.guild:
+            return
+
+        member = interaction.guild.get_member(
+            character.discord_user_id
+        ) or await interaction.guild.fetch_member(character.discord_user_id)
+        await member.add_roles(
+            discord.Object(id=role_id), reason=f"Character {character.name} approved"
+        )
+        logger.info(f"Granted role {role_id} to {member} for {character.name}")
+
+    async def _close_recruitment_thread(
+        self, interaction: discord.Interaction, character
+    ):
+        """Remove the buttons, then rename, retag, lock and archive the thread."""
+        # Remove buttons from the recruitment message
+        if interaction.message:
+            await interaction.message.edit(view=None)
+            logger.info(
+                f"Removed buttons from recruitment message for {character.name}"
+            )
+
+        # Lock and archive the recruitment thread
+        if interaction.channel:
+            edit_kwargs = {}
+            if self.settings.RECRUITMENT_APPROVED_TAG_ID:
+                edit_kwargs["applied_tags"] = [
+                    discord.Object(id=self.settings.RECRUITMENT_APPROVED_TAG_ID)
+                ]
+            await interaction.channel.edit(
+                locked=True,
+                archived=True,
+                name=f"[APPROVED] {character.name}",
+                **edit_kwargs,
+            )
+            logger.info(f"Locked and archived recruitment thread for {character.name}")
+
+    async def reject_prompt(self, interaction: discord.Interaction):
         if not await self.check_permissions(interaction):
             return
 
@@ -245,11 +289,8 @@ class OfficerControlView(View):
         async with session_maker() as session:
             service = CharacterService(session)
 
-            from models.pydantic_models import CharacterUpdate
-
             char_update = CharacterUpdate(status=CharacterStatusEnum.REJECTED)
             updated_char = await service.update_character(character_id, char_update)
-            await session.commit()
 
             if not updated_char:
                 return
@@ -257,6 +298,7 @@ class OfficerControlView(View):
             logger.info(
                 f"Character {updated_char.name} (ID: {character_id}) rejected by {interaction.user.name}. Reason: {reason}"
             )
+            get_recruitment_index().forget(character_id)
 
             # Remove buttons from the recruitment message
             if interaction.message:
@@ -284,14 +326,7 @@ class OfficerControlView(View):
             except Exception as e:
                 logger.warning(f"Failed to DM user: {e}")
 
-    @discord.ui.button(
-        label="Request Edit",
-        style=discord.ButtonStyle.secondary,
-        custom_id="officer_request_edit",
-    )
-    async def request_edit_button(
-        self, interaction: discord.Interaction, button: Button
-    ):
+    async def request_edit_prompt(self, interaction: discord.Interaction):
         if not await self.check_permissions(interaction):
             return
 
@@ -329,3 +364,93 @@ class OfficerControlView(View):
                     )
             except Exception as e:
                 logger.warning(f"Failed to DM user: {e}")
+
+
+def _officer_custom_id(action: str, character_id: Optional[int]) -> str:
+    return f"{action}:{character_id}" if character_id else action
+
+
+def _match_character_id(match: re.Match) -> Optional[int]:
+    # Posts created before IDs were encoded carry the bare action name
+    character_id = match["id"]
+    return int(character_id) if character_id else None
+
+
+class OfficerApproveButton(
+    DynamicItem[Button], template=r"officer_approve(?::(?P<id>[0-9]+))?"
+):
+    def __init__(self, character_id: Optional[int] = None):
+        super().__init__(
+            Button(
+                label="Approve",
+                style=discord.ButtonStyle.green,
+                custom_id=_officer_custom_id("officer_approve", character_id),
+            )
+        )
+        self.character_id = character_id
+
+    @classmethod
+    async def from_custom_id(
+        cls, interaction: discord.Interaction, item: Button, match: re.Match
+    ):
+        return cls(_match_character_id(match))
+
+    async def callback(self, interaction: discord.Interaction):
+        view = OfficerControlView(interaction.client, self.character_id)
+        await view.approve_logic(interaction)
+
+
+class OfficerRejectButton(
+    DynamicItem[Button], template=r"officer_reject(?::(?P<id>[0-9]+))?"
+):
+    def __init__(self, character_id: Optional[int] = None):
+        super().__init__(
+            Button(
+                label="Reject",
+                style=discord.ButtonStyle.red,
+                custom_id=_officer_custom_id("officer_reject", character_id),
+            )
+        )
+        self.character_id = character_id
+
+    @classmethod
+    async def from_custom_id(
+        cls, interaction: discord.Interaction, item: Button, match: re.Match
+    ):
+        return cls(_match_character_id(match))
+
+    async def callback(self, interaction: discord.Interaction):
+        view = OfficerControlView(interaction.client, self.character_id)
+        await view.reject_prompt(interaction)
+
+
+class OfficerRequestEditButton(
+    DynamicItem[Button], template=r"officer_request_edit(?::(?P<id>[0-9]+))?"
+):
+    def __init__(self, character_id: Optional[int] = None):
+        super().__init__(
+            Button(
+                label="Request Edit",
+                style=discord.ButtonStyle.secondary,
+                custom_id=_officer_custom_id("officer_request_edit", character_id),
+            )
+        )
+        self.character_id = character_id
+
+    @classmethod
+    async def from_custom_id(
+        cls, interaction: discord.Interaction, item: Button, match: re.Match
+    ):
+        return cls(_match_character_id(match))
+
+    async def callback(self, interaction: discord.Interaction):
+        view = OfficerControlView(interaction.client, self.character_id)
+        await view.request_edit_prompt(interaction)
+
+
+# Registered once on the bot; replaces the old dummy persistent view
+OFFICER_DYNAMIC_ITEMS = (
+    OfficerApproveButton,
+    OfficerRejectButton,
+    OfficerRequestEditButton,
+)